@@ -2,14 +2,95 @@ __version__ = "0.1.0"
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/TopLevel.ipynb.
 
 # %% auto 0
-__all__ = ['dummy']
+__all__ = ['EnsembleMonoDense', 'GroupedMonoDense', 'MonoDense', 'PiecewiseLinear', 'certify_monotonicity',
+           'check_gradient_signs', 'compile_feature_branches', 'create_type_1', 'create_type_2', 'export_numpy_bundle',
+           'export_quantized_tflite', 'export_saved_model', 'export_tflite', 'fold_input_normalization',
+           'freeze_monotone_model', 'get_trace_counts', 'quantization_report', 'reset_trace_counts',
+           'split_ensemble_outputs', 'unfreeze_monotone_model']
 
 # %% ../nbs/TopLevel.ipynb 1
-from mono_dense_keras._components.mono_dense_layer import (
-    MonoDense,
-    create_type_1,
-    create_type_2,
-)
+import sys
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+# public symbols are imported from their modules on first use, so importing the package or any of
+# its TensorFlow-free modules such as `mono_dense_keras.runtime` does not import TensorFlow
+_LAZY_IMPORTS = {
+    "PiecewiseLinear": "mono_dense_keras._components.lookup_tables",
+    "compile_feature_branches": "mono_dense_keras._components.lookup_tables",
+    "EnsembleMonoDense": "mono_dense_keras._components.mono_dense_layer",
+    "GroupedMonoDense": "mono_dense_keras._components.mono_dense_layer",
+    "MonoDense": "mono_dense_keras._components.mono_dense_layer",
+    "create_type_1": "mono_dense_keras._components.mono_dense_layer",
+    "create_type_2": "mono_dense_keras._components.mono_dense_layer",
+    "freeze_monotone_model": "mono_dense_keras._components.mono_dense_layer",
+    "get_trace_counts": "mono_dense_keras._components.mono_dense_layer",
+    "reset_trace_counts": "mono_dense_keras._components.mono_dense_layer",
+    "split_ensemble_outputs": "mono_dense_keras._components.mono_dense_layer",
+    "unfreeze_monotone_model": "mono_dense_keras._components.mono_dense_layer",
+    "certify_monotonicity": "mono_dense_keras._components.certification",
+    "check_gradient_signs": "mono_dense_keras._components.certification",
+    "export_numpy_bundle": "mono_dense_keras._components.export",
+    "fold_input_normalization": "mono_dense_keras._components.export",
+    "export_quantized_tflite": "mono_dense_keras._components.export",
+    "export_saved_model": "mono_dense_keras._components.export",
+    "export_tflite": "mono_dense_keras._components.export",
+    "quantization_report": "mono_dense_keras._components.export",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    # later lookups do not go through __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+def _import_all() -> None:
+    for name in _LAZY_IMPORTS:
+        __getattr__(name)
+
+
+# layers must be registered as Keras serializable objects before loading saved models, which
+# is done here if TensorFlow is already imported and there is nothing to be saved by waiting
+if "tensorflow" in sys.modules:
+    _import_all()
+
+if TYPE_CHECKING:
+    from mono_dense_keras._components.certification import (
+        certify_monotonicity,
+        check_gradient_signs,
+    )
+    from mono_dense_keras._components.export import (
+        export_numpy_bundle,
+        export_quantized_tflite,
+        export_saved_model,
+        export_tflite,
+        fold_input_normalization,
+        quantization_report,
+    )
+    from mono_dense_keras._components.lookup_tables import (
+        PiecewiseLinear,
+        compile_feature_branches,
+    )
+    from mono_dense_keras._components.mono_dense_layer import (
+        EnsembleMonoDense,
+        GroupedMonoDense,
+        MonoDense,
+        create_type_1,
+        create_type_2,
+        freeze_monotone_model,
+        get_trace_counts,
+        reset_trace_counts,
+        split_ensemble_outputs,
+        unfreeze_monotone_model,
+    )
 
 # %% ../nbs/TopLevel.ipynb 2
 def dummy() -> None:
@@ -19,8 +100,25 @@ def dummy() -> None:
 dummy.__module__ = "_dummy"
 
 # %% ../nbs/TopLevel.ipynb 3
-__all__ = [
+_all_ = [
+    "EnsembleMonoDense",
+    "GroupedMonoDense",
     "MonoDense",
+    "PiecewiseLinear",
+    "certify_monotonicity",
+    "check_gradient_signs",
+    "compile_feature_branches",
     "create_type_1",
     "create_type_2",
+    "export_numpy_bundle",
+    "export_quantized_tflite",
+    "export_saved_model",
+    "export_tflite",
+    "fold_input_normalization",
+    "freeze_monotone_model",
+    "get_trace_counts",
+    "quantization_report",
+    "reset_trace_counts",
+    "split_ensemble_outputs",
+    "unfreeze_monotone_model",
 ]
@@ -0,0 +1,401 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/Certification.ipynb.
+
+# %% auto 0
+__all__ = ['certify_monotonicity', 'check_gradient_signs']
+
+# %% ../../nbs/Certification.ipynb 3
+from typing import *
+
+import numpy as np
+import tensorflow as tf
+from numpy.typing import ArrayLike, NDArray
+from tensorflow.keras.layers import Activation, Dense, Dropout, InputLayer
+
+from mono_dense_keras._components.export import (
+    _TF_OP_ACTIVATIONS,
+    _get_activation_name,
+    _get_layer_graph,
+)
+from mono_dense_keras._components.mono_dense_layer import (
+    GroupedMonoDense,
+    MonoDense,
+    apply_monotonicity_indicator_to_kernel,
+)
+from ..helpers import export
+
+# %% ../../nbs/Certification.ipynb 7
+_CONSTANT, _INCREASING, _DECREASING = 0, 1, -1
+_AFFINE, _CONVEX, _CONCAVE = 0, 1, -1
+_UNKNOWN = 2
+
+
+def _propagate_linear(
+    monotonicity: NDArray, curvature: NDArray, kernel: NDArray
+) -> Tuple[NDArray, NDArray]:
+    positive = (kernel > 0).astype(np.int64)
+    negative = (kernel < 0).astype(np.int64)
+    nonzero = positive + negative
+
+    def _is(x: NDArray, value: int) -> NDArray:
+        return np.asarray(x == value, dtype=np.int64)
+
+    increasing = (
+        _is(monotonicity, _INCREASING) @ positive
+        + _is(monotonicity, _DECREASING) @ negative
+    ) > 0
+    decreasing = (
+        _is(monotonicity, _DECREASING) @ positive
+        + _is(monotonicity, _INCREASING) @ negative
+    ) > 0
+    unknown = (_is(monotonicity, _UNKNOWN) @ nonzero > 0) | (increasing & decreasing)
+    monotonicity = np.where(
+        unknown,
+        _UNKNOWN,
+        np.where(increasing, _INCREASING, np.where(decreasing, _DECREASING, _CONSTANT)),
+    )
+
+    convex = (
+        _is(curvature, _CONVEX) @ positive + _is(curvature, _CONCAVE) @ negative
+    ) > 0
+    concave = (
+        _is(curvature, _CONCAVE) @ positive + _is(curvature, _CONVEX) @ negative
+    ) > 0
+    unknown = (_is(curvature, _UNKNOWN) @ nonzero > 0) | (convex & concave)
+    curvature = np.where(
+        unknown,
+        _UNKNOWN,
+        np.where(convex, _CONVEX, np.where(concave, _CONCAVE, _AFFINE)),
+    )
+
+    return monotonicity, curvature
+
+# %% ../../nbs/Certification.ipynb 9
+_IDENTITY, _CONVEX_INCREASING, _CONCAVE_INCREASING, _INCREASING_ONLY = range(4)
+_OTHER = 4
+
+_ACTIVATION_TYPES = {
+    "linear": _IDENTITY,
+    "relu": _CONVEX_INCREASING,
+    "elu": _CONVEX_INCREASING,
+    "softplus": _CONVEX_INCREASING,
+    "exponential": _CONVEX_INCREASING,
+    "selu": _INCREASING_ONLY,
+    "sigmoid": _INCREASING_ONLY,
+    "hard_sigmoid": _INCREASING_ONLY,
+    "tanh": _INCREASING_ONLY,
+}
+
+
+def _get_activation_type(activation: Optional[Callable[[Any], Any]]) -> int:
+    if activation is None:
+        return _IDENTITY
+    try:
+        name = _get_activation_name(activation)
+    except ValueError:
+        return _OTHER
+    return _ACTIVATION_TYPES.get(name, _OTHER)
+
+
+def _get_mono_activation_types(
+    convex_activation: Callable[[Any], Any], activation_selector: Tuple[int, int, int]
+) -> NDArray:
+    # concave and saturated activations are constructed from the convex one
+    convex = _get_activation_type(convex_activation)
+    if convex == _IDENTITY:
+        concave, saturated = _IDENTITY, _IDENTITY
+    elif convex == _CONVEX_INCREASING:
+        concave, saturated = _CONCAVE_INCREASING, _INCREASING_ONLY
+    elif convex == _INCREASING_ONLY:
+        concave, saturated = _INCREASING_ONLY, _INCREASING_ONLY
+    else:
+        concave, saturated = _OTHER, _OTHER
+
+    return np.repeat([convex, concave, saturated], activation_selector)
+
+
+def _propagate_activation(
+    monotonicity: NDArray, curvature: NDArray, activation_types: Union[int, NDArray]
+) -> Tuple[NDArray, NDArray]:
+    activation_types = np.broadcast_to(activation_types, monotonicity.shape)
+    constant = monotonicity == _CONSTANT
+
+    monotonicity = np.where(
+        (activation_types == _OTHER) & ~constant, _UNKNOWN, monotonicity
+    )
+
+    convex_input = (curvature == _AFFINE) | (curvature == _CONVEX)
+    concave_input = (curvature == _AFFINE) | (curvature == _CONCAVE)
+    curvature = np.select(
+        [
+            constant,
+            activation_types == _IDENTITY,
+            (activation_types == _CONVEX_INCREASING) & convex_input,
+            (activation_types == _CONCAVE_INCREASING) & concave_input,
+        ],
+        [_AFFINE, curvature, _CONVEX, _CONCAVE],
+        default=_UNKNOWN,
+    )
+
+    return monotonicity, curvature
+
+# %% ../../nbs/Certification.ipynb 12
+def _get_applied_kernel(layer: Union[MonoDense, GroupedMonoDense]) -> NDArray:
+    kernel = (
+        layer.frozen_kernel
+        if layer.frozen_kernel is not None
+        else apply_monotonicity_indicator_to_kernel(
+            layer.kernel, layer.monotonicity_indicator
+        )
+    )
+    return np.asarray(kernel, dtype=np.float32)
+
+
+def _get_feature_names(model: tf.keras.Model) -> Dict[str, List[str]]:
+    # features of each of the inputs in the order of inputs of the model
+    names = {}
+    for name, x in zip(model.input_names, model.inputs):
+        n_columns = x.shape[-1]
+        names[name] = (
+            [name] if n_columns == 1 else [f"{name}[{i}]" for i in range(n_columns)]
+        )
+    return names
+
+
+def _propagate_layer(
+    layer: tf.keras.layers.Layer,
+    inbound: List[Tuple[NDArray, NDArray]],
+    *,
+    n_features: int,
+    offset: int,
+) -> Tuple[NDArray, NDArray]:
+    if isinstance(layer, InputLayer):
+        n_columns = layer.output_shape[0][-1]
+        monotonicity = np.zeros((n_features, n_columns), dtype=np.int64)
+        monotonicity[offset : offset + n_columns] = np.eye(n_columns, dtype=np.int64)
+        return monotonicity, np.zeros_like(monotonicity)
+    elif isinstance(layer, GroupedMonoDense):
+        kernel = _get_applied_kernel(layer)
+        propagated = [
+            _propagate_activation(
+                *_propagate_linear(monotonicity, curvature, kernel[i]),
+                _get_mono_activation_types(
+                    layer.convex_activation, layer.activation_selectors[i]
+                ),
+            )
+            for i, (monotonicity, curvature) in enumerate(inbound)
+        ]
+        return (
+            np.concatenate([p[0] for p in propagated], axis=-1),
+            np.concatenate([p[1] for p in propagated], axis=-1),
+        )
+    elif isinstance(layer, MonoDense):
+        ((monotonicity, curvature),) = inbound
+        return _propagate_activation(
+            *_propagate_linear(monotonicity, curvature, _get_applied_kernel(layer)),
+            _get_mono_activation_types(
+                layer.convex_activation, layer.activation_selector
+            ),
+        )
+    elif isinstance(layer, Dense):
+        ((monotonicity, curvature),) = inbound
+        return _propagate_activation(
+            *_propagate_linear(monotonicity, curvature, np.asarray(layer.kernel)),
+            _get_activation_type(layer.activation),
+        )
+    elif isinstance(layer, tf.keras.layers.Concatenate):
+        return (
+            np.concatenate([x[0] for x in inbound], axis=-1),
+            np.concatenate([x[1] for x in inbound], axis=-1),
+        )
+    elif isinstance(layer, Dropout) or (
+        type(layer).__name__ == "TFOpLambda" and layer.symbol == "cast"
+    ):
+        (x,) = inbound
+        return x
+    elif isinstance(layer, Activation):
+        ((monotonicity, curvature),) = inbound
+        return _propagate_activation(
+            monotonicity, curvature, _get_activation_type(layer.activation)
+        )
+    elif type(layer).__name__ == "TFOpLambda" and layer.symbol in _TF_OP_ACTIVATIONS:
+        ((monotonicity, curvature),) = inbound
+        activation_type = _ACTIVATION_TYPES.get(
+            _TF_OP_ACTIVATIONS[layer.symbol], _OTHER
+        )
+        return _propagate_activation(monotonicity, curvature, activation_type)
+    else:
+        raise ValueError(
+            f"Unsupported layer '{layer.name}' of type {type(layer)}, use check_gradient_signs instead."
+        )
+
+# %% ../../nbs/Certification.ipynb 13
+@export
+def certify_monotonicity(model: tf.keras.Model) -> Dict[str, Dict[str, Any]]:
+    """Statically certifies monotonicity, convexity and concavity of the model in each of its features
+
+    The certificate is computed by propagating signs of kernels and types of activations through the
+    graph of the model without evaluating it. A certified property holds for all values of the
+    features and all outputs of the model, but a property that is not certified may still hold.
+
+    Features are named by the names of the inputs of the model. Inputs with more than one column are
+    split into features named by the name of the input and the index of the column, e.g. `"input_1[2]"`.
+
+    Args:
+        model: a model built from `MonoDense`, `GroupedMonoDense`, `Dense`, `Concatenate`, `Dropout` and
+            `Activation` layers
+
+    Returns:
+        A dictionary mapping names of the features to their certificates, each with the following keys:
+
+        - `"monotonicity_indicator"`: 1 if all outputs are certified to be monotonically increasing in the
+          feature, -1 if they are certified to be monotonically decreasing and 0 otherwise,
+
+        - `"is_convex"`: True if all outputs are certified to be convex in the feature, and
+
+        - `"is_concave"`: True if all outputs are certified to be concave in the feature.
+
+    Raise:
+        ValueError: if the model contains an unsupported layer
+    """
+    input_features = _get_feature_names(model)
+    feature_names: List[str] = sum(input_features.values(), [])
+    offsets = dict(
+        zip(
+            input_features,
+            np.cumsum([0] + [len(v) for v in input_features.values()]).tolist(),
+        )
+    )
+
+    propagated: Dict[str, Tuple[NDArray, NDArray]] = {}
+    for layer, inbound in _get_layer_graph(model):
+        propagated[layer.name] = _propagate_layer(
+            layer,
+            [propagated[name] for name in inbound],
+            n_features=len(feature_names),
+            offset=offsets.get(layer.name, 0),
+        )
+
+    monotonicity = np.concatenate(
+        [propagated[name][0] for name in model.output_names], axis=-1
+    )
+    curvature = np.concatenate(
+        [propagated[name][1] for name in model.output_names], axis=-1
+    )
+
+    certificate = {}
+    for name, m, c in zip(feature_names, monotonicity, curvature):
+        if (m == _UNKNOWN).any() or (
+            (m == _INCREASING).any() and (m == _DECREASING).any()
+        ):
+            monotonicity_indicator = 0
+        elif (m == _INCREASING).any():
+            monotonicity_indicator = 1
+        elif (m == _DECREASING).any():
+            monotonicity_indicator = -1
+        else:
+            monotonicity_indicator = 0
+        certificate[name] = dict(
+            monotonicity_indicator=monotonicity_indicator,
+            is_convex=bool(np.isin(c, [_AFFINE, _CONVEX]).all()),
+            is_concave=bool(np.isin(c, [_AFFINE, _CONCAVE]).all()),
+        )
+
+    return certificate
+
+# %% ../../nbs/Certification.ipynb 19
+@tf.function(reduce_retracing=True)
+def _get_input_gradients(
+    model: tf.keras.Model, x: List[tf.Tensor]
+) -> Tuple[tf.Tensor, tf.Tensor]:
+    with tf.GradientTape(persistent=True) as tape:
+        tape.watch(x)
+        y = model(tf.nest.pack_sequence_as(model.input, x), training=False)
+        y = tf.concat(
+            [
+                tf.reshape(yy, (-1, yy.shape[1:].num_elements()))
+                for yy in tf.nest.flatten(y)
+            ],
+            axis=-1,
+        )
+        ys = tf.unstack(tf.reduce_sum(tf.cast(y, tf.float32), axis=0))
+
+    # gradients of all output units with respect to all features, of the shape (batch_size, n_features, n_units)
+    gradients = tf.stack(
+        [
+            tf.concat(
+                [
+                    tf.reshape(g, (-1, g.shape[1:].num_elements()))
+                    for g in tape.gradient(yy, x, unconnected_gradients="zero")
+                ],
+                axis=-1,
+            )
+            for yy in ys
+        ],
+        axis=-1,
+    )
+    del tape
+
+    return tf.reduce_min(gradients, axis=0), tf.reduce_max(gradients, axis=0)
+
+# %% ../../nbs/Certification.ipynb 20
+@export
+def check_gradient_signs(
+    model: tf.keras.Model,
+    x: Union[Dict[str, ArrayLike], ArrayLike, List[ArrayLike]],
+    *,
+    batch_size: int = 4096,
+    tolerance: float = 0.0,
+) -> Dict[str, Dict[str, Any]]:
+    """Empirically checks monotonicity of the model in each of its features using signs of input gradients
+
+    Unlike `certify_monotonicity`, the check works for models with arbitrary layers, but it only shows that
+    the model is monotone at the given samples.
+
+    Args:
+        model: a model with inputs and outputs of floating point dtypes
+        x: samples at which the gradients are evaluated in the same format as inputs of the model
+        batch_size: number of samples evaluated in a single pass
+        tolerance: gradients with absolute values not larger than the tolerance are considered to be zero
+
+    Returns:
+        A dictionary mapping names of the features (see `certify_monotonicity`) to dictionaries with the
+        following keys:
+
+        - `"monotonicity_indicator"`: 1 if gradients of all outputs with respect to the feature are not
+          smaller than `-tolerance` at all samples, -1 if they are not larger than `tolerance` and 0 otherwise,
+
+        - `"min_gradient"`: minimal gradient of all outputs with respect to the feature, and
+
+        - `"max_gradient"`: maximal gradient of all outputs with respect to the feature.
+    """
+    if isinstance(x, dict):
+        xs = [np.asarray(x[name], dtype="float32") for name in model.input_names]
+    else:
+        xs = [np.asarray(xx, dtype="float32") for xx in tf.nest.flatten(x)]
+
+    min_gradients, max_gradients = [], []
+    for i in range(0, xs[0].shape[0], batch_size):
+        batch = [tf.constant(xx[i : i + batch_size]) for xx in xs]
+        min_gradient, max_gradient = _get_input_gradients(model, batch)
+        min_gradients.append(min_gradient.numpy().min(axis=-1))
+        max_gradients.append(max_gradient.numpy().max(axis=-1))
+
+    min_gradient = np.min(min_gradients, axis=0)
+    max_gradient = np.max(max_gradients, axis=0)
+
+    result = {}
+    feature_names: List[str] = sum(_get_feature_names(model).values(), [])
+    for name, g_min, g_max in zip(feature_names, min_gradient, max_gradient):
+        if g_min >= -tolerance:
+            monotonicity_indicator = 1
+        elif g_max <= tolerance:
+            monotonicity_indicator = -1
+        else:
+            monotonicity_indicator = 0
+        result[name] = dict(
+            monotonicity_indicator=monotonicity_indicator,
+            min_gradient=float(g_min),
+            max_gradient=float(g_max),
+        )
+
+    return result
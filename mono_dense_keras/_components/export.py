@@ -0,0 +1,752 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/Export.ipynb.
+
+# %% auto 0
+__all__ = ['fold_input_normalization', 'export_saved_model', 'export_tflite', 'quantize_kernel', 'export_quantized_tflite',
+           'quantization_report']
+
+# %% ../../nbs/Export.ipynb 3
+from contextlib import contextmanager
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import *
+
+import numpy as np
+import tensorflow as tf
+from numpy.typing import ArrayLike, NDArray
+from tensorflow.keras.layers import Activation, Dense, Dropout, InputLayer
+
+from mono_dense_keras._components.mono_dense_layer import (
+    GroupedMonoDense,
+    MonoDense,
+    _get_mono_dense_layers,
+    apply_monotonicity_indicator_to_kernel,
+    get_fused_activation_constants,
+)
+from ..helpers import export
+from ..runtime import save_bundle
+
+# %% ../../nbs/Export.ipynb 7
+def _get_layer_graph(
+    model: tf.keras.Model,
+) -> List[Tuple[tf.keras.layers.Layer, List[str]]]:
+    # Sequential models are converted to functional ones sharing the same layers
+    if isinstance(model, tf.keras.Sequential):
+        model = tf.keras.Model(inputs=model.inputs, outputs=model.outputs)
+
+    graph = []
+    for layer_config in model.get_config()["layers"]:
+        inbound_nodes = layer_config["inbound_nodes"]
+        if len(inbound_nodes) > 1:
+            raise ValueError(
+                f"Layers called more than once are not supported: '{layer_config['name']}'"
+            )
+        # inbound nodes of TFOpLambda layers are nested one level less than of other layers
+        inbound = inbound_nodes[0] if len(inbound_nodes) > 0 else []
+        if len(inbound) > 0 and isinstance(inbound[0], str):
+            inbound = [inbound]
+
+        layer = model.get_layer(layer_config["name"])
+        graph.append((layer, [node[0] for node in inbound]))
+
+    return graph
+
+# %% ../../nbs/Export.ipynb 11
+_PREPROCESSING_LAYERS = (
+    tf.keras.layers.Normalization,
+    tf.keras.layers.Rescaling,
+)
+
+
+def _get_affine(
+    layer: tf.keras.layers.Layer, n_features: int
+) -> Tuple[NDArray[np.float64], NDArray[np.float64]]:
+    if isinstance(layer, tf.keras.layers.Normalization):
+        std = np.maximum(
+            np.sqrt(np.asarray(layer.variance, dtype=np.float64)),
+            tf.keras.backend.epsilon(),
+        )
+        mean = np.asarray(layer.mean, dtype=np.float64)
+        scale, offset = (std, mean) if layer.invert else (1 / std, -mean / std)
+    else:
+        scale = np.asarray(layer.scale, dtype=np.float64)
+        offset = np.asarray(layer.offset, dtype=np.float64)
+
+    def to_features(x: NDArray[np.float64]) -> NDArray[np.float64]:
+        if any(dim != 1 for dim in x.shape[:-1]) or x.size not in [1, n_features]:
+            raise ValueError(
+                f"Only preprocessing along the last axis can be folded: '{layer.name}'"
+            )
+        return np.broadcast_to(x.reshape(-1), (n_features,))
+
+    return to_features(scale), to_features(offset)
+
+
+def _fold_affine(
+    layer: Dense, scale: NDArray[np.float64], offset: NDArray[np.float64]
+) -> List[NDArray]:
+    kernel = np.asarray(layer.kernel, dtype=np.float64)
+    if isinstance(layer, MonoDense):
+        # the indicator of a built layer is broadcastable to the kernel, a feature is monotone if it is
+        # monotone in any of the units
+        indicator = np.broadcast_to(layer.monotonicity_indicator, kernel.shape)
+        negative = np.flatnonzero((indicator != 0).any(axis=1) & (scale < 0))
+        if len(negative) > 0:
+            raise ValueError(
+                f"Negative scales of monotone features cannot be folded into layer '{layer.name}': {negative.tolist()}"
+            )
+        effective_kernel = np.asarray(
+            layer.frozen_kernel
+            if layer.frozen_kernel is not None
+            else apply_monotonicity_indicator_to_kernel(
+                layer.kernel, layer.monotonicity_indicator
+            ),
+            dtype=np.float64,
+        )
+    else:
+        effective_kernel = kernel
+
+    bias = (
+        np.asarray(layer.bias, dtype=np.float64)
+        if layer.use_bias
+        else np.zeros(kernel.shape[-1])
+    )
+    return [
+        (scale[:, None] * kernel).astype(np.float32),
+        (offset @ effective_kernel + bias).astype(np.float32),
+    ]
+
+
+def _rewire_inbound_nodes(nodes: Any, sources: Dict[str, List[Any]]) -> Any:
+    if not isinstance(nodes, list):
+        return nodes
+    # a node is a list starting with the name of the inbound layer followed by node and tensor indices
+    if len(nodes) >= 3 and isinstance(nodes[0], str) and isinstance(nodes[1], int):
+        return sources[nodes[0]] + nodes[3:] if nodes[0] in sources else nodes
+    return [_rewire_inbound_nodes(node, sources) for node in nodes]
+
+
+def _get_random_inputs(model: tf.keras.Model, batch_size: int) -> List[NDArray]:
+    for name, x in zip(model.input_names, model.inputs):
+        if not x.shape[1:].is_fully_defined():
+            raise ValueError(
+                f"Random inputs cannot be created for input '{name}' of the shape {x.shape}, pass inputs explicitly"
+            )
+    rng = np.random.default_rng(42)
+    return [
+        rng.normal(size=(batch_size,) + tuple(x.shape[1:])).astype(
+            x.dtype.as_numpy_dtype
+        )
+        for x in model.inputs
+    ]
+
+# %% ../../nbs/Export.ipynb 15
+@export
+def fold_input_normalization(
+    model: tf.keras.Model,
+    x: Optional[Union[Dict[str, ArrayLike], ArrayLike, List[ArrayLike]]] = None,
+    *,
+    rtol: float = 1e-4,
+    atol: float = 1e-5,
+) -> tf.keras.Model:
+    """Folds `Normalization` and `Rescaling` layers into kernels and biases of the following layers
+
+    Outputs of the preprocessing layers can be concatenated before they are passed to `Dense` or `MonoDense`
+    layers, as in models built by `create_type_1` and `create_type_2`. The folded model is a new functional model
+    with the same inputs and outputs in which the preprocessing layers are removed. Models without preprocessing
+    layers are returned unchanged.
+
+    Args:
+        model: a trained model
+        x: inputs used for verifying that the folded model computes the same outputs as the original one, random
+            inputs are used if None
+        rtol: relative tolerance of the verification
+        atol: absolute tolerance of the verification
+
+    Returns:
+        The folded model
+
+    Raise:
+        ValueError: if outputs of a preprocessing layer are used by layers other than `Concatenate`, `Dense` and
+            `MonoDense` layers, if a negative scale is applied to a monotone feature, if `x` is None and shapes
+            of inputs are not fully defined, or if the outputs of the folded model differ from the outputs of the
+            original model
+    """
+    # Sequential models are converted to functional ones sharing the same layers
+    if isinstance(model, tf.keras.Sequential):
+        model = tf.keras.Model(inputs=model.inputs, outputs=model.outputs)
+    graph = _get_layer_graph(model)
+    config = model.get_config()
+    layer_configs = {c["name"]: c for c in config["layers"]}
+    output_sizes = {layer.name: layer.output.shape[-1] for layer, _ in graph}
+
+    # scales and offsets of outputs of layers computed as affine transformations of outputs of other layers
+    affines: Dict[str, Tuple[NDArray[np.float64], NDArray[np.float64]]] = {}
+    # inbound nodes of removed preprocessing layers
+    sources: Dict[str, List[Any]] = {}
+    folded_weights: Dict[str, List[NDArray]] = {}
+    for layer, inbound in graph:
+        if isinstance(layer, _PREPROCESSING_LAYERS):
+            (inbound_name,) = inbound
+            scale, offset = _get_affine(layer, output_sizes[layer.name])
+            if inbound_name in affines:
+                inbound_scale, inbound_offset = affines[inbound_name]
+                scale, offset = inbound_scale * scale, inbound_offset * scale + offset
+            affines[layer.name] = (scale, offset)
+            inbound_node = layer_configs[layer.name]["inbound_nodes"][0][0][:3]
+            sources[layer.name] = _rewire_inbound_nodes(inbound_node, sources)
+        elif not any(name in affines for name in inbound):
+            continue
+        elif isinstance(layer, tf.keras.layers.Concatenate) and layer.axis in [
+            -1,
+            len(layer.output_shape) - 1,
+        ]:
+            scales, offsets = zip(
+                *[
+                    affines.get(
+                        name,
+                        (np.ones(output_sizes[name]), np.zeros(output_sizes[name])),
+                    )
+                    for name in inbound
+                ]
+            )
+            affines[layer.name] = (np.concatenate(scales), np.concatenate(offsets))
+        elif isinstance(layer, Dense):
+            (inbound_name,) = inbound
+            folded_weights[layer.name] = _fold_affine(layer, *affines[inbound_name])
+        else:
+            raise ValueError(
+                f"Preprocessing cannot be folded into layer '{layer.name}' of type {type(layer)}"
+            )
+
+    if len(sources) == 0:
+        return model
+    for name in tf.nest.flatten(model.output_names):
+        if name in affines:
+            raise ValueError(f"Preprocessing cannot be folded into outputs: '{name}'")
+
+    config["layers"] = [c for c in config["layers"] if c["name"] not in sources]
+    for c in config["layers"]:
+        c["inbound_nodes"] = _rewire_inbound_nodes(c["inbound_nodes"], sources)
+        if c["name"] in folded_weights:
+            c["config"]["use_bias"] = True
+    folded_model = tf.keras.Model.from_config(config)
+
+    for folded_layer in folded_model.layers:
+        weights = folded_weights.get(folded_layer.name)
+        layer = model.get_layer(folded_layer.name)
+        folded_layer.set_weights(
+            weights if weights is not None else layer.get_weights()
+        )
+        if getattr(layer, "frozen_kernel", None) is not None:
+            folded_layer.freeze()
+
+    xs = _get_random_inputs(model, batch_size=32) if x is None else x
+    for expected, actual in zip(
+        tf.nest.flatten(model.predict(xs, verbose=0)),
+        tf.nest.flatten(folded_model.predict(xs, verbose=0)),
+    ):
+        if not np.allclose(actual, expected, rtol=rtol, atol=atol):
+            raise ValueError(
+                f"Outputs of the folded model differ from outputs of the original model by up to {np.abs(actual - expected).max()}"
+            )
+
+    return folded_model
+
+# %% ../../nbs/Export.ipynb 19
+_TF_OP_ACTIVATIONS = {
+    "math.sigmoid": "sigmoid",
+    "nn.softmax": "softmax",
+    "nn.relu": "relu",
+    "nn.elu": "elu",
+    "nn.selu": "selu",
+    "math.tanh": "tanh",
+    "math.softplus": "softplus",
+}
+
+
+def _get_activation_name(activation: Callable[[Any], Any]) -> str:
+    name = tf.keras.activations.serialize(activation)
+    if not isinstance(name, str):
+        raise ValueError(f"Unsupported activation: {activation}")
+    return name
+
+
+def _get_dense_node(
+    layer: Dense, inbound: List[str]
+) -> Tuple[Dict[str, Any], Dict[str, NDArray]]:
+    if isinstance(layer, MonoDense):
+        kernel = (
+            layer.frozen_kernel
+            if layer.frozen_kernel is not None
+            else apply_monotonicity_indicator_to_kernel(
+                layer.kernel, layer.monotonicity_indicator
+            )
+        )
+        activation = _get_activation_name(layer.convex_activation)
+        activation_selector = list(layer.activation_selector)
+        saturation_constant = float(layer.convex_activation(tf.constant(1.0)))
+    else:
+        kernel = layer.kernel
+        activation = _get_activation_name(layer.activation)
+        activation_selector = [layer.units, 0, 0]
+        saturation_constant = 0.0
+
+    node = dict(
+        name=layer.name,
+        type="dense",
+        inputs=inbound,
+        kernel=f"{layer.name}/kernel",
+        activation=activation,
+        activation_selector=activation_selector,
+        saturation_constant=saturation_constant,
+    )
+    arrays = {f"{layer.name}/kernel": np.asarray(kernel, dtype=np.float32)}
+    if layer.use_bias:
+        node["bias"] = f"{layer.name}/bias"
+        arrays[f"{layer.name}/bias"] = np.asarray(layer.bias, dtype=np.float32)
+
+    return node, arrays
+
+
+def _get_grouped_dense_node(
+    layer: GroupedMonoDense, inbound: List[str]
+) -> Tuple[Dict[str, Any], Dict[str, NDArray]]:
+    kernel = (
+        layer.frozen_kernel
+        if layer.frozen_kernel is not None
+        else apply_monotonicity_indicator_to_kernel(
+            layer.kernel, layer.monotonicity_indicator
+        )
+    )
+    node = dict(
+        name=layer.name,
+        type="grouped_dense",
+        inputs=inbound,
+        kernel=f"{layer.name}/kernel",
+        activation=_get_activation_name(layer.convex_activation),
+        activation_selectors=[list(s) for s in layer.activation_selectors],
+        saturation_constant=float(layer.convex_activation(tf.constant(1.0))),
+    )
+    arrays = {f"{layer.name}/kernel": np.asarray(kernel, dtype=np.float32)}
+    if layer.use_bias:
+        node["bias"] = f"{layer.name}/bias"
+        arrays[f"{layer.name}/bias"] = np.asarray(layer.bias, dtype=np.float32)
+
+    return node, arrays
+
+
+def _get_node(
+    layer: tf.keras.layers.Layer, inbound: List[str]
+) -> Tuple[Dict[str, Any], Dict[str, NDArray]]:
+    node: Dict[str, Any] = dict(name=layer.name, inputs=inbound)
+    if isinstance(layer, InputLayer):
+        node = dict(name=layer.name, type="input")
+    elif isinstance(layer, Dense):
+        return _get_dense_node(layer, inbound)
+    elif isinstance(layer, GroupedMonoDense):
+        return _get_grouped_dense_node(layer, inbound)
+    elif isinstance(layer, tf.keras.layers.Concatenate):
+        if layer.axis not in [-1, len(layer.output_shape) - 1]:
+            raise ValueError(
+                f"Concatenation is supported only along the last axis: '{layer.name}'"
+            )
+        node["type"] = "concatenate"
+    elif isinstance(layer, Dropout):
+        node["type"] = "identity"
+    elif type(layer).__name__ == "TFOpLambda" and layer.symbol == "cast":
+        # outputs of models using mixed precision are cast to float32, which is used by the runtime
+        node["type"] = "identity"
+    elif isinstance(layer, Activation):
+        node["type"] = "activation"
+        node["activation"] = _get_activation_name(layer.activation)
+    elif type(layer).__name__ == "TFOpLambda" and layer.symbol in _TF_OP_ACTIVATIONS:
+        node["type"] = "activation"
+        node["activation"] = _TF_OP_ACTIVATIONS[layer.symbol]
+    else:
+        raise ValueError(f"Unsupported layer '{layer.name}' of type {type(layer)}")
+
+    return node, {}
+
+
+@export
+def export_numpy_bundle(model: tf.keras.Model, path: Union[Path, str]) -> Path:
+    """Exports a trained model into a bundle evaluated by `MonoModelRuntime` without TensorFlow
+
+    Supported models are built using `create_type_1`, `create_type_2` or from `MonoDense`,
+    `GroupedMonoDense`, `Dense`, `Concatenate`, `Dropout` and `Activation` layers, with activations applied to outputs of the
+    model as in `create_type_1` and `create_type_2`. `Normalization` and `Rescaling` layers in front of them are folded
+    into the following layers by `fold_input_normalization`.
+
+    Args:
+        model: a trained model
+        path: path to the bundle file, `.npz` suffix is appended if missing
+
+    Returns:
+        Path to the saved bundle
+
+    Raise:
+        ValueError: if the model contains unsupported layers or activations
+    """
+    model = fold_input_normalization(model)
+
+    nodes = []
+    arrays: Dict[str, NDArray] = {}
+    for layer, inbound in _get_layer_graph(model):
+        node, node_arrays = _get_node(layer, inbound)
+        nodes.append(node)
+        arrays.update(node_arrays)
+
+    spec = dict(inputs=model.input_names, outputs=model.output_names, nodes=nodes)
+    return save_bundle(path, spec, arrays)
+
+# %% ../../nbs/Export.ipynb 26
+@contextmanager
+def _prepare_for_export(
+    model: tf.keras.Model, *, fuse_activations: bool, quantize_kernels: bool = False
+) -> Generator[None, None, None]:
+    layers = _get_mono_dense_layers(model)
+    was_frozen = [layer.frozen_kernel is not None for layer in layers]
+    was_fused = [getattr(layer, "fuse_activations", True) for layer in layers]
+    frozen_kernels = [layer.frozen_kernel for layer in layers]
+
+    try:
+        for layer, frozen, fused in zip(layers, was_frozen, was_fused):
+            if not frozen:
+                layer.freeze()
+            if quantize_kernels:
+                if layer.frozen_kernel is None:
+                    raise ValueError(
+                        f"Kernel of layer '{layer.name}' cannot be quantized because the layer is not frozen."
+                    )
+                q, scale = quantize_kernel(layer.frozen_kernel.numpy())
+                layer.frozen_kernel = tf.constant(
+                    q.astype(layer.frozen_kernel.dtype.as_numpy_dtype) * scale
+                )
+            if fuse_activations and not fused:
+                layer._fused_activation_constants = get_fused_activation_constants(
+                    layer.activation_selector, convex_activation=layer.convex_activation
+                )
+                layer.fuse_activations = True
+        yield
+    finally:
+        for layer, frozen, fused, frozen_kernel in zip(
+            layers, was_frozen, was_fused, frozen_kernels
+        ):
+            if not frozen:
+                layer.unfreeze()
+            else:
+                layer.frozen_kernel = frozen_kernel
+            if not fused:
+                layer.fuse_activations = False
+
+
+def _get_serving_function(
+    model: tf.keras.Model,
+) -> tf.types.experimental.ConcreteFunction:
+    # inputs are passed as separate named tensors, which are used as names of inputs in signatures
+    input_signature = [
+        tf.TensorSpec(shape=x.shape, dtype=x.dtype, name=name)
+        for name, x in zip(model.input_names, model.inputs)
+    ]
+
+    @tf.function(input_signature=input_signature)
+    def serve(*args: tf.Tensor) -> Dict[str, tf.Tensor]:
+        inputs = tf.nest.pack_sequence_as(model.input, list(args))
+        outputs = model(inputs, training=False)
+        return dict(zip(model.output_names, tf.nest.flatten(outputs)))
+
+    return serve.get_concrete_function()
+
+
+def _save_serving_model(
+    model: tf.keras.Model,
+    path: Union[Path, str],
+    *,
+    fuse_activations: bool,
+    quantize_kernels: bool = False,
+    fold_normalization: bool = False,
+) -> Path:
+    path = Path(path)
+    if fold_normalization:
+        model = fold_input_normalization(model)
+    with _prepare_for_export(
+        model, fuse_activations=fuse_activations, quantize_kernels=quantize_kernels
+    ):
+        serving_function = _get_serving_function(model)
+
+        # variables used by the serving function (e.g. biases) are tracked through the module
+        module = tf.Module()
+        module.model = model
+        tf.saved_model.save(
+            module, str(path), signatures={"serving_default": serving_function}
+        )
+
+    return path
+
+
+def _write_flatbuffer(path: Union[Path, str], flatbuffer: bytes) -> Path:
+    path = Path(path)
+    path.parent.mkdir(exist_ok=True, parents=True)
+    path.write_bytes(flatbuffer)
+
+    return path
+
+# %% ../../nbs/Export.ipynb 27
+@export
+def export_saved_model(
+    model: tf.keras.Model,
+    path: Union[Path, str],
+    *,
+    fuse_activations: bool = True,
+    fold_normalization: bool = False,
+) -> Path:
+    """Exports a trained model as a SavedModel with constant-folded monotone kernels
+
+    The SavedModel has a single signature `serving_default` with inputs named by `model.input_names`
+    and outputs named by `model.output_names`.
+
+    Args:
+        model: a trained model
+        path: path to the SavedModel directory
+        fuse_activations: if True, all types of activations are applied in a single pass
+        fold_normalization: if True, input preprocessing is folded into the following layers by
+            `fold_input_normalization`
+
+    Returns:
+        Path to the SavedModel directory
+    """
+    return _save_serving_model(
+        model,
+        path,
+        fuse_activations=fuse_activations,
+        fold_normalization=fold_normalization,
+    )
+
+
+@export
+def export_tflite(
+    model: tf.keras.Model,
+    path: Union[Path, str],
+    *,
+    fuse_activations: bool = True,
+    fold_normalization: bool = False,
+) -> Path:
+    """Converts a trained model to a TFLite flatbuffer with constant-folded monotone kernels
+
+    Only builtin TFLite operations are used, so the converted model can be run by the TFLite interpreter
+    without custom or select TensorFlow operations. The flatbuffer has a single signature with the same
+    inputs and outputs as the SavedModel exported by `export_saved_model`.
+
+    Args:
+        model: a trained model
+        path: path to the flatbuffer file
+        fuse_activations: if True, all types of activations are applied in a single pass
+        fold_normalization: if True, input preprocessing is folded into the following layers by
+            `fold_input_normalization`
+
+    Returns:
+        Path to the flatbuffer file
+    """
+    with TemporaryDirectory() as d:
+        saved_model_path = export_saved_model(
+            model,
+            Path(d) / "saved_model",
+            fuse_activations=fuse_activations,
+            fold_normalization=fold_normalization,
+        )
+        converter = tf.lite.TFLiteConverter.from_saved_model(str(saved_model_path))
+        converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS]
+        flatbuffer = converter.convert()
+
+    return _write_flatbuffer(path, flatbuffer)
+
+# %% ../../nbs/Export.ipynb 36
+def quantize_kernel(
+    kernel: ArrayLike, *, num_bits: int = 8
+) -> Tuple[NDArray[np.int_], float]:
+    """Quantizes the kernel using symmetric quantization preserving signs of its elements
+
+    Args:
+        kernel: kernel with the monotonicity indicator applied to it
+        num_bits: number of bits of quantized elements
+
+    Returns:
+        Quantized kernel and its scale, the kernel is approximated by their product
+    """
+    kernel = np.asarray(kernel, dtype="float32")
+    q_max = 2 ** (num_bits - 1) - 1
+
+    max_abs = float(np.abs(kernel).max()) if kernel.size > 0 else 0.0
+    scale = max_abs / q_max if max_abs > 0 else 1.0
+
+    q = np.clip(np.round(kernel / scale), -q_max, q_max)
+    # nonzero elements rounded to zero are rounded away from zero instead
+    q = np.where((q == 0) & (kernel != 0), np.sign(kernel), q)
+
+    return q.astype("int8" if num_bits <= 8 else "int32"), scale
+
+# %% ../../nbs/Export.ipynb 39
+def _get_representative_dataset(
+    model: tf.keras.Model, x: Union[Dict[str, ArrayLike], ArrayLike, List[ArrayLike]]
+) -> Callable[[], Iterator[Dict[str, NDArray]]]:
+    if isinstance(x, dict):
+        xs = [np.asarray(x[name], dtype="float32") for name in model.input_names]
+    else:
+        xs = [np.asarray(xx, dtype="float32") for xx in tf.nest.flatten(x)]
+
+    def representative_dataset() -> Iterator[Dict[str, NDArray]]:
+        for i in range(xs[0].shape[0]):
+            yield {name: xx[i : i + 1] for name, xx in zip(model.input_names, xs)}
+
+    return representative_dataset
+
+# %% ../../nbs/Export.ipynb 40
+@export
+def export_quantized_tflite(
+    model: tf.keras.Model,
+    path: Union[Path, str],
+    representative_data: Union[Dict[str, ArrayLike], ArrayLike, List[ArrayLike]],
+    *,
+    fuse_activations: bool = False,
+    fold_normalization: bool = False,
+) -> Path:
+    """Converts a trained model to a TFLite flatbuffer with int8 kernels and activations
+
+    Kernels of `MonoDense` and `GroupedMonoDense` layers are quantized by `quantize_kernel`, which
+    preserves signs of their elements and hence the monotonicity of the model. Ranges of activations
+    are calibrated on the representative data. Inputs and outputs of the converted model are in `float32`
+    and operations without `int8` kernels are executed in `float32`.
+
+    Args:
+        model: a trained model
+        path: path to the flatbuffer file
+        representative_data: samples used for calibration in the same format as inputs of the model,
+            a few hundred samples are usually enough
+        fuse_activations: if True, all types of activations are applied in a single pass, which is
+            slower than applying them separately when activations are quantized
+        fold_normalization: if True, input preprocessing is folded into the following layers by
+            `fold_input_normalization` before kernels are quantized
+
+    Returns:
+        Path to the flatbuffer file
+    """
+    with TemporaryDirectory() as d:
+        saved_model_path = _save_serving_model(
+            model,
+            Path(d) / "saved_model",
+            fuse_activations=fuse_activations,
+            quantize_kernels=True,
+            fold_normalization=fold_normalization,
+        )
+        converter = tf.lite.TFLiteConverter.from_saved_model(str(saved_model_path))
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.representative_dataset = _get_representative_dataset(
+            model, representative_data
+        )
+        converter.target_spec.supported_ops = [
+            tf.lite.OpsSet.TFLITE_BUILTINS_INT8,
+            tf.lite.OpsSet.TFLITE_BUILTINS,
+        ]
+        flatbuffer = converter.convert()
+
+    return _write_flatbuffer(path, flatbuffer)
+
+# %% ../../nbs/Export.ipynb 44
+def _get_tflite_predict(
+    flatbuffer: bytes, input_names: List[str]
+) -> Callable[[Dict[str, NDArray]], NDArray]:
+    interpreter = tf.lite.Interpreter(model_content=flatbuffer)
+    runner = interpreter.get_signature_runner()
+
+    def predict(x: Dict[str, NDArray]) -> NDArray:
+        outputs = runner(**{name: x[name] for name in input_names})
+        return np.concatenate([outputs[name] for name in sorted(outputs)], axis=-1)
+
+    return predict
+
+
+def _get_latency_ms(f: Callable[[], Any], n_iter: int) -> float:
+    f()
+    t0 = perf_counter()
+    for _ in range(n_iter):
+        f()
+    return (perf_counter() - t0) / n_iter * 1000
+
+# %% ../../nbs/Export.ipynb 45
+@export
+def quantization_report(
+    model: tf.keras.Model,
+    x: Union[Dict[str, ArrayLike], ArrayLike, List[ArrayLike]],
+    y: Optional[ArrayLike] = None,
+    *,
+    metric: Optional[Callable[[ArrayLike, ArrayLike], float]] = None,
+    representative_data: Optional[
+        Union[Dict[str, ArrayLike], ArrayLike, List[ArrayLike]]
+    ] = None,
+    batch_size: int = 1,
+    n_iter: int = 100,
+) -> Dict[str, float]:
+    """Compares the model quantized by `export_quantized_tflite` with the model converted by `export_tflite`
+
+    Args:
+        model: a trained model with a single output
+        x: inputs used for evaluation in the same format as inputs of the model
+        y: targets used for evaluation, if None only differences of outputs are reported
+        metric: metric computed from targets and predictions, higher values are better
+        representative_data: samples used for calibration, if None `x` is used
+        batch_size: batch size used for measuring latency
+        n_iter: number of iterations used for measuring latency
+
+    Returns:
+        Sizes of both models in kilobytes, their latencies on CPU in milliseconds and the differences
+        of their outputs. If `y` and `metric` are given, the values of the metric and its drop caused
+        by quantization are reported as well.
+
+    Raise:
+        ValueError: if `y` is given without `metric`
+    """
+    if y is not None and metric is None:
+        raise ValueError("metric must be given when y is given.")
+    if representative_data is None:
+        representative_data = x
+
+    if isinstance(x, dict):
+        xs = {name: np.asarray(x[name], dtype="float32") for name in model.input_names}
+    else:
+        xs = {
+            name: np.asarray(xx, dtype="float32")
+            for name, xx in zip(model.input_names, tf.nest.flatten(x))
+        }
+    x_batch = {name: xx[:batch_size] for name, xx in xs.items()}
+
+    with TemporaryDirectory() as d:
+        flatbuffers = {
+            "float32": export_tflite(model, Path(d) / "float32.tflite").read_bytes(),
+            "int8": export_quantized_tflite(
+                model, Path(d) / "int8.tflite", representative_data
+            ).read_bytes(),
+        }
+
+    report: Dict[str, float] = {}
+    predictions = {}
+    for name, flatbuffer in flatbuffers.items():
+        predict = _get_tflite_predict(flatbuffer, model.input_names)
+        # the interpreter is resized for each batch size, so latency is measured after predicting all samples
+        predictions[name] = predict(xs)
+        report[f"{name}_size_kb"] = len(flatbuffer) / 1024
+        report[f"{name}_latency_ms"] = _get_latency_ms(lambda: predict(x_batch), n_iter)
+
+    report["size_reduction"] = report["float32_size_kb"] / report["int8_size_kb"]
+    report["speedup"] = report["float32_latency_ms"] / report["int8_latency_ms"]
+
+    diff = np.abs(predictions["int8"] - predictions["float32"])
+    report["max_abs_diff"] = float(diff.max())
+    report["mean_abs_diff"] = float(diff.mean())
+
+    if y is not None and metric is not None:
+        report["float32_metric"] = float(metric(y, predictions["float32"]))
+        report["int8_metric"] = float(metric(y, predictions["int8"]))
+        report["metric_drop"] = report["float32_metric"] - report["int8_metric"]
+
+    return report
@@ -0,0 +1,331 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/LookupTables.ipynb.
+
+# %% auto 0
+__all__ = ['PiecewiseLinear', 'compile_feature_branches']
+
+# %% ../../nbs/LookupTables.ipynb 3
+from typing import *
+
+import numpy as np
+import tensorflow as tf
+from numpy.typing import ArrayLike, NDArray
+from tensorflow.keras.layers import Dense, InputLayer
+from tensorflow.types.experimental import TensorLike
+
+from .export import _get_activation_name, _get_layer_graph
+from mono_dense_keras._components.mono_dense_layer import (
+    GroupedMonoDense,
+    MonoDense,
+    apply_monotonicity_indicator_to_kernel,
+)
+from ..helpers import export
+
+# %% ../../nbs/LookupTables.ipynb 7
+@tf.keras.utils.register_keras_serializable(package="mono_dense_keras")
+class PiecewiseLinear(tf.keras.layers.Layer):
+    """Piecewise-linear functions of each of the input features
+
+    The layer maps inputs of the shape `(batch_size, n_features)` to outputs of the shape
+    `(batch_size, n_features * units)`, where the outputs `i * units` to `(i + 1) * units - 1` are
+    piecewise-linear functions of the feature `i` interpolating the given values at the given knots.
+    The functions are extrapolated linearly using the slopes of the first and the last segment.
+    """
+
+    def __init__(self, knots: ArrayLike, values: ArrayLike, **kwargs: Any):
+        """Constructs a new PiecewiseLinear instance.
+
+        Args:
+            knots: strictly increasing knots for each of the features, of the shape `(n_features, n_knots)`
+            values: values of the functions at the knots, of the shape `(n_features, n_knots, units)`
+            **kwargs: passed as kwargs to the constructor of `Layer`
+
+        Raise:
+            ValueError:
+                - if shapes of knots and values do not match or there are less than two knots, or
+                - if knots are not strictly increasing, or
+                - if some knots are equal after conversion to float32
+        """
+        super(PiecewiseLinear, self).__init__(**kwargs)
+
+        knots = np.asarray(knots)
+        values = np.asarray(values, dtype=np.float32)
+        if knots.ndim != 2 or values.shape[:2] != knots.shape or knots.shape[1] < 2:
+            raise ValueError(
+                f"Knots of the shape (n_features, n_knots) with n_knots >= 2 and values of the shape (n_features, n_knots, units) expected, but we have {knots.shape} and {values.shape} instead."
+            )
+        if not (np.diff(knots, axis=-1) > 0).all():
+            raise ValueError("Knots must be strictly increasing.")
+        knots = knots.astype(np.float32)
+        if not (np.diff(knots, axis=-1) > 0).all():
+            raise ValueError(
+                "Knots must be strictly increasing in float32 precision, but some of them are equal after conversion."
+            )
+
+        self.knots = knots
+        self.values = values
+        self.n_features, self.n_knots, self.units = values.shape
+
+        # slope of the segment starting at each knot, the last knot continues the last segment
+        slopes = np.diff(values, axis=1) / np.diff(knots, axis=-1)[..., None]
+        self.slopes = np.concatenate([slopes, slopes[:, -1:]], axis=1)
+
+    def call(self, inputs: TensorLike) -> TensorLike:
+        """Call
+
+        Args:
+            inputs: input tensor of the shape `(batch_size, n_features)`
+
+        Returns:
+            output tensor of the shape `(batch_size, n_features * units)`
+        """
+        dtype = self._compute_dtype_object
+        knots = tf.constant(self.knots, dtype=dtype)
+        x = tf.transpose(tf.cast(inputs, dtype))
+
+        # index of the segment containing x, segments beyond the ends are extended
+        i = tf.searchsorted(knots, x, side="right") - 1
+        i = tf.clip_by_value(i, 0, self.n_knots - 1)
+
+        knot = tf.gather(knots, i, batch_dims=1)
+        value = tf.gather(tf.constant(self.values, dtype=dtype), i, batch_dims=1)
+        slope = tf.gather(tf.constant(self.slopes, dtype=dtype), i, batch_dims=1)
+        y = value + slope * (x - knot)[..., None]
+
+        return tf.reshape(
+            tf.transpose(y, (1, 0, 2)), (-1, self.n_features * self.units)
+        )
+
+    def get_config(self) -> Dict[str, Any]:
+        return {
+            **super(PiecewiseLinear, self).get_config(),
+            "knots": self.knots.tolist(),
+            "values": self.values.tolist(),
+        }
+
+# %% ../../nbs/LookupTables.ipynb 12
+_PIECEWISE_LINEAR_ACTIVATIONS = ["relu", "linear"]
+
+
+def _get_branch_params(
+    layer: Union[Dense, GroupedMonoDense], i: int
+) -> Tuple[NDArray, NDArray, str, int]:
+    if isinstance(layer, (MonoDense, GroupedMonoDense)):
+        kernel = (
+            layer.frozen_kernel
+            if layer.frozen_kernel is not None
+            else apply_monotonicity_indicator_to_kernel(
+                layer.kernel, layer.monotonicity_indicator
+            )
+        )
+        activation = _get_activation_name(layer.convex_activation)
+        monotonicity_indicator = int(
+            np.asarray(layer.monotonicity_indicator).ravel()[i]
+        )
+    else:
+        kernel = layer.kernel
+        activation = _get_activation_name(layer.activation)
+        monotonicity_indicator = 0
+
+    kernel = np.asarray(kernel, dtype=np.float32)
+    bias = (
+        np.asarray(layer.bias, dtype=np.float32)
+        if layer.use_bias
+        else np.zeros(kernel.shape[-1], dtype=np.float32)
+    )
+    if isinstance(layer, GroupedMonoDense):
+        kernel, bias = kernel[i], bias[i]
+
+    return kernel[0], bias, activation, monotonicity_indicator
+
+
+def _get_branch_knots(
+    w: NDArray, b: NDArray, activation: str, x: Optional[NDArray], n_points: int
+) -> Tuple[NDArray, float]:
+    if activation in _PIECEWISE_LINEAR_ACTIVATIONS:
+        # breakpoints of all units, extended by one on both ends; breakpoints which are equal in
+        # float32 precision of the tables are merged
+        nonzero = w != 0
+        knots = np.unique(
+            np.asarray(
+                [(h - b[nonzero]) / w[nonzero] for h in [-1.0, 0.0, 1.0]],
+                dtype=np.float32,
+            )
+        ).astype(np.float64)
+        if len(knots) == 0:
+            knots = np.zeros(1)
+        step = 1.0
+    else:
+        if x is None:
+            raise ValueError(
+                f"Data must be given to sample branches with the activation '{activation}'."
+            )
+        lo, hi = float(np.min(x)), float(np.max(x))
+        step = (hi - lo) / (n_points - 1) if hi > lo else 1.0
+        knots = lo + step * np.arange(n_points)
+
+    return np.concatenate([[knots[0] - step], knots, [knots[-1] + step]]), step
+
+
+def _make_monotone(values: NDArray, monotonicity_indicator: int) -> NDArray:
+    if monotonicity_indicator == 1:
+        return np.maximum.accumulate(values, axis=0)
+    elif monotonicity_indicator == -1:
+        return np.minimum.accumulate(values, axis=0)
+    return values
+
+
+def _pad_table(
+    knots: NDArray, values: NDArray, step: float, n_knots: int
+) -> Tuple[NDArray, NDArray]:
+    # additional knots continue the last segment
+    n = n_knots - len(knots)
+    slope = (values[-1] - values[-2]) / (knots[-1] - knots[-2])
+    offsets = step * np.arange(1, n + 1)
+    return (
+        np.concatenate([knots, knots[-1] + offsets]),
+        np.concatenate([values, values[-1] + offsets[:, None] * slope]),
+    )
+
+# %% ../../nbs/LookupTables.ipynb 15
+def _find_branches(
+    model: tf.keras.Model,
+) -> Dict[str, Tuple[List[str], List[Tuple[tf.keras.layers.Layer, int]]]]:
+    # layers preprocessing single-column inputs feature by feature mapped to names of the inputs and the branches
+    graph = _get_layer_graph(model)
+    layers = {layer.name: (layer, inbound) for layer, inbound in graph}
+
+    def _is_scalar_input(name: str) -> bool:
+        layer = layers[name][0]
+        return isinstance(layer, InputLayer) and layer.output_shape[0][-1] == 1
+
+    found = {}
+    for layer, inbound in graph:
+        if isinstance(layer, GroupedMonoDense):
+            if all(_is_scalar_input(name) for name in inbound):
+                found[layer.name] = (inbound, [(layer, i) for i in range(len(inbound))])
+        elif isinstance(layer, tf.keras.layers.Concatenate):
+            branches = [layers[name] for name in inbound]
+            if all(
+                isinstance(branch, Dense)
+                and len(branch_inbound) == 1
+                and _is_scalar_input(branch_inbound[0])
+                for branch, branch_inbound in branches
+            ):
+                found[layer.name] = (
+                    [branch_inbound[0] for _, branch_inbound in branches],
+                    [(branch, 0) for branch, _ in branches],
+                )
+
+    return found
+
+
+def _compile_branches(
+    branches: List[Tuple[tf.keras.layers.Layer, int]],
+    xs: List[Optional[NDArray]],
+    n_points: int,
+) -> Tuple[NDArray, NDArray]:
+    tables = []
+    for (layer, i), x in zip(branches, xs):
+        w, b, activation, monotonicity_indicator = _get_branch_params(layer, i)
+        knots, step = _get_branch_knots(w, b, activation, x, n_points)
+
+        # the branch is evaluated by the layer itself to include its activations
+        t = tf.constant(knots[:, None], dtype=tf.float32)
+        if isinstance(layer, GroupedMonoDense):
+            units = layer.units
+            y = layer([t] * layer.n_groups)[:, i * units : (i + 1) * units]
+        else:
+            y = layer(t)
+        values = _make_monotone(np.asarray(y, dtype=np.float64), monotonicity_indicator)
+        tables.append((knots, values, step))
+
+    n_knots = max(len(knots) for knots, _, _ in tables)
+    padded = [
+        _pad_table(knots, values, step, n_knots) for knots, values, step in tables
+    ]
+    return np.stack([k for k, _ in padded]), np.stack([v for _, v in padded])
+
+
+def _get_call_kwargs(model: tf.keras.Model) -> Dict[str, Dict[str, Any]]:
+    # keyword arguments of calls of TFOpLambda layers such as dtype of tf.cast
+    call_kwargs = {}
+    for layer_config in model.get_config()["layers"]:
+        inbound_nodes = layer_config["inbound_nodes"]
+        kwargs = {}
+        if len(inbound_nodes) > 0 and isinstance(inbound_nodes[0][0], str):
+            kwargs = inbound_nodes[0][3] if len(inbound_nodes[0]) > 3 else {}
+        call_kwargs[layer_config["name"]] = kwargs
+    return call_kwargs
+
+# %% ../../nbs/LookupTables.ipynb 16
+@export
+def compile_feature_branches(
+    model: tf.keras.Model,
+    x: Optional[Union[Dict[str, ArrayLike], List[ArrayLike]]] = None,
+    *,
+    n_points: int = 257,
+) -> tf.keras.Model:
+    """Replaces single-feature branches of the model with piecewise-linear lookup tables
+
+    Branches are `MonoDense` or `Dense` layers applied to single-column inputs and concatenated together,
+    or a `GroupedMonoDense` layer applied to single-column inputs, as built by `create_type_2`. All branches
+    preprocessing the features are replaced with a single `PiecewiseLinear` layer applied to concatenated
+    features. Tables of branches with `"relu"` or linear activations are exact, while other branches are
+    sampled on uniform grids spanning the ranges of the features in `x`. Tables of monotone branches are
+    guaranteed to be monotone.
+
+    The compiled model shares all other layers with the original model.
+
+    Args:
+        model: a trained model
+        x: data used to determine ranges of the features, required only for branches with activations
+            other than `"relu"` or linear
+        n_points: number of points of uniform grids
+
+    Returns:
+        The compiled model
+
+    Raise:
+        ValueError:
+            - if there are no single-feature branches in the model, or
+            - if `x` is not given for branches which must be sampled
+    """
+    found = _find_branches(model)
+    if len(found) == 0:
+        raise ValueError("There are no single-feature branches in the model.")
+
+    if x is not None and not isinstance(x, dict):
+        x = dict(zip(model.input_names, tf.nest.flatten(x)))
+
+    call_kwargs = _get_call_kwargs(model)
+    skipped = {branch.name for _, branches in found.values() for branch, _ in branches}
+
+    tensors: Dict[str, TensorLike] = {}
+    for layer, inbound in _get_layer_graph(model):
+        if layer.name in skipped and layer.name not in found:
+            continue
+        if isinstance(layer, InputLayer):
+            tensors[layer.name] = tf.keras.Input(
+                shape=layer.output_shape[0][1:], dtype=layer.dtype, name=layer.name
+            )
+        elif layer.name in found:
+            input_names, branches = found[layer.name]
+            xs = [None if x is None else np.asarray(x[name]) for name in input_names]
+            knots, values = _compile_branches(branches, xs, n_points)
+            y = tf.keras.layers.Concatenate(name=f"{layer.name}_inputs")(
+                [tensors[name] for name in input_names]
+            )
+            tensors[layer.name] = PiecewiseLinear(knots, values, name=layer.name)(y)
+        else:
+            inputs = [tensors[name] for name in inbound]
+            tensors[layer.name] = layer(
+                inputs if len(inputs) > 1 else inputs[0], **call_kwargs[layer.name]
+            )
+
+    inputs = tf.nest.pack_sequence_as(
+        model.input, [tensors[name] for name in model.input_names]
+    )
+    outputs = tf.nest.pack_sequence_as(
+        model.output, [tensors[name] for name in model.output_names]
+    )
+    return tf.keras.Model(inputs=inputs, outputs=outputs)
@@ -1,32 +1,80 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/MonoDenseLayer.ipynb.
 
 # %% auto 0
-__all__ = ['T', 'get_saturated_activation', 'get_activation_functions', 'apply_activations', 'get_monotonicity_indicator',
-           'apply_monotonicity_indicator_to_kernel', 'replace_kernel_using_monotonicity_indicator', 'MonoDense',
-           'create_type_1', 'create_type_2']
+__all__ = ['T', 'get_trace_counts', 'reset_trace_counts', 'get_saturated_activation', 'get_activation_functions',
+           'get_activation_selector', 'apply_activations', 'get_fused_activation_constants', 'apply_fused_activations',
+           'get_monotonicity_indicator', 'apply_monotonicity_indicator_to_kernel', 'replace_kernel',
+           'replace_kernel_using_monotonicity_indicator', 'MonoDense', 'create_type_1', 'GroupedMonoDense',
+           'create_type_2', 'EnsembleMonoDense', 'split_ensemble_outputs', 'freeze_monotone_model',
+           'unfreeze_monotone_model']
 
 # %% ../../nbs/MonoDenseLayer.ipynb 3
 from contextlib import contextmanager
 from datetime import datetime
 from functools import lru_cache
+from os import environ
 from typing import *
 
 import numpy as np
 import tensorflow as tf
 from numpy.typing import ArrayLike, NDArray
-from tensorflow.keras.layers import Concatenate, Dense, Dropout
+from tensorflow.keras.layers import Activation, Concatenate, Dense, Dropout
 from tensorflow.types.experimental import TensorLike
 
 from ..helpers import export
 
-# %% ../../nbs/MonoDenseLayer.ipynb 9
+# %% ../../nbs/MonoDenseLayer.ipynb 8
+_eager_profiling = environ.get("MONO_DENSE_KERAS_PROFILING", "0") == "1"
+
+
+@contextmanager
+def _profiling_scope(name: str) -> Generator[None, None, None]:
+    if not tf.executing_eagerly():
+        with tf.name_scope(name):
+            yield
+    elif _eager_profiling:
+        with tf.name_scope(name), tf.profiler.experimental.Trace(name):
+            yield
+    else:
+        yield
+
+
+_trace_counts: Dict[str, int] = {}
+
+
+def _count_trace(layer: tf.keras.layers.Layer) -> None:
+    # Python code of a call is executed only when executing eagerly or when it is being traced
+    if not tf.executing_eagerly():
+        name = type(layer).__name__
+        _trace_counts[name] = _trace_counts.get(name, 0) + 1
+
+
+@export
+def get_trace_counts() -> Dict[str, int]:
+    """Returns the number of times calls of monotonic layers were traced since the last reset
+
+    A call of a layer is traced when a functional model using it is built and every time a function calling it,
+    such as the train or predict function of a model, is traced or retraced. The number of traces is a
+    measure of the time spent in building graphs instead of computing.
+
+    Returns:
+        A dictionary mapping names of layer classes to the number of traced calls
+    """
+    return dict(_trace_counts)
+
+
+@export
+def reset_trace_counts() -> None:
+    """Resets the numbers of traced calls returned by `get_trace_counts`"""
+    _trace_counts.clear()
+
+# %% ../../nbs/MonoDenseLayer.ipynb 11
 def get_saturated_activation(
     convex_activation: Callable[[TensorLike], TensorLike],
     concave_activation: Callable[[TensorLike], TensorLike],
     a: float = 1.0,
     c: float = 1.0,
 ) -> Callable[[TensorLike], TensorLike]:
-    @tf.function
     def saturated_activation(
         x: TensorLike,
         convex_activation: Callable[[TensorLike], TensorLike] = convex_activation,
@@ -34,30 +82,42 @@ def get_saturated_activation(
         a: float = a,
         c: float = c,
     ) -> TensorLike:
-        cc = convex_activation(tf.ones_like(x) * c)
-        ccc = concave_activation(-tf.ones_like(x) * c)
+        cc = convex_activation(tf.cast(c, dtype=x.dtype))
         return a * tf.where(
             x <= 0,
             convex_activation(x + c) - cc,
             concave_activation(x - c) + cc,
         )
 
-    return saturated_activation  # type: ignore
+    return saturated_activation
 
 
-@lru_cache
-def get_activation_functions(
-    activation: Optional[Union[str, Callable[[TensorLike], TensorLike]]] = None
+def _get_activation_key(
+    activation: Optional[Union[str, Callable[[TensorLike], TensorLike]]]
+) -> Union[str, Callable[[TensorLike], TensorLike]]:
+    # names and built-in Keras activations share the same key, e.g. "ELU", "elu" and tf.keras.activations.elu
+    if activation is None:
+        return "linear"
+    if isinstance(activation, str):
+        return activation.lower()
+    name = getattr(activation, "__name__", None)
+    try:
+        builtin_activation = tf.keras.activations.get(name) if name else None
+    except ValueError:
+        builtin_activation = None
+    return name if builtin_activation is activation else activation  # type: ignore
+
+
+@lru_cache(maxsize=128)
+def _get_activation_functions(
+    activation_key: Union[str, Callable[[TensorLike], TensorLike]]
 ) -> Tuple[
     Callable[[TensorLike], TensorLike],
     Callable[[TensorLike], TensorLike],
     Callable[[TensorLike], TensorLike],
 ]:
-    convex_activation = tf.keras.activations.get(
-        activation.lower() if isinstance(activation, str) else activation
-    )
+    convex_activation = tf.keras.activations.get(activation_key)
 
-    @tf.function
     def concave_activation(x: TensorLike) -> TensorLike:
         return -convex_activation(-x)
 
@@ -66,23 +126,27 @@ def get_activation_functions(
     )
     return convex_activation, concave_activation, saturated_activation
 
-# %% ../../nbs/MonoDenseLayer.ipynb 13
-@tf.function
-def apply_activations(
-    x: TensorLike,
-    *,
+
+def get_activation_functions(
+    activation: Optional[Union[str, Callable[[TensorLike], TensorLike]]] = None
+) -> Tuple[
+    Callable[[TensorLike], TensorLike],
+    Callable[[TensorLike], TensorLike],
+    Callable[[TensorLike], TensorLike],
+]:
+    # all layers share the same functions for the same activation, so graphs and traces of functions
+    # calling them are not duplicated by the identity of the functions
+    return _get_activation_functions(_get_activation_key(activation))
+
+# %% ../../nbs/MonoDenseLayer.ipynb 15
+def get_activation_selector(
     units: int,
-    convex_activation: Callable[[TensorLike], TensorLike],
-    concave_activation: Callable[[TensorLike], TensorLike],
-    saturated_activation: Callable[[TensorLike], TensorLike],
+    *,
     is_convex: bool = False,
     is_concave: bool = False,
     activation_weights: Tuple[float, float, float] = (7.0, 7.0, 2.0),
-) -> TensorLike:
-    if convex_activation is None:
-        return x
-
-    elif is_convex:
+) -> Tuple[int, int, int]:
+    if is_convex:
         normalized_activation_weights = np.array([1.0, 0.0, 0.0])
     elif is_concave:
         normalized_activation_weights = np.array([0.0, 1.0, 0.0])
@@ -99,19 +163,101 @@ def apply_activations(
     s_concave = round(normalized_activation_weights[1] * units)
     s_saturated = units - s_convex - s_concave
 
-    x_convex, x_concave, x_saturated = tf.split(
-        x, (s_convex, s_concave, s_saturated), axis=-1
+    return s_convex, s_concave, s_saturated
+
+
+def apply_activations(
+    x: TensorLike,
+    *,
+    units: int,
+    convex_activation: Callable[[TensorLike], TensorLike],
+    concave_activation: Callable[[TensorLike], TensorLike],
+    saturated_activation: Callable[[TensorLike], TensorLike],
+    is_convex: bool = False,
+    is_concave: bool = False,
+    activation_weights: Tuple[float, float, float] = (7.0, 7.0, 2.0),
+) -> TensorLike:
+    if convex_activation is None:
+        return x
+
+    s_convex, s_concave, s_saturated = get_activation_selector(
+        units,
+        is_convex=is_convex,
+        is_concave=is_concave,
+        activation_weights=activation_weights,
     )
 
-    y_convex = convex_activation(x_convex)
-    y_concave = concave_activation(x_concave)
-    y_saturated = saturated_activation(x_saturated)
+    # activations of zero width are skipped, so no ops are added to the graph for them and
+    # a layer using a single type of activation needs neither split nor concat
+    parts = [
+        (name, f, s)
+        for name, f, s in [
+            ("convex_activation", convex_activation, s_convex),
+            ("concave_activation", concave_activation, s_concave),
+            ("saturated_activation", saturated_activation, s_saturated),
+        ]
+        if s > 0
+    ]
+    if len(parts) == 1:
+        name, f, _ = parts[0]
+        with _profiling_scope(name):
+            return f(x)
+
+    with _profiling_scope("split_activations"):
+        xs = tf.split(x, [s for _, _, s in parts], axis=-1)
 
-    y = tf.concat([y_convex, y_concave, y_saturated], axis=-1)
+    ys = []
+    for (name, f, _), x_part in zip(parts, xs):
+        with _profiling_scope(name):
+            ys.append(f(x_part))
+
+    with _profiling_scope("concat_activations"):
+        y = tf.concat(ys, axis=-1)
 
     return y
 
-# %% ../../nbs/MonoDenseLayer.ipynb 17
+# %% ../../nbs/MonoDenseLayer.ipynb 20
+def get_fused_activation_constants(
+    activation_selector: Tuple[int, int, int],
+    *,
+    convex_activation: Callable[[TensorLike], TensorLike],
+    c: float = 1.0,
+) -> Tuple[NDArray[np.float32], NDArray[np.float32], NDArray[np.float32]]:
+    s_convex, s_concave, s_saturated = activation_selector
+
+    sign = np.array([1.0] * s_convex + [-1.0] * s_concave + [0.0] * s_saturated)
+    saturated = np.array([0.0] * (s_convex + s_concave) + [1.0] * s_saturated)
+
+    # saturation constants are computed only once and not on every call
+    with tf.init_scope():
+        cc = float(convex_activation(tf.constant(c, dtype="float32")))
+
+    return (
+        sign.astype(np.float32),
+        (saturated * c).astype(np.float32),
+        (saturated * cc).astype(np.float32),
+    )
+
+
+def apply_fused_activations(
+    x: TensorLike,
+    *,
+    convex_activation: Callable[[TensorLike], TensorLike],
+    sign: ArrayLike,
+    offset: ArrayLike,
+    shift: ArrayLike,
+) -> TensorLike:
+    with _profiling_scope("fused_activations"):
+        sign = tf.cast(sign, dtype=x.dtype)
+        offset = tf.cast(offset, dtype=x.dtype)
+        shift = tf.cast(shift, dtype=x.dtype)
+
+        # units with zero sign are saturated, their sign depends on the sign of the input
+        sign = tf.where(sign == 0, 2 * tf.cast(x <= 0, dtype=x.dtype) - 1, sign)
+
+        return sign * (convex_activation(sign * x + offset) - shift)
+
+# %% ../../nbs/MonoDenseLayer.ipynb 25
 def get_monotonicity_indicator(
     monotonicity_indicator: ArrayLike,
     *,
@@ -127,9 +273,12 @@ def get_monotonicity_indicator(
             f"monotonicity_indicator has rank greater than 2: {monotonicity_indicator.shape}"
         )
 
-    monotonicity_indicator_broadcasted = np.broadcast_to(
-        monotonicity_indicator, shape=(input_shape[-1], units)
-    )
+    # the indicator is checked against the shape of the kernel without broadcasting it
+    n_rows, n_columns = monotonicity_indicator.shape
+    if n_rows not in [1, input_shape[-1]] or n_columns not in [1, units]:
+        raise ValueError(
+            f"monotonicity_indicator of the shape {monotonicity_indicator.shape} cannot be broadcast to the shape of the kernel {(input_shape[-1], units)}"
+        )
 
     if not np.all(
         (monotonicity_indicator == -1)
@@ -141,45 +290,93 @@ def get_monotonicity_indicator(
         )
     return monotonicity_indicator
 
-# %% ../../nbs/MonoDenseLayer.ipynb 21
+# %% ../../nbs/MonoDenseLayer.ipynb 29
 def apply_monotonicity_indicator_to_kernel(
     kernel: tf.Variable,
     monotonicity_indicator: ArrayLike,
 ) -> TensorLike:
+    if not tf.is_tensor(monotonicity_indicator):
+        values = np.unique(monotonicity_indicator)
+        # the same indicator for the whole kernel needs a single elementwise op
+        if len(values) == 1:
+            if values[0] == 0:
+                return tf.convert_to_tensor(kernel)
+            return tf.abs(kernel) if values[0] > 0 else -tf.abs(kernel)
+
     # convert to tensor if needed and make it broadcastable to the kernel
     monotonicity_indicator = tf.convert_to_tensor(monotonicity_indicator)
-
-    # absolute value of the kernel
+    # variables are autocasted when using mixed precision, so the dtype is taken from the value read
     abs_kernel = tf.abs(kernel)
+    sign = tf.cast(monotonicity_indicator, dtype=abs_kernel.dtype)
 
-    # replace original kernel values for positive or negative ones where needed
-    xs = tf.where(
-        monotonicity_indicator == 1,
-        abs_kernel,
-        kernel,
-    )
-    xs = tf.where(monotonicity_indicator == -1, -abs_kernel, xs)
-
-    return xs
+    # replace original kernel values for positive or negative ones where needed in a single pass
+    return tf.where(monotonicity_indicator == 0, kernel, sign * abs_kernel)
 
 
 @contextmanager
-def replace_kernel_using_monotonicity_indicator(
+def replace_kernel(
     layer: tf.keras.layers.Dense,
-    monotonicity_indicator: TensorLike,
+    kernel: TensorLike,
 ) -> Generator[None, None, None]:
     old_kernel = layer.kernel
 
-    layer.kernel = apply_monotonicity_indicator_to_kernel(
-        layer.kernel, monotonicity_indicator
-    )
+    layer.kernel = kernel
     try:
         yield
     finally:
         layer.kernel = old_kernel
 
-# %% ../../nbs/MonoDenseLayer.ipynb 29
-@export
+
+# kept for backward compatibility, `MonoDense.call` does not use it
+@contextmanager
+def replace_kernel_using_monotonicity_indicator(
+    layer: tf.keras.layers.Dense,
+    monotonicity_indicator: TensorLike,
+) -> Generator[None, None, None]:
+    with replace_kernel(
+        layer,
+        apply_monotonicity_indicator_to_kernel(layer.kernel, monotonicity_indicator),
+    ):
+        yield
+
+# %% ../../nbs/MonoDenseLayer.ipynb 34
+def _get_constrained_rows(
+    monotonicity_indicator: NDArray, *, input_dim: int
+) -> Optional[Tuple[NDArray, NDArray]]:
+    # indices of constrained rows and their signs, or None if the kernel should not be partitioned
+    if monotonicity_indicator.shape[1] != 1:
+        return None
+
+    indicator = np.broadcast_to(monotonicity_indicator[:, 0], (input_dim,))
+    rows = np.flatnonzero(indicator)
+    if 2 * len(rows) > input_dim:
+        return None
+
+    return rows.astype(np.int32), indicator[rows].reshape(-1, 1).astype(np.float32)
+
+# %% ../../nbs/MonoDenseLayer.ipynb 39
+def _serialize_activation(
+    activation: Optional[Union[str, Callable[[TensorLike], TensorLike]]]
+) -> Optional[Union[str, Dict[str, Any]]]:
+    # names of activations are stored as they are, so they are passed to get_activation_functions unchanged
+    if activation is None or isinstance(activation, str):
+        return activation
+    return tf.keras.activations.serialize(activation)  # type: ignore
+
+
+def _deserialize_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    config = dict(config)
+    if isinstance(config.get("activation"), dict):
+        config["activation"] = tf.keras.activations.deserialize(config["activation"])
+    return config
+
+
+def _to_list(x: Any) -> Any:
+    return x.tolist() if isinstance(x, np.ndarray) else x
+
+
+# the module is not replaced by `export`, Keras imports it when loading saved models
+@tf.keras.utils.register_keras_serializable(package="mono_dense_keras")
 class MonoDense(Dense):
     """Monotonic counterpart of the regular Dense Layer of tf.keras
 
@@ -202,6 +399,8 @@ class MonoDense(Dense):
 
     """
 
+    trainable: bool
+
     def __init__(
         self,
         units: int,
@@ -211,6 +410,7 @@ class MonoDense(Dense):
         is_convex: bool = False,
         is_concave: bool = False,
         activation_weights: Tuple[float, float, float] = (7.0, 7.0, 2.0),
+        fuse_activations: bool = False,
         **kwargs: Any,
     ):
         """Constructs a new MonoDense instance.
@@ -226,6 +426,9 @@ class MonoDense(Dense):
             is_concave: concave if set to True
             activation_weights: relative weights for each type of activation, the default is (1.0, 1.0, 1.0).
                 Ignored if is_convex or is_concave is set to True
+            fuse_activations: if set to True, all three types of activations are applied in a single elementwise
+                pass using constants precomputed in `build` instead of splitting the output into three parts. This
+                is typically faster only when compiled with XLA.
             **kwargs: passed as kwargs to the constructor of `Dense`
 
         Raise:
@@ -256,6 +459,7 @@ class MonoDense(Dense):
         self.monotonicity_indicator = monotonicity_indicator
         self.is_convex = is_convex
         self.is_concave = is_concave
+        self.fuse_activations = fuse_activations
 
         (
             self.convex_activation,
@@ -263,6 +467,10 @@ class MonoDense(Dense):
             self.saturated_activation,
         ) = get_activation_functions(self.org_activation)
 
+        self.frozen_kernel: Optional[TensorLike] = None
+        self._trainable_before_freeze: Optional[bool] = None
+        self._constrained_rows: Optional[Tuple[NDArray, NDArray]] = None
+
     def build(self, input_shape: Tuple, *args: List[Any], **kwargs: Any) -> None:
         """Build
 
@@ -277,10 +485,27 @@ class MonoDense(Dense):
             input_shape=input_shape,
             units=self.units,
         )
+        self._constrained_rows = _get_constrained_rows(
+            np.asarray(self.monotonicity_indicator),
+            input_dim=tf.TensorShape(input_shape)[-1],
+        )
+        self.activation_selector = get_activation_selector(
+            self.units,
+            is_convex=self.is_convex,
+            is_concave=self.is_concave,
+            activation_weights=self.activation_weights,
+        )
+        if self.fuse_activations:
+            self._fused_activation_constants = get_fused_activation_constants(
+                self.activation_selector, convex_activation=self.convex_activation
+            )
 
     def call(self, inputs: TensorLike) -> TensorLike:
         """Call
 
+        Sparse and ragged inputs are multiplied by `Dense.call` with the kernel temporarily replaced
+        using `replace_kernel`, such calls modify the layer and cannot be compiled with XLA.
+
         Args:
             inputs: input tensor of shape (batch_size, ..., x_length)
 
@@ -288,11 +513,59 @@ class MonoDense(Dense):
             N-D tensor with shape: `(batch_size, ..., units)`.
 
         """
-        # calculate W'*x+y after we replace the kernal according to monotonicity vector
-        with replace_kernel_using_monotonicity_indicator(
-            self, monotonicity_indicator=self.monotonicity_indicator
-        ):
-            h = super(MonoDense, self).call(inputs)
+        _count_trace(self)
+
+        is_sparse_or_ragged = isinstance(inputs, (tf.SparseTensor, tf.RaggedTensor))
+        # the kernel is replaced according to monotonicity vector without modifying the layer, so
+        # the call has no side effects and can be compiled with XLA
+        constrained_rows = (
+            self._constrained_rows
+            if self.frozen_kernel is None and not is_sparse_or_ragged
+            else None
+        )
+        with _profiling_scope("constrained_kernel"):
+            if self.frozen_kernel is not None:
+                kernel = self.frozen_kernel
+            elif constrained_rows is not None:
+                # only constrained rows are replaced, see _get_constrained_rows
+                rows, signs = constrained_rows
+                kernel = self.kernel
+                constrained_kernel = tf.gather(self.kernel, rows)
+                signs = tf.cast(signs, dtype=constrained_kernel.dtype)
+                correction = tf.cast(
+                    signs * tf.abs(constrained_kernel) - constrained_kernel,
+                    dtype=self._compute_dtype_object,
+                )
+            else:
+                kernel = apply_monotonicity_indicator_to_kernel(
+                    self.kernel, self.monotonicity_indicator
+                )
+            # frozen kernel is stored in the variable dtype and must be cast when using mixed precision
+            kernel = tf.cast(kernel, dtype=self._compute_dtype_object)
+
+        # calculate W'*x+y
+        with _profiling_scope("matmul"):
+            if is_sparse_or_ragged:
+                with replace_kernel(self, kernel):
+                    h = super(MonoDense, self).call(inputs)
+            else:
+                if inputs.dtype.base_dtype != self._compute_dtype_object.base_dtype:
+                    inputs = tf.cast(inputs, dtype=self._compute_dtype_object)
+                h = self._matmul(inputs, kernel)
+                if constrained_rows is not None and len(rows) > 0:
+                    h = h + self._matmul(tf.gather(inputs, rows, axis=-1), correction)
+                if self.use_bias:
+                    h = tf.nn.bias_add(h, self.bias)
+
+        if self.fuse_activations:
+            sign, offset, shift = self._fused_activation_constants
+            return apply_fused_activations(
+                h,
+                convex_activation=self.convex_activation,
+                sign=sign,
+                offset=offset,
+                shift=shift,
+            )
 
         y = apply_activations(
             h,
@@ -307,7 +580,87 @@ class MonoDense(Dense):
 
         return y
 
-# %% ../../nbs/MonoDenseLayer.ipynb 33
+    def _matmul(self, inputs: TensorLike, kernel: TensorLike) -> TensorLike:
+        rank = inputs.shape.rank
+        if rank == 2 or rank is None:
+            return tf.matmul(inputs, kernel)
+
+        h = tf.tensordot(inputs, kernel, [[rank - 1], [0]])
+        if not tf.executing_eagerly():
+            h.set_shape(inputs.shape[:-1].concatenate([self.units]))
+        return h
+
+    def freeze(self) -> None:
+        """Freezes the layer for inference
+
+        The kernel with the monotonicity indicator applied to it is computed once and stored as a constant,
+        which is then used in all subsequent calls instead of recomputing it from the kernel on every call.
+        The layer is set to be non-trainable because updates of the kernel are ignored while the layer is
+        frozen. Use `unfreeze` before resuming training.
+
+        Raise:
+            ValueError: if the layer is not built
+        """
+        if not self.built:
+            raise ValueError(f"Layer '{self.name}' must be built before freezing it.")
+
+        self.frozen_kernel = tf.constant(
+            apply_monotonicity_indicator_to_kernel(
+                self.kernel, self.monotonicity_indicator
+            )
+        )
+        if self._trainable_before_freeze is None:
+            self._trainable_before_freeze = self.trainable
+        self.trainable = False
+
+    def unfreeze(self) -> None:
+        """Unfreezes the layer frozen by `freeze` and restores its trainable flag"""
+        self.frozen_kernel = None
+        if self._trainable_before_freeze is not None:
+            self.trainable = self._trainable_before_freeze
+            self._trainable_before_freeze = None
+
+    def get_config(self) -> Dict[str, Any]:
+        """Returns the config of the layer
+
+        The monotonicity indicator is stored as a list of the same shape as the one used in the layer, so the
+        layer can be recreated from the config without access to the code that created it.
+
+        Returns:
+            The config of the layer
+        """
+        return {
+            **super(MonoDense, self).get_config(),
+            "activation": _serialize_activation(self.org_activation),
+            "monotonicity_indicator": _to_list(self.monotonicity_indicator),
+            "is_convex": self.is_convex,
+            "is_concave": self.is_concave,
+            "activation_weights": list(self.activation_weights),
+            "fuse_activations": self.fuse_activations,
+        }
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "MonoDense":
+        """Creates a layer from its config
+
+        Args:
+            config: config returned by `get_config`
+
+        Returns:
+            A new instance of the layer
+        """
+        return cls(**_deserialize_config(config))
+
+# %% ../../nbs/MonoDenseLayer.ipynb 50
+def _cast_to_variable_dtype(y: TensorLike) -> TensorLike:
+    # when using mixed precision, outputs are cast to the variable dtype (usually float32)
+    # before applying the final activation for numerical stability
+    dtype = tf.keras.mixed_precision.global_policy().variable_dtype
+    if y.dtype != dtype:
+        y = tf.cast(y, dtype=dtype)
+    return y
+
+
 def _create_mono_block(
     *,
     units: List[int],
@@ -316,6 +669,8 @@ def _create_mono_block(
     is_convex: bool = False,
     is_concave: bool = False,
     dropout: Optional[float] = None,
+    n_members: Optional[int] = None,
+    shared_inputs: bool = True,
 ) -> Callable[[TensorLike], TensorLike]:
     def create_mono_block_inner(
         x: TensorLike,
@@ -331,7 +686,7 @@ def _create_mono_block(
 
         y = x
         for i in range(len(units)):
-            y = MonoDense(
+            kwargs: Dict[str, Any] = dict(
                 units=units[i],
                 activation=activation if i < len(units) - 1 else None,
                 monotonicity_indicator=monotonicity_indicator if i == 0 else 1,
@@ -341,7 +696,16 @@ def _create_mono_block(
                 + ("_increasing" if i != 0 else "")
                 + ("_convex" if is_convex else "")
                 + ("_concave" if is_concave else ""),
-            )(y)
+            )
+            if n_members is None:
+                y = MonoDense(**kwargs)(y)
+            else:
+                # only the first layer can use inputs shared by all members
+                y = EnsembleMonoDense(
+                    n_members=n_members,
+                    shared_inputs=shared_inputs and i == 0,
+                    **kwargs,
+                )(y)
             if (i < len(units) - 1) and dropout:
                 y = Dropout(dropout)(y)
 
@@ -349,7 +713,7 @@ def _create_mono_block(
 
     return create_mono_block_inner
 
-# %% ../../nbs/MonoDenseLayer.ipynb 35
+# %% ../../nbs/MonoDenseLayer.ipynb 52
 T = TypeVar("T")
 
 
@@ -391,7 +755,7 @@ def _prepare_mono_input_n_param(
 
     return inputs, param, sorted_feature_names
 
-# %% ../../nbs/MonoDenseLayer.ipynb 43
+# %% ../../nbs/MonoDenseLayer.ipynb 60
 def _check_convexity_params(
     monotonicity_indicator: List[int],
     is_convex: List[bool],
@@ -414,7 +778,7 @@ def _check_convexity_params(
 
     return has_convex, has_concave
 
-# %% ../../nbs/MonoDenseLayer.ipynb 46
+# %% ../../nbs/MonoDenseLayer.ipynb 63
 @export
 def create_type_1(
     inputs: Union[TensorLike, Dict[str, TensorLike], List[TensorLike]],
@@ -428,6 +792,7 @@ def create_type_1(
     is_convex: Union[bool, Dict[str, bool], List[bool]] = False,
     is_concave: Union[bool, Dict[str, bool], List[bool]] = False,
     dropout: Optional[float] = None,
+    n_members: Optional[int] = None,
 ) -> TensorLike:
     """Builds Type-1 monotonic network
 
@@ -458,6 +823,8 @@ def create_type_1(
         is_convex: set to True if a particular input feature is convex
         is_concave: set to True if a particular inputs feature is concave
         dropout: dropout rate. If set to float greater than 0, Dropout layers are inserted after hidden layers.
+        n_members: if set, an ensemble of **n_members** independently initialized networks is built from
+            `EnsembleMonoDense` layers and their outputs are stacked along the second to last axis
 
     Returns:
         Output tensor
@@ -481,14 +848,319 @@ def create_type_1(
         is_convex=has_convex,
         is_concave=has_concave and not has_convex,
         dropout=dropout,
+        n_members=n_members,
     )(y)
 
+    y = _cast_to_variable_dtype(y)
     if final_activation is not None:
         y = tf.keras.activations.get(final_activation)(y)
 
     return y
 
-# %% ../../nbs/MonoDenseLayer.ipynb 51
+# %% ../../nbs/MonoDenseLayer.ipynb 67
+def _broadcast_group_param(
+    param: Union[T, List[T]], *, n_groups: int, name: str
+) -> List[T]:
+    if isinstance(param, (list, tuple)):
+        if len(param) != n_groups:
+            raise ValueError(
+                f"Length of {name} must be equal to the number of inputs ({n_groups}), but it is: {param}"
+            )
+        return list(param)
+    return [param] * n_groups
+
+
+def _initialize_stacked(
+    initializer: tf.keras.initializers.Initializer,
+    shape: Tuple[int, ...],
+    dtype: Optional[tf.DType] = None,
+) -> TensorLike:
+    # each slice along the first axis is initialized as a separate Dense weight, so fan-in and fan-out do
+    # not depend on the number of slices
+    config = initializer.get_config()
+    values = []
+    for i in range(shape[0]):
+        # instances of initializers return the same values when called more than once, so a new
+        # instance with a different seed (if any) is used for each slice
+        slice_config = dict(config)
+        if slice_config.get("seed") is not None:
+            slice_config["seed"] += i
+        values.append(
+            initializer.__class__.from_config(slice_config)(shape[1:], dtype=dtype)
+        )
+    return tf.stack(values)
+
+
+@tf.keras.utils.register_keras_serializable(package="mono_dense_keras")
+class GroupedMonoDense(tf.keras.layers.Layer):
+    """Applies a separate monotonic dense layer to each of the inputs in a single operation
+
+    The layer is equivalent to a list of `MonoDense` layers, one for each of the inputs, with their
+    outputs concatenated along the last axis. Kernels of all of them are stored in a single variable of
+    shape `(n_groups, input_dim, units)` and applied using a single batched matrix multiplication, so the
+    size of the graph does not depend on the number of inputs.
+    """
+
+    trainable: bool
+
+    def __init__(
+        self,
+        units: int,
+        *,
+        activation: Optional[Union[str, Callable[[TensorLike], TensorLike]]] = None,
+        monotonicity_indicator: Union[int, List[int]] = 1,
+        is_convex: Union[bool, List[bool]] = False,
+        is_concave: Union[bool, List[bool]] = False,
+        activation_weights: Tuple[float, float, float] = (7.0, 7.0, 2.0),
+        use_bias: bool = True,
+        kernel_initializer: Union[str, Callable[..., TensorLike]] = "glorot_uniform",
+        bias_initializer: Union[str, Callable[..., TensorLike]] = "zeros",
+        **kwargs: Any,
+    ):
+        """Constructs a new GroupedMonoDense instance.
+
+        Params:
+            units: Positive integer, dimensionality of the output space of each group.
+            activation: Activation function to use, it is assumed to be convex monotonically
+                increasing function such as "relu" or "elu"
+            monotonicity_indicator: Monotonicity indicator of each of the inputs (1 for monotonically increasing,
+                -1 for monotonically decreasing and 0 for non-monotonic). If int, all inputs have the same indicator.
+            is_convex: convex if set to True, either for all inputs or for each of them
+            is_concave: concave if set to True, either for all inputs or for each of them
+            activation_weights: relative weights for each type of activation, used for inputs which are neither
+                convex nor concave
+            use_bias: whether the layer uses a bias vector
+            kernel_initializer: initializer of the kernel of each of the groups
+            bias_initializer: initializer of the bias vector
+            **kwargs: passed as kwargs to the constructor of `Layer`
+
+        Raise:
+            ValueError: if any component of activation_weights is negative or there is not exactly three components
+        """
+        if len(activation_weights) != 3:
+            raise ValueError(
+                f"There must be exactly three components of activation_weights, but we have this instead: {activation_weights}."
+            )
+
+        if (np.array(activation_weights) < 0).any():
+            raise ValueError(
+                f"Values of activation_weights must be non-negative, but we have this instead: {activation_weights}."
+            )
+
+        super(GroupedMonoDense, self).__init__(**kwargs)
+
+        self.units = units
+        self.org_activation = activation
+        self.activation_weights = activation_weights
+        self.monotonicity_indicator: ArrayLike = monotonicity_indicator
+        self.is_convex = is_convex
+        self.is_concave = is_concave
+        self.use_bias = use_bias
+        self.kernel_initializer = tf.keras.initializers.get(kernel_initializer)
+        self.bias_initializer = tf.keras.initializers.get(bias_initializer)
+
+        self.convex_activation, _, _ = get_activation_functions(self.org_activation)
+
+        self.frozen_kernel: Optional[TensorLike] = None
+        self._trainable_before_freeze: Optional[bool] = None
+
+    def _group_kernel_initializer(
+        self, shape: Tuple[int, int, int], dtype: Optional[tf.DType] = None
+    ) -> TensorLike:
+        return _initialize_stacked(self.kernel_initializer, shape, dtype=dtype)
+
+    def build(self, input_shape: List[Tuple], *args: List[Any], **kwargs: Any) -> None:
+        """Build
+
+        Args:
+            input_shape: list of shapes of input tensors, all of them must have the same shape
+            args: not used
+            kwargs: not used
+
+        Raise:
+            ValueError:
+                - if inputs are not a list of tensors with the same shape,
+                - if any of the parameters given per input has the wrong length, or
+                - if both **is_concave** and **is_convex** are set to **True** for the same input
+        """
+        if not isinstance(input_shape, (list, tuple)) or not all(
+            isinstance(s, (list, tuple, tf.TensorShape)) for s in input_shape
+        ):
+            raise ValueError(
+                f"GroupedMonoDense must be called on a list of tensors, but it was called on: {input_shape}"
+            )
+        input_shapes = [tuple(tf.TensorShape(s).as_list()) for s in input_shape]
+        if len(set(s[1:] for s in input_shapes)) != 1:
+            raise ValueError(
+                f"All inputs of GroupedMonoDense must have the same shape, but they have: {input_shapes}"
+            )
+
+        self.n_groups = len(input_shapes)
+        input_dim = input_shapes[0][-1]
+
+        monotonicity_indicator = np.array(
+            _broadcast_group_param(
+                self.monotonicity_indicator,
+                n_groups=self.n_groups,
+                name="monotonicity_indicator",
+            )
+        )
+        if not np.all(np.isin(monotonicity_indicator, [-1, 0, 1])):
+            raise ValueError(
+                f"Each element of monotonicity_indicator must be one of -1, 0, 1, but it is: '{monotonicity_indicator}'"
+            )
+        # broadcastable to the kernel of shape (n_groups, input_dim, units)
+        self.monotonicity_indicator = monotonicity_indicator.reshape((-1, 1, 1))
+
+        is_convex = _broadcast_group_param(
+            self.is_convex, n_groups=self.n_groups, name="is_convex"
+        )
+        is_concave = _broadcast_group_param(
+            self.is_concave, n_groups=self.n_groups, name="is_concave"
+        )
+        ix = [i for i in range(self.n_groups) if is_convex[i] and is_concave[i]]
+        if len(ix) > 0:
+            raise ValueError(f"Inputs both convex and concave: {ix}")
+        self.activation_selectors = [
+            get_activation_selector(
+                self.units,
+                is_convex=is_convex[i],
+                is_concave=is_concave[i],
+                activation_weights=self.activation_weights,
+            )
+            for i in range(self.n_groups)
+        ]
+        constants = [
+            get_fused_activation_constants(
+                activation_selector, convex_activation=self.convex_activation
+            )
+            for activation_selector in self.activation_selectors
+        ]
+        self._fused_activation_constants = tuple(
+            np.concatenate([c[i] for c in constants]) for i in range(3)
+        )
+
+        self.kernel = self.add_weight(
+            "kernel",
+            shape=(self.n_groups, input_dim, self.units),
+            initializer=self._group_kernel_initializer,
+            trainable=True,
+        )
+        if self.use_bias:
+            self.bias = self.add_weight(
+                "bias",
+                shape=(self.n_groups, self.units),
+                initializer=self.bias_initializer,
+                trainable=True,
+            )
+        else:
+            self.bias = None
+
+        self.built = True
+
+    def call(self, inputs: List[TensorLike]) -> TensorLike:
+        """Call
+
+        Args:
+            inputs: list of input tensors of shape (batch_size, ..., x_length)
+
+        Returns:
+            N-D tensor with shape: `(batch_size, ..., n_groups * units)`.
+        """
+        _count_trace(self)
+
+        with _profiling_scope("constrained_kernel"):
+            kernel = (
+                self.frozen_kernel
+                if self.frozen_kernel is not None
+                else apply_monotonicity_indicator_to_kernel(
+                    self.kernel, self.monotonicity_indicator
+                )
+            )
+            kernel = tf.cast(kernel, dtype=self._compute_dtype_object)
+
+        with _profiling_scope("matmul"):
+            x = tf.stack(inputs, axis=-2)
+            h = tf.einsum("...gi,giu->...gu", x, kernel)
+            if self.use_bias:
+                h = h + self.bias
+            h = tf.reshape(
+                h,
+                tf.concat([tf.shape(h)[:-2], [self.n_groups * self.units]], axis=0),
+            )
+
+        sign, offset, shift = self._fused_activation_constants
+        return apply_fused_activations(
+            h,
+            convex_activation=self.convex_activation,
+            sign=sign,
+            offset=offset,
+            shift=shift,
+        )
+
+    def freeze(self) -> None:
+        """Freezes the layer for inference, see `MonoDense.freeze` for details
+
+        Raise:
+            ValueError: if the layer is not built
+        """
+        if not self.built:
+            raise ValueError(f"Layer '{self.name}' must be built before freezing it.")
+
+        self.frozen_kernel = tf.constant(
+            apply_monotonicity_indicator_to_kernel(
+                self.kernel, self.monotonicity_indicator
+            )
+        )
+        if self._trainable_before_freeze is None:
+            self._trainable_before_freeze = self.trainable
+        self.trainable = False
+
+    def unfreeze(self) -> None:
+        """Unfreezes the layer frozen by `freeze` and restores its trainable flag"""
+        self.frozen_kernel = None
+        if self._trainable_before_freeze is not None:
+            self.trainable = self._trainable_before_freeze
+            self._trainable_before_freeze = None
+
+    def get_config(self) -> Dict[str, Any]:
+        """Returns the config of the layer, see `MonoDense.get_config` for details
+
+        Returns:
+            The config of the layer
+        """
+        monotonicity_indicator = self.monotonicity_indicator
+        if isinstance(monotonicity_indicator, np.ndarray):
+            # stored per group in the shape broadcastable to the kernel
+            monotonicity_indicator = monotonicity_indicator.reshape(-1)
+        return {
+            **super(GroupedMonoDense, self).get_config(),
+            "units": self.units,
+            "activation": _serialize_activation(self.org_activation),
+            "monotonicity_indicator": _to_list(monotonicity_indicator),
+            "is_convex": self.is_convex,
+            "is_concave": self.is_concave,
+            "activation_weights": list(self.activation_weights),
+            "use_bias": self.use_bias,
+            "kernel_initializer": tf.keras.initializers.serialize(
+                self.kernel_initializer
+            ),
+            "bias_initializer": tf.keras.initializers.serialize(self.bias_initializer),
+        }
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "GroupedMonoDense":
+        """Creates a layer from its config
+
+        Args:
+            config: config returned by `get_config`
+
+        Returns:
+            A new instance of the layer
+        """
+        return cls(**_deserialize_config(config))
+
+# %% ../../nbs/MonoDenseLayer.ipynb 75
 @export
 def create_type_2(
     inputs: Union[TensorLike, Dict[str, TensorLike], List[TensorLike]],
@@ -503,6 +1175,8 @@ def create_type_2(
     is_convex: Union[bool, Dict[str, bool], List[bool]] = False,
     is_concave: Union[bool, Dict[str, bool], List[bool]] = False,
     dropout: Optional[float] = None,
+    grouped: bool = False,
+    n_members: Optional[int] = None,
 ) -> TensorLike:
     """Builds Type-2 monotonic network
 
@@ -536,11 +1210,21 @@ def create_type_2(
         is_convex: set to True if a particular input feature is convex
         is_concave: set to True if a particular inputs feature is concave
         dropout: dropout rate. If set to float greater than 0, Dropout layers are inserted after hidden layers.
+        grouped: if set to True, all input features are preprocessed by a single `GroupedMonoDense` layer instead of
+            a separate `MonoDense` or `Dense` layer for each of them. All input features must have the same shape.
+        n_members: if set, an ensemble of **n_members** independently initialized networks is built from
+            `EnsembleMonoDense` layers and their outputs are stacked along the second to last axis
 
     Returns:
         Output tensor
 
+    Raise:
+        ValueError: if both **grouped** and **n_members** are set
+
     """
+    if grouped and n_members is not None:
+        raise ValueError("Grouped layers cannot be used in ensembles.")
+
     _, is_convex, _ = _prepare_mono_input_n_param(inputs, is_convex)
     _, is_concave, _ = _prepare_mono_input_n_param(inputs, is_concave)
     x, monotonicity_indicator, names = _prepare_mono_input_n_param(
@@ -553,30 +1237,75 @@ def create_type_2(
     if input_units is None:
         input_units = max(units // 4, 1)
 
-    y = [
-        (
-            MonoDense(
+    if n_members is not None:
+        # non-monotonic features are preprocessed by layers equivalent to Dense layers, see below
+        y = [
+            EnsembleMonoDense(
                 units=input_units,
+                n_members=n_members,
+                shared_inputs=True,
                 activation=activation,
                 monotonicity_indicator=monotonicity_indicator[i],
-                is_convex=is_convex[i],
-                is_concave=is_concave[i],
+                is_convex=is_convex[i] or monotonicity_indicator[i] == 0,
+                is_concave=is_concave[i] and monotonicity_indicator[i] != 0,
                 name=f"mono_dense_{names[i]}"
-                + ("_increasing" if monotonicity_indicator[i] == 1 else "_decreasing")
+                + {1: "_increasing", -1: "_decreasing", 0: ""}[
+                    monotonicity_indicator[i]
+                ]
                 + ("_convex" if is_convex[i] else "")
                 + ("_concave" if is_concave[i] else ""),
-            )
-            if monotonicity_indicator[i] != 0
-            else (
-                Dense(
-                    units=input_units, activation=activation, name=f"dense_{names[i]}"
+            )(x[i])
+            for i in range(len(inputs))
+        ]
+
+        y = tf.keras.layers.Concatenate(name="preprocessed_features")(y)
+    elif grouped:
+        # non-monotonic features are preprocessed by Dense layers, which are equivalent
+        # to convex MonoDense layers with the monotonicity indicator set to 0
+        y = GroupedMonoDense(
+            units=input_units,
+            activation=activation,
+            monotonicity_indicator=monotonicity_indicator,
+            is_convex=[
+                is_convex[i] or monotonicity_indicator[i] == 0 for i in range(len(x))
+            ],
+            is_concave=[
+                is_concave[i] and monotonicity_indicator[i] != 0 for i in range(len(x))
+            ],
+            name="preprocessed_features",
+        )(x)
+    else:
+        y = [
+            (
+                MonoDense(
+                    units=input_units,
+                    activation=activation,
+                    monotonicity_indicator=monotonicity_indicator[i],
+                    is_convex=is_convex[i],
+                    is_concave=is_concave[i],
+                    name=f"mono_dense_{names[i]}"
+                    + (
+                        "_increasing"
+                        if monotonicity_indicator[i] == 1
+                        else "_decreasing"
+                    )
+                    + ("_convex" if is_convex[i] else "")
+                    + ("_concave" if is_concave[i] else ""),
                 )
-            )
-        )(x[i])
-        for i in range(len(inputs))
-    ]
+                if monotonicity_indicator[i] != 0
+                else (
+                    Dense(
+                        units=input_units,
+                        activation=activation,
+                        name=f"dense_{names[i]}",
+                    )
+                )
+            )(x[i])
+            for i in range(len(inputs))
+        ]
+
+        y = Concatenate(name="preprocessed_features")(y)
 
-    y = Concatenate(name="preprocessed_features")(y)
     monotonicity_indicator_block: List[int] = sum(
         [[abs(x)] * input_units for x in monotonicity_indicator], []
     )
@@ -588,9 +1317,343 @@ def create_type_2(
         is_convex=has_convex,
         is_concave=has_concave and not has_convex,
         dropout=dropout,
+        n_members=n_members,
+        shared_inputs=False,
     )(y)
 
+    y = _cast_to_variable_dtype(y)
     if final_activation is not None:
         y = tf.keras.activations.get(final_activation)(y)
 
     return y
+
+# %% ../../nbs/MonoDenseLayer.ipynb 81
+@tf.keras.utils.register_keras_serializable(package="mono_dense_keras")
+class EnsembleMonoDense(tf.keras.layers.Layer):
+    """Applies `n_members` independent monotonic dense layers in a single operation
+
+    The layer is equivalent to a list of `MonoDense` layers with the same parameters but different weights,
+    one for each member of the ensemble, with their outputs stacked along the second to last axis. Kernels and
+    biases of all of them are stored in single variables of shapes `(n_members, input_dim, units)` and
+    `(n_members, units)`, respectively.
+    """
+
+    trainable: bool
+
+    def __init__(
+        self,
+        units: int,
+        *,
+        n_members: int,
+        shared_inputs: bool = False,
+        activation: Optional[Union[str, Callable[[TensorLike], TensorLike]]] = None,
+        monotonicity_indicator: ArrayLike = 1,
+        is_convex: bool = False,
+        is_concave: bool = False,
+        activation_weights: Tuple[float, float, float] = (7.0, 7.0, 2.0),
+        use_bias: bool = True,
+        kernel_initializer: Union[str, Callable[..., TensorLike]] = "glorot_uniform",
+        bias_initializer: Union[str, Callable[..., TensorLike]] = "zeros",
+        **kwargs: Any,
+    ):
+        """Constructs a new EnsembleMonoDense instance.
+
+        Params:
+            units: Positive integer, dimensionality of the output space of each member.
+            n_members: Positive integer, number of members of the ensemble.
+            shared_inputs: if set to True, inputs of shape `(batch_size, ..., input_dim)` are used by all members,
+                otherwise inputs have shape `(batch_size, ..., n_members, input_dim)` with a separate input for
+                each member
+            activation: Activation function to use, it is assumed to be convex monotonically
+                increasing function such as "relu" or "elu"
+            monotonicity_indicator: Vector to indicate which of the inputs are monotonically increasing or
+                monotonically decreasing or non-monotonic, the same for all members, see `MonoDense` for details
+            is_convex: convex if set to True
+            is_concave: concave if set to True
+            activation_weights: relative weights for each type of activation, the default is (7.0, 7.0, 2.0).
+                Ignored if is_convex or is_concave is set to True
+            use_bias: whether the layer uses a bias vector
+            kernel_initializer: initializer of the kernel of each of the members
+            bias_initializer: initializer of the bias vector of each of the members
+            **kwargs: passed as kwargs to the constructor of `Layer`
+
+        Raise:
+            ValueError:
+                - if **n_members** is not positive,
+                - if both **is_concave** and **is_convex** are set to **True**, or
+                - if any component of activation_weights is negative or there is not exactly three components
+        """
+        if n_members < 1:
+            raise ValueError(
+                f"Number of members must be positive, but it is: {n_members}."
+            )
+
+        if is_convex and is_concave:
+            raise ValueError(
+                "The model cannot be set to be both convex and concave (only linear functions are both)."
+            )
+
+        if len(activation_weights) != 3:
+            raise ValueError(
+                f"There must be exactly three components of activation_weights, but we have this instead: {activation_weights}."
+            )
+
+        if (np.array(activation_weights) < 0).any():
+            raise ValueError(
+                f"Values of activation_weights must be non-negative, but we have this instead: {activation_weights}."
+            )
+
+        super(EnsembleMonoDense, self).__init__(**kwargs)
+
+        self.units = units
+        self.n_members = n_members
+        self.shared_inputs = shared_inputs
+        self.org_activation = activation
+        self.activation_weights = activation_weights
+        self.monotonicity_indicator = monotonicity_indicator
+        self.is_convex = is_convex
+        self.is_concave = is_concave
+        self.use_bias = use_bias
+        self.kernel_initializer = tf.keras.initializers.get(kernel_initializer)
+        self.bias_initializer = tf.keras.initializers.get(bias_initializer)
+
+        (
+            self.convex_activation,
+            self.concave_activation,
+            self.saturated_activation,
+        ) = get_activation_functions(self.org_activation)
+
+        self.frozen_kernel: Optional[TensorLike] = None
+        self._trainable_before_freeze: Optional[bool] = None
+
+    def build(self, input_shape: Tuple, *args: List[Any], **kwargs: Any) -> None:
+        """Build
+
+        Args:
+            input_shape: input tensor
+            args: not used
+            kwargs: not used
+
+        Raise:
+            ValueError: if inputs are not shared and their second to last dimension is not **n_members**
+        """
+        shape = tf.TensorShape(input_shape)
+        if not self.shared_inputs and (shape.rank < 2 or shape[-2] != self.n_members):
+            raise ValueError(
+                f"Inputs of EnsembleMonoDense with {self.n_members} members must have the shape (batch_size, ..., {self.n_members}, input_dim), but they have: {shape}"
+            )
+        input_dim = shape[-1]
+
+        # broadcastable to the kernel of shape (n_members, input_dim, units)
+        self.monotonicity_indicator = get_monotonicity_indicator(
+            monotonicity_indicator=self.monotonicity_indicator,
+            input_shape=shape,
+            units=self.units,
+        )
+        self.activation_selector = get_activation_selector(
+            self.units,
+            is_convex=self.is_convex,
+            is_concave=self.is_concave,
+            activation_weights=self.activation_weights,
+        )
+
+        self.kernel = self.add_weight(
+            "kernel",
+            shape=(self.n_members, input_dim, self.units),
+            initializer=lambda shape, dtype=None: _initialize_stacked(
+                self.kernel_initializer, shape, dtype=dtype
+            ),
+            trainable=True,
+        )
+        if self.use_bias:
+            self.bias = self.add_weight(
+                "bias",
+                shape=(self.n_members, self.units),
+                initializer=lambda shape, dtype=None: _initialize_stacked(
+                    self.bias_initializer, shape, dtype=dtype
+                ),
+                trainable=True,
+            )
+        else:
+            self.bias = None
+
+        self.built = True
+
+    def call(self, inputs: TensorLike) -> TensorLike:
+        """Call
+
+        Args:
+            inputs: input tensor of shape `(batch_size, ..., input_dim)` if inputs are shared or
+                `(batch_size, ..., n_members, input_dim)` otherwise
+
+        Returns:
+            N-D tensor with shape: `(batch_size, ..., n_members, units)`.
+        """
+        _count_trace(self)
+
+        with _profiling_scope("constrained_kernel"):
+            kernel = (
+                self.frozen_kernel
+                if self.frozen_kernel is not None
+                else apply_monotonicity_indicator_to_kernel(
+                    self.kernel, self.monotonicity_indicator
+                )
+            )
+            kernel = tf.cast(kernel, dtype=self._compute_dtype_object)
+
+        with _profiling_scope("matmul"):
+            if inputs.dtype.base_dtype != self._compute_dtype_object.base_dtype:
+                inputs = tf.cast(inputs, dtype=self._compute_dtype_object)
+            equation = "...i,miu->...mu" if self.shared_inputs else "...mi,miu->...mu"
+            h = tf.einsum(equation, inputs, kernel)
+            if self.use_bias:
+                h = h + self.bias
+
+        y = apply_activations(
+            h,
+            units=self.units,
+            convex_activation=self.convex_activation,
+            concave_activation=self.concave_activation,
+            saturated_activation=self.saturated_activation,
+            is_convex=self.is_convex,
+            is_concave=self.is_concave,
+            activation_weights=self.activation_weights,
+        )
+
+        return y
+
+    def freeze(self) -> None:
+        """Freezes the layer for inference, see `MonoDense.freeze` for details
+
+        Raise:
+            ValueError: if the layer is not built
+        """
+        if not self.built:
+            raise ValueError(f"Layer '{self.name}' must be built before freezing it.")
+
+        self.frozen_kernel = tf.constant(
+            apply_monotonicity_indicator_to_kernel(
+                self.kernel, self.monotonicity_indicator
+            )
+        )
+        if self._trainable_before_freeze is None:
+            self._trainable_before_freeze = self.trainable
+        self.trainable = False
+
+    def unfreeze(self) -> None:
+        """Unfreezes the layer frozen by `freeze` and restores its trainable flag"""
+        self.frozen_kernel = None
+        if self._trainable_before_freeze is not None:
+            self.trainable = self._trainable_before_freeze
+            self._trainable_before_freeze = None
+
+    def get_config(self) -> Dict[str, Any]:
+        """Returns the config of the layer, see `MonoDense.get_config` for details
+
+        Returns:
+            The config of the layer
+        """
+        return {
+            **super(EnsembleMonoDense, self).get_config(),
+            "units": self.units,
+            "n_members": self.n_members,
+            "shared_inputs": self.shared_inputs,
+            "activation": _serialize_activation(self.org_activation),
+            "monotonicity_indicator": _to_list(self.monotonicity_indicator),
+            "is_convex": self.is_convex,
+            "is_concave": self.is_concave,
+            "activation_weights": list(self.activation_weights),
+            "use_bias": self.use_bias,
+            "kernel_initializer": tf.keras.initializers.serialize(
+                self.kernel_initializer
+            ),
+            "bias_initializer": tf.keras.initializers.serialize(self.bias_initializer),
+        }
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "EnsembleMonoDense":
+        """Creates a layer from its config
+
+        Args:
+            config: config returned by `get_config`
+
+        Returns:
+            A new instance of the layer
+        """
+        return cls(**_deserialize_config(config))
+
+# %% ../../nbs/MonoDenseLayer.ipynb 86
+@export
+def split_ensemble_outputs(
+    outputs: TensorLike, *, name: str = "member"
+) -> List[TensorLike]:
+    """Splits outputs of an ensemble into separate outputs of its members
+
+    Args:
+        outputs: output tensor of shape `(batch_size, ..., n_members, units)` as returned by `create_type_1`
+            or `create_type_2` with **n_members** set
+        name: prefix of names of outputs, the output of the i-th member is named f"{name}_{i}"
+
+    Returns:
+        A list of output tensors of shape `(batch_size, ..., units)`, one for each member
+    """
+    return [
+        Activation("linear", name=f"{name}_{i}")(y)
+        for i, y in enumerate(tf.unstack(outputs, axis=-2))
+    ]
+
+# %% ../../nbs/MonoDenseLayer.ipynb 93
+def _get_mono_dense_layers(
+    model: tf.keras.Model,
+) -> List[Union[MonoDense, GroupedMonoDense, EnsembleMonoDense]]:
+    return [
+        layer
+        for layer in model.submodules
+        if isinstance(layer, (MonoDense, GroupedMonoDense, EnsembleMonoDense))
+    ]
+
+
+def _reset_compiled_functions(model: tf.keras.Model) -> None:
+    # functions traced by Model.predict(), Model.fit() and Model.evaluate() captured
+    # the kernels used before the change and must be traced again
+    model.predict_function = None
+    model.train_function = None
+    model.test_function = None
+
+
+@export
+def freeze_monotone_model(model: tf.keras.Model) -> tf.keras.Model:
+    """Freezes all `MonoDense`, `GroupedMonoDense` and `EnsembleMonoDense` layers in the model for inference
+
+    The kernels of all `MonoDense`, `GroupedMonoDense` and `EnsembleMonoDense` layers are computed once with their monotonicity indicators
+    applied and used as constants in all subsequent calls. Frozen layers are not trainable, use
+    `unfreeze_monotone_model` before resuming training.
+
+    Args:
+        model: a built model
+
+    Returns:
+        The same model with all `MonoDense` layers frozen
+    """
+    for layer in _get_mono_dense_layers(model):
+        layer.freeze()
+    _reset_compiled_functions(model)
+
+    return model
+
+
+@export
+def unfreeze_monotone_model(model: tf.keras.Model) -> tf.keras.Model:
+    """Unfreezes all `MonoDense` layers in the model frozen by `freeze_monotone_model`
+
+    Args:
+        model: a model
+
+    Returns:
+        The same model with all `MonoDense` layers unfrozen
+    """
+    for layer in _get_mono_dense_layers(model):
+        layer.unfreeze()
+    _reset_compiled_functions(model)
+
+    return model
@@ -5,42 +5,252 @@ d = { 'settings': { 'branch': 'main',
                 'doc_host': 'https://airtai.github.io',
                 'git_url': 'https://github.com/airtai/mono-dense-keras',
                 'lib_path': 'mono_dense_keras'},
-  'syms': { 'mono_dense_keras._components.mono_dense_layer': { 'mono_dense_keras._components.mono_dense_layer.MonoDense': ( 'monodenselayer.html#monodense',
+  'syms': { 'mono_dense_keras._components.certification': { 'mono_dense_keras._components.certification._get_activation_type': ( 'certification.html#_get_activation_type',
+                                                                                                                                 'mono_dense_keras/_components/certification.py'),
+                                                            'mono_dense_keras._components.certification._get_applied_kernel': ( 'certification.html#_get_applied_kernel',
+                                                                                                                                'mono_dense_keras/_components/certification.py'),
+                                                            'mono_dense_keras._components.certification._get_feature_names': ( 'certification.html#_get_feature_names',
+                                                                                                                               'mono_dense_keras/_components/certification.py'),
+                                                            'mono_dense_keras._components.certification._get_input_gradients': ( 'certification.html#_get_input_gradients',
+                                                                                                                                 'mono_dense_keras/_components/certification.py'),
+                                                            'mono_dense_keras._components.certification._get_mono_activation_types': ( 'certification.html#_get_mono_activation_types',
+                                                                                                                                       'mono_dense_keras/_components/certification.py'),
+                                                            'mono_dense_keras._components.certification._propagate_activation': ( 'certification.html#_propagate_activation',
+                                                                                                                                  'mono_dense_keras/_components/certification.py'),
+                                                            'mono_dense_keras._components.certification._propagate_layer': ( 'certification.html#_propagate_layer',
+                                                                                                                             'mono_dense_keras/_components/certification.py'),
+                                                            'mono_dense_keras._components.certification._propagate_linear': ( 'certification.html#_propagate_linear',
+                                                                                                                              'mono_dense_keras/_components/certification.py'),
+                                                            'mono_dense_keras._components.certification.certify_monotonicity': ( 'certification.html#certify_monotonicity',
+                                                                                                                                 'mono_dense_keras/_components/certification.py'),
+                                                            'mono_dense_keras._components.certification.check_gradient_signs': ( 'certification.html#check_gradient_signs',
+                                                                                                                                 'mono_dense_keras/_components/certification.py')},
+            'mono_dense_keras._components.export': { 'mono_dense_keras._components.export._fold_affine': ( 'export.html#_fold_affine',
+                                                                                                           'mono_dense_keras/_components/export.py'),
+                                                     'mono_dense_keras._components.export._get_activation_name': ( 'export.html#_get_activation_name',
+                                                                                                                   'mono_dense_keras/_components/export.py'),
+                                                     'mono_dense_keras._components.export._get_affine': ( 'export.html#_get_affine',
+                                                                                                          'mono_dense_keras/_components/export.py'),
+                                                     'mono_dense_keras._components.export._get_dense_node': ( 'export.html#_get_dense_node',
+                                                                                                              'mono_dense_keras/_components/export.py'),
+                                                     'mono_dense_keras._components.export._get_grouped_dense_node': ( 'export.html#_get_grouped_dense_node',
+                                                                                                                      'mono_dense_keras/_components/export.py'),
+                                                     'mono_dense_keras._components.export._get_latency_ms': ( 'export.html#_get_latency_ms',
+                                                                                                              'mono_dense_keras/_components/export.py'),
+                                                     'mono_dense_keras._components.export._get_layer_graph': ( 'export.html#_get_layer_graph',
+                                                                                                               'mono_dense_keras/_components/export.py'),
+                                                     'mono_dense_keras._components.export._get_node': ( 'export.html#_get_node',
+                                                                                                        'mono_dense_keras/_components/export.py'),
+                                                     'mono_dense_keras._components.export._get_random_inputs': ( 'export.html#_get_random_inputs',
+                                                                                                                 'mono_dense_keras/_components/export.py'),
+                                                     'mono_dense_keras._components.export._get_representative_dataset': ( 'export.html#_get_representative_dataset',
+                                                                                                                          'mono_dense_keras/_components/export.py'),
+                                                     'mono_dense_keras._components.export._get_serving_function': ( 'export.html#_get_serving_function',
+                                                                                                                    'mono_dense_keras/_components/export.py'),
+                                                     'mono_dense_keras._components.export._get_tflite_predict': ( 'export.html#_get_tflite_predict',
+                                                                                                                  'mono_dense_keras/_components/export.py'),
+                                                     'mono_dense_keras._components.export._prepare_for_export': ( 'export.html#_prepare_for_export',
+                                                                                                                  'mono_dense_keras/_components/export.py'),
+                                                     'mono_dense_keras._components.export._rewire_inbound_nodes': ( 'export.html#_rewire_inbound_nodes',
+                                                                                                                    'mono_dense_keras/_components/export.py'),
+                                                     'mono_dense_keras._components.export._save_serving_model': ( 'export.html#_save_serving_model',
+                                                                                                                  'mono_dense_keras/_components/export.py'),
+                                                     'mono_dense_keras._components.export._write_flatbuffer': ( 'export.html#_write_flatbuffer',
+                                                                                                                'mono_dense_keras/_components/export.py'),
+                                                     'mono_dense_keras._components.export.export_numpy_bundle': ( 'export.html#export_numpy_bundle',
+                                                                                                                  'mono_dense_keras/_components/export.py'),
+                                                     'mono_dense_keras._components.export.export_quantized_tflite': ( 'export.html#export_quantized_tflite',
+                                                                                                                      'mono_dense_keras/_components/export.py'),
+                                                     'mono_dense_keras._components.export.export_saved_model': ( 'export.html#export_saved_model',
+                                                                                                                 'mono_dense_keras/_components/export.py'),
+                                                     'mono_dense_keras._components.export.export_tflite': ( 'export.html#export_tflite',
+                                                                                                            'mono_dense_keras/_components/export.py'),
+                                                     'mono_dense_keras._components.export.fold_input_normalization': ( 'export.html#fold_input_normalization',
+                                                                                                                       'mono_dense_keras/_components/export.py'),
+                                                     'mono_dense_keras._components.export.quantization_report': ( 'export.html#quantization_report',
+                                                                                                                  'mono_dense_keras/_components/export.py'),
+                                                     'mono_dense_keras._components.export.quantize_kernel': ( 'export.html#quantize_kernel',
+                                                                                                              'mono_dense_keras/_components/export.py')},
+            'mono_dense_keras._components.lookup_tables': { 'mono_dense_keras._components.lookup_tables.PiecewiseLinear': ( 'lookuptables.html#piecewiselinear',
+                                                                                                                            'mono_dense_keras/_components/lookup_tables.py'),
+                                                            'mono_dense_keras._components.lookup_tables.PiecewiseLinear.__init__': ( 'lookuptables.html#piecewiselinear.__init__',
+                                                                                                                                     'mono_dense_keras/_components/lookup_tables.py'),
+                                                            'mono_dense_keras._components.lookup_tables.PiecewiseLinear.call': ( 'lookuptables.html#piecewiselinear.call',
+                                                                                                                                 'mono_dense_keras/_components/lookup_tables.py'),
+                                                            'mono_dense_keras._components.lookup_tables.PiecewiseLinear.get_config': ( 'lookuptables.html#piecewiselinear.get_config',
+                                                                                                                                       'mono_dense_keras/_components/lookup_tables.py'),
+                                                            'mono_dense_keras._components.lookup_tables._compile_branches': ( 'lookuptables.html#_compile_branches',
+                                                                                                                              'mono_dense_keras/_components/lookup_tables.py'),
+                                                            'mono_dense_keras._components.lookup_tables._find_branches': ( 'lookuptables.html#_find_branches',
+                                                                                                                           'mono_dense_keras/_components/lookup_tables.py'),
+                                                            'mono_dense_keras._components.lookup_tables._get_branch_knots': ( 'lookuptables.html#_get_branch_knots',
+                                                                                                                              'mono_dense_keras/_components/lookup_tables.py'),
+                                                            'mono_dense_keras._components.lookup_tables._get_branch_params': ( 'lookuptables.html#_get_branch_params',
+                                                                                                                               'mono_dense_keras/_components/lookup_tables.py'),
+                                                            'mono_dense_keras._components.lookup_tables._get_call_kwargs': ( 'lookuptables.html#_get_call_kwargs',
+                                                                                                                             'mono_dense_keras/_components/lookup_tables.py'),
+                                                            'mono_dense_keras._components.lookup_tables._make_monotone': ( 'lookuptables.html#_make_monotone',
+                                                                                                                           'mono_dense_keras/_components/lookup_tables.py'),
+                                                            'mono_dense_keras._components.lookup_tables._pad_table': ( 'lookuptables.html#_pad_table',
+                                                                                                                       'mono_dense_keras/_components/lookup_tables.py'),
+                                                            'mono_dense_keras._components.lookup_tables.compile_feature_branches': ( 'lookuptables.html#compile_feature_branches',
+                                                                                                                                     'mono_dense_keras/_components/lookup_tables.py')},
+            'mono_dense_keras._components.mono_dense_layer': { 'mono_dense_keras._components.mono_dense_layer.EnsembleMonoDense': ( 'monodenselayer.html#ensemblemonodense',
+                                                                                                                                    'mono_dense_keras/_components/mono_dense_layer.py'),
+                                                               'mono_dense_keras._components.mono_dense_layer.EnsembleMonoDense.__init__': ( 'monodenselayer.html#ensemblemonodense.__init__',
+                                                                                                                                             'mono_dense_keras/_components/mono_dense_layer.py'),
+                                                               'mono_dense_keras._components.mono_dense_layer.EnsembleMonoDense.build': ( 'monodenselayer.html#ensemblemonodense.build',
+                                                                                                                                          'mono_dense_keras/_components/mono_dense_layer.py'),
+                                                               'mono_dense_keras._components.mono_dense_layer.EnsembleMonoDense.call': ( 'monodenselayer.html#ensemblemonodense.call',
+                                                                                                                                         'mono_dense_keras/_components/mono_dense_layer.py'),
+                                                               'mono_dense_keras._components.mono_dense_layer.EnsembleMonoDense.freeze': ( 'monodenselayer.html#ensemblemonodense.freeze',
+                                                                                                                                           'mono_dense_keras/_components/mono_dense_layer.py'),
+                                                               'mono_dense_keras._components.mono_dense_layer.EnsembleMonoDense.from_config': ( 'monodenselayer.html#ensemblemonodense.from_config',
+                                                                                                                                                'mono_dense_keras/_components/mono_dense_layer.py'),
+                                                               'mono_dense_keras._components.mono_dense_layer.EnsembleMonoDense.get_config': ( 'monodenselayer.html#ensemblemonodense.get_config',
+                                                                                                                                               'mono_dense_keras/_components/mono_dense_layer.py'),
+                                                               'mono_dense_keras._components.mono_dense_layer.EnsembleMonoDense.unfreeze': ( 'monodenselayer.html#ensemblemonodense.unfreeze',
+                                                                                                                                             'mono_dense_keras/_components/mono_dense_layer.py'),
+                                                               'mono_dense_keras._components.mono_dense_layer.GroupedMonoDense': ( 'monodenselayer.html#groupedmonodense',
+                                                                                                                                   'mono_dense_keras/_components/mono_dense_layer.py'),
+                                                               'mono_dense_keras._components.mono_dense_layer.GroupedMonoDense.__init__': ( 'monodenselayer.html#groupedmonodense.__init__',
+                                                                                                                                            'mono_dense_keras/_components/mono_dense_layer.py'),
+                                                               'mono_dense_keras._components.mono_dense_layer.GroupedMonoDense._group_kernel_initializer': ( 'monodenselayer.html#groupedmonodense._group_kernel_initializer',
+                                                                                                                                                             'mono_dense_keras/_components/mono_dense_layer.py'),
+                                                               'mono_dense_keras._components.mono_dense_layer.GroupedMonoDense.build': ( 'monodenselayer.html#groupedmonodense.build',
+                                                                                                                                         'mono_dense_keras/_components/mono_dense_layer.py'),
+                                                               'mono_dense_keras._components.mono_dense_layer.GroupedMonoDense.call': ( 'monodenselayer.html#groupedmonodense.call',
+                                                                                                                                        'mono_dense_keras/_components/mono_dense_layer.py'),
+                                                               'mono_dense_keras._components.mono_dense_layer.GroupedMonoDense.freeze': ( 'monodenselayer.html#groupedmonodense.freeze',
+                                                                                                                                          'mono_dense_keras/_components/mono_dense_layer.py'),
+                                                               'mono_dense_keras._components.mono_dense_layer.GroupedMonoDense.from_config': ( 'monodenselayer.html#groupedmonodense.from_config',
+                                                                                                                                               'mono_dense_keras/_components/mono_dense_layer.py'),
+                                                               'mono_dense_keras._components.mono_dense_layer.GroupedMonoDense.get_config': ( 'monodenselayer.html#groupedmonodense.get_config',
+                                                                                                                                              'mono_dense_keras/_components/mono_dense_layer.py'),
+                                                               'mono_dense_keras._components.mono_dense_layer.GroupedMonoDense.unfreeze': ( 'monodenselayer.html#groupedmonodense.unfreeze',
+                                                                                                                                            'mono_dense_keras/_components/mono_dense_layer.py'),
+                                                               'mono_dense_keras._components.mono_dense_layer.MonoDense': ( 'monodenselayer.html#monodense',
                                                                                                                             'mono_dense_keras/_components/mono_dense_layer.py'),
                                                                'mono_dense_keras._components.mono_dense_layer.MonoDense.__init__': ( 'monodenselayer.html#monodense.__init__',
                                                                                                                                      'mono_dense_keras/_components/mono_dense_layer.py'),
+                                                               'mono_dense_keras._components.mono_dense_layer.MonoDense._matmul': ( 'monodenselayer.html#monodense._matmul',
+                                                                                                                                    'mono_dense_keras/_components/mono_dense_layer.py'),
                                                                'mono_dense_keras._components.mono_dense_layer.MonoDense.build': ( 'monodenselayer.html#monodense.build',
                                                                                                                                   'mono_dense_keras/_components/mono_dense_layer.py'),
                                                                'mono_dense_keras._components.mono_dense_layer.MonoDense.call': ( 'monodenselayer.html#monodense.call',
                                                                                                                                  'mono_dense_keras/_components/mono_dense_layer.py'),
+                                                               'mono_dense_keras._components.mono_dense_layer.MonoDense.freeze': ( 'monodenselayer.html#monodense.freeze',
+                                                                                                                                   'mono_dense_keras/_components/mono_dense_layer.py'),
+                                                               'mono_dense_keras._components.mono_dense_layer.MonoDense.from_config': ( 'monodenselayer.html#monodense.from_config',
+                                                                                                                                        'mono_dense_keras/_components/mono_dense_layer.py'),
+                                                               'mono_dense_keras._components.mono_dense_layer.MonoDense.get_config': ( 'monodenselayer.html#monodense.get_config',
+                                                                                                                                       'mono_dense_keras/_components/mono_dense_layer.py'),
+                                                               'mono_dense_keras._components.mono_dense_layer.MonoDense.unfreeze': ( 'monodenselayer.html#monodense.unfreeze',
+                                                                                                                                     'mono_dense_keras/_components/mono_dense_layer.py'),
+                                                               'mono_dense_keras._components.mono_dense_layer._broadcast_group_param': ( 'monodenselayer.html#_broadcast_group_param',
+                                                                                                                                         'mono_dense_keras/_components/mono_dense_layer.py'),
+                                                               'mono_dense_keras._components.mono_dense_layer._cast_to_variable_dtype': ( 'monodenselayer.html#_cast_to_variable_dtype',
+                                                                                                                                          'mono_dense_keras/_components/mono_dense_layer.py'),
                                                                'mono_dense_keras._components.mono_dense_layer._check_convexity_params': ( 'monodenselayer.html#_check_convexity_params',
                                                                                                                                           'mono_dense_keras/_components/mono_dense_layer.py'),
+                                                               'mono_dense_keras._components.mono_dense_layer._count_trace': ( 'monodenselayer.html#_count_trace',
+                                                                                                                               'mono_dense_keras/_components/mono_dense_layer.py'),
                                                                'mono_dense_keras._components.mono_dense_layer._create_mono_block': ( 'monodenselayer.html#_create_mono_block',
                                                                                                                                      'mono_dense_keras/_components/mono_dense_layer.py'),
+                                                               'mono_dense_keras._components.mono_dense_layer._deserialize_config': ( 'monodenselayer.html#_deserialize_config',
+                                                                                                                                      'mono_dense_keras/_components/mono_dense_layer.py'),
+                                                               'mono_dense_keras._components.mono_dense_layer._get_activation_functions': ( 'monodenselayer.html#_get_activation_functions',
+                                                                                                                                            'mono_dense_keras/_components/mono_dense_layer.py'),
+                                                               'mono_dense_keras._components.mono_dense_layer._get_activation_key': ( 'monodenselayer.html#_get_activation_key',
+                                                                                                                                      'mono_dense_keras/_components/mono_dense_layer.py'),
+                                                               'mono_dense_keras._components.mono_dense_layer._get_constrained_rows': ( 'monodenselayer.html#_get_constrained_rows',
+                                                                                                                                        'mono_dense_keras/_components/mono_dense_layer.py'),
+                                                               'mono_dense_keras._components.mono_dense_layer._get_mono_dense_layers': ( 'monodenselayer.html#_get_mono_dense_layers',
+                                                                                                                                         'mono_dense_keras/_components/mono_dense_layer.py'),
+                                                               'mono_dense_keras._components.mono_dense_layer._initialize_stacked': ( 'monodenselayer.html#_initialize_stacked',
+                                                                                                                                      'mono_dense_keras/_components/mono_dense_layer.py'),
                                                                'mono_dense_keras._components.mono_dense_layer._prepare_mono_input_n_param': ( 'monodenselayer.html#_prepare_mono_input_n_param',
                                                                                                                                               'mono_dense_keras/_components/mono_dense_layer.py'),
+                                                               'mono_dense_keras._components.mono_dense_layer._profiling_scope': ( 'monodenselayer.html#_profiling_scope',
+                                                                                                                                   'mono_dense_keras/_components/mono_dense_layer.py'),
+                                                               'mono_dense_keras._components.mono_dense_layer._reset_compiled_functions': ( 'monodenselayer.html#_reset_compiled_functions',
+                                                                                                                                            'mono_dense_keras/_components/mono_dense_layer.py'),
+                                                               'mono_dense_keras._components.mono_dense_layer._serialize_activation': ( 'monodenselayer.html#_serialize_activation',
+                                                                                                                                        'mono_dense_keras/_components/mono_dense_layer.py'),
+                                                               'mono_dense_keras._components.mono_dense_layer._to_list': ( 'monodenselayer.html#_to_list',
+                                                                                                                           'mono_dense_keras/_components/mono_dense_layer.py'),
                                                                'mono_dense_keras._components.mono_dense_layer.apply_activations': ( 'monodenselayer.html#apply_activations',
                                                                                                                                     'mono_dense_keras/_components/mono_dense_layer.py'),
+                                                               'mono_dense_keras._components.mono_dense_layer.apply_fused_activations': ( 'monodenselayer.html#apply_fused_activations',
+                                                                                                                                          'mono_dense_keras/_components/mono_dense_layer.py'),
                                                                'mono_dense_keras._components.mono_dense_layer.apply_monotonicity_indicator_to_kernel': ( 'monodenselayer.html#apply_monotonicity_indicator_to_kernel',
                                                                                                                                                          'mono_dense_keras/_components/mono_dense_layer.py'),
                                                                'mono_dense_keras._components.mono_dense_layer.create_type_1': ( 'monodenselayer.html#create_type_1',
                                                                                                                                 'mono_dense_keras/_components/mono_dense_layer.py'),
                                                                'mono_dense_keras._components.mono_dense_layer.create_type_2': ( 'monodenselayer.html#create_type_2',
                                                                                                                                 'mono_dense_keras/_components/mono_dense_layer.py'),
+                                                               'mono_dense_keras._components.mono_dense_layer.freeze_monotone_model': ( 'monodenselayer.html#freeze_monotone_model',
+                                                                                                                                        'mono_dense_keras/_components/mono_dense_layer.py'),
                                                                'mono_dense_keras._components.mono_dense_layer.get_activation_functions': ( 'monodenselayer.html#get_activation_functions',
                                                                                                                                            'mono_dense_keras/_components/mono_dense_layer.py'),
+                                                               'mono_dense_keras._components.mono_dense_layer.get_activation_selector': ( 'monodenselayer.html#get_activation_selector',
+                                                                                                                                          'mono_dense_keras/_components/mono_dense_layer.py'),
+                                                               'mono_dense_keras._components.mono_dense_layer.get_fused_activation_constants': ( 'monodenselayer.html#get_fused_activation_constants',
+                                                                                                                                                 'mono_dense_keras/_components/mono_dense_layer.py'),
                                                                'mono_dense_keras._components.mono_dense_layer.get_monotonicity_indicator': ( 'monodenselayer.html#get_monotonicity_indicator',
                                                                                                                                              'mono_dense_keras/_components/mono_dense_layer.py'),
                                                                'mono_dense_keras._components.mono_dense_layer.get_saturated_activation': ( 'monodenselayer.html#get_saturated_activation',
                                                                                                                                            'mono_dense_keras/_components/mono_dense_layer.py'),
+                                                               'mono_dense_keras._components.mono_dense_layer.get_trace_counts': ( 'monodenselayer.html#get_trace_counts',
+                                                                                                                                   'mono_dense_keras/_components/mono_dense_layer.py'),
+                                                               'mono_dense_keras._components.mono_dense_layer.replace_kernel': ( 'monodenselayer.html#replace_kernel',
+                                                                                                                                 'mono_dense_keras/_components/mono_dense_layer.py'),
                                                                'mono_dense_keras._components.mono_dense_layer.replace_kernel_using_monotonicity_indicator': ( 'monodenselayer.html#replace_kernel_using_monotonicity_indicator',
-                                                                                                                                                              'mono_dense_keras/_components/mono_dense_layer.py')},
+                                                                                                                                                              'mono_dense_keras/_components/mono_dense_layer.py'),
+                                                               'mono_dense_keras._components.mono_dense_layer.reset_trace_counts': ( 'monodenselayer.html#reset_trace_counts',
+                                                                                                                                     'mono_dense_keras/_components/mono_dense_layer.py'),
+                                                               'mono_dense_keras._components.mono_dense_layer.split_ensemble_outputs': ( 'monodenselayer.html#split_ensemble_outputs',
+                                                                                                                                         'mono_dense_keras/_components/mono_dense_layer.py'),
+                                                               'mono_dense_keras._components.mono_dense_layer.unfreeze_monotone_model': ( 'monodenselayer.html#unfreeze_monotone_model',
+                                                                                                                                          'mono_dense_keras/_components/mono_dense_layer.py')},
+            'mono_dense_keras.benchmarks': { 'mono_dense_keras.benchmarks._attribute_op': ( 'benchmarks.html#_attribute_op',
+                                                                                            'mono_dense_keras/benchmarks.py'),
+                                             'mono_dense_keras.benchmarks._create_benchmark_layer': ( 'benchmarks.html#_create_benchmark_layer',
+                                                                                                      'mono_dense_keras/benchmarks.py'),
+                                             'mono_dense_keras.benchmarks._get_git_commit': ( 'benchmarks.html#_get_git_commit',
+                                                                                              'mono_dense_keras/benchmarks.py'),
+                                             'mono_dense_keras.benchmarks._get_graph_memory_mb': ( 'benchmarks.html#_get_graph_memory_mb',
+                                                                                                   'mono_dense_keras/benchmarks.py'),
+                                             'mono_dense_keras.benchmarks._get_metadata': ( 'benchmarks.html#_get_metadata',
+                                                                                            'mono_dense_keras/benchmarks.py'),
+                                             'mono_dense_keras.benchmarks._get_monotonicity_indicator': ( 'benchmarks.html#_get_monotonicity_indicator',
+                                                                                                          'mono_dense_keras/benchmarks.py'),
+                                             'mono_dense_keras.benchmarks._get_peak_memory_mb': ( 'benchmarks.html#_get_peak_memory_mb',
+                                                                                                  'mono_dense_keras/benchmarks.py'),
+                                             'mono_dense_keras.benchmarks._load_op_times_ps': ( 'benchmarks.html#_load_op_times_ps',
+                                                                                                'mono_dense_keras/benchmarks.py'),
+                                             'mono_dense_keras.benchmarks._time_f': ( 'benchmarks.html#_time_f',
+                                                                                      'mono_dense_keras/benchmarks.py'),
+                                             'mono_dense_keras.benchmarks.benchmark_layer': ( 'benchmarks.html#benchmark_layer',
+                                                                                              'mono_dense_keras/benchmarks.py'),
+                                             'mono_dense_keras.benchmarks.compare_benchmark_results': ( 'benchmarks.html#compare_benchmark_results',
+                                                                                                        'mono_dense_keras/benchmarks.py'),
+                                             'mono_dense_keras.benchmarks.create_benchmark_configs': ( 'benchmarks.html#create_benchmark_configs',
+                                                                                                       'mono_dense_keras/benchmarks.py'),
+                                             'mono_dense_keras.benchmarks.load_benchmark_results': ( 'benchmarks.html#load_benchmark_results',
+                                                                                                     'mono_dense_keras/benchmarks.py'),
+                                             'mono_dense_keras.benchmarks.profile_model': ( 'benchmarks.html#profile_model',
+                                                                                            'mono_dense_keras/benchmarks.py'),
+                                             'mono_dense_keras.benchmarks.run_benchmarks': ( 'benchmarks.html#run_benchmarks',
+                                                                                             'mono_dense_keras/benchmarks.py')},
             'mono_dense_keras.experiments': { 'mono_dense_keras.experiments.TestHyperModel': ( 'experiments.html#testhypermodel',
                                                                                                'mono_dense_keras/experiments.py'),
                                               'mono_dense_keras.experiments.TestHyperModel.__init__': ( 'experiments.html#testhypermodel.__init__',
                                                                                                         'mono_dense_keras/experiments.py'),
                                               'mono_dense_keras.experiments.TestHyperModel.build': ( 'experiments.html#testhypermodel.build',
                                                                                                      'mono_dense_keras/experiments.py'),
+                                              'mono_dense_keras.experiments.TestHyperModel.fit': ( 'experiments.html#testhypermodel.fit',
+                                                                                                   'mono_dense_keras/experiments.py'),
                                               'mono_dense_keras.experiments._DownloadProgressBar': ( 'experiments.html#_downloadprogressbar',
                                                                                                      'mono_dense_keras/experiments.py'),
                                               'mono_dense_keras.experiments._DownloadProgressBar.update_to': ( 'experiments.html#_downloadprogressbar.update_to',
@@ -49,18 +259,54 @@ d = { 'settings': { 'branch': 'main',
                                                                                                     'mono_dense_keras/experiments.py'),
                                               'mono_dense_keras.experiments._count_model_params': ( 'experiments.html#_count_model_params',
                                                                                                     'mono_dense_keras/experiments.py'),
+                                              'mono_dense_keras.experiments._count_rows': ( 'experiments.html#_count_rows',
+                                                                                            'mono_dense_keras/experiments.py'),
                                               'mono_dense_keras.experiments._create_model_stats': ( 'experiments.html#_create_model_stats',
                                                                                                     'mono_dense_keras/experiments.py'),
+                                              'mono_dense_keras.experiments._create_tuner': ( 'experiments.html#_create_tuner',
+                                                                                              'mono_dense_keras/experiments.py'),
                                               'mono_dense_keras.experiments._download_data': ( 'experiments.html#_download_data',
                                                                                                'mono_dense_keras/experiments.py'),
                                               'mono_dense_keras.experiments._download_url': ( 'experiments.html#_download_url',
                                                                                               'mono_dense_keras/experiments.py'),
                                               'mono_dense_keras.experiments._get_build_model_with_hp_f': ( 'experiments.html#_get_build_model_with_hp_f',
                                                                                                            'mono_dense_keras/experiments.py'),
+                                              'mono_dense_keras.experiments._get_checksum': ( 'experiments.html#_get_checksum',
+                                                                                              'mono_dense_keras/experiments.py'),
+                                              'mono_dense_keras.experiments._get_columns': ( 'experiments.html#_get_columns',
+                                                                                             'mono_dense_keras/experiments.py'),
+                                              'mono_dense_keras.experiments._get_data_files': ( 'experiments.html#_get_data_files',
+                                                                                                'mono_dense_keras/experiments.py'),
                                               'mono_dense_keras.experiments._get_data_path': ( 'experiments.html#_get_data_path',
                                                                                                'mono_dense_keras/experiments.py'),
+                                              'mono_dense_keras.experiments._get_free_port': ( 'experiments.html#_get_free_port',
+                                                                                               'mono_dense_keras/experiments.py'),
+                                              'mono_dense_keras.experiments._get_member_metric_name': ( 'experiments.html#_get_member_metric_name',
+                                                                                                        'mono_dense_keras/experiments.py'),
+                                              'mono_dense_keras.experiments._get_shard_paths': ( 'experiments.html#_get_shard_paths',
+                                                                                                 'mono_dense_keras/experiments.py'),
+                                              'mono_dense_keras.experiments._get_stats_key': ( 'experiments.html#_get_stats_key',
+                                                                                               'mono_dense_keras/experiments.py'),
+                                              'mono_dense_keras.experiments._load_columns': ( 'experiments.html#_load_columns',
+                                                                                              'mono_dense_keras/experiments.py'),
+                                              'mono_dense_keras.experiments._load_stats': ( 'experiments.html#_load_stats',
+                                                                                            'mono_dense_keras/experiments.py'),
+                                              'mono_dense_keras.experiments._read_chunks': ( 'experiments.html#_read_chunks',
+                                                                                             'mono_dense_keras/experiments.py'),
+                                              'mono_dense_keras.experiments._read_csv_cached': ( 'experiments.html#_read_csv_cached',
+                                                                                                 'mono_dense_keras/experiments.py'),
+                                              'mono_dense_keras.experiments._run_parallel_search': ( 'experiments.html#_run_parallel_search',
+                                                                                                     'mono_dense_keras/experiments.py'),
+                                              'mono_dense_keras.experiments._run_search_process': ( 'experiments.html#_run_search_process',
+                                                                                                    'mono_dense_keras/experiments.py'),
                                               'mono_dense_keras.experiments._sanitize_col_names': ( 'experiments.html#_sanitize_col_names',
                                                                                                     'mono_dense_keras/experiments.py'),
+                                              'mono_dense_keras.experiments._save_columns': ( 'experiments.html#_save_columns',
+                                                                                              'mono_dense_keras/experiments.py'),
+                                              'mono_dense_keras.experiments._save_stats': ( 'experiments.html#_save_stats',
+                                                                                            'mono_dense_keras/experiments.py'),
+                                              'mono_dense_keras.experiments._set_environ': ( 'experiments.html#_set_environ',
+                                                                                             'mono_dense_keras/experiments.py'),
                                               'mono_dense_keras.experiments.create_tuner_stats': ( 'experiments.html#create_tuner_stats',
                                                                                                    'mono_dense_keras/experiments.py'),
                                               'mono_dense_keras.experiments.df2ds': ( 'experiments.html#df2ds',
@@ -69,6 +315,37 @@ d = { 'settings': { 'branch': 'main',
                                                                                                      'mono_dense_keras/experiments.py'),
                                               'mono_dense_keras.experiments.get_train_n_test_data': ( 'experiments.html#get_train_n_test_data',
                                                                                                       'mono_dense_keras/experiments.py'),
+                                              'mono_dense_keras.experiments.get_train_n_test_ds': ( 'experiments.html#get_train_n_test_ds',
+                                                                                                    'mono_dense_keras/experiments.py'),
+                                              'mono_dense_keras.experiments.measure_throughput': ( 'experiments.html#measure_throughput',
+                                                                                                   'mono_dense_keras/experiments.py'),
                                               'mono_dense_keras.experiments.peek': ( 'experiments.html#peek',
-                                                                                     'mono_dense_keras/experiments.py')},
-            'mono_dense_keras.helpers': {'mono_dense_keras.helpers.export': ('helpers.html#export', 'mono_dense_keras/helpers.py')}}}
+                                                                                     'mono_dense_keras/experiments.py'),
+                                              'mono_dense_keras.experiments.stream2ds': ( 'experiments.html#stream2ds',
+                                                                                          'mono_dense_keras/experiments.py')},
+            'mono_dense_keras.helpers': {'mono_dense_keras.helpers.export': ('helpers.html#export', 'mono_dense_keras/helpers.py')},
+            'mono_dense_keras.runtime': { 'mono_dense_keras.runtime.MonoModelRuntime': ( 'runtime.html#monomodelruntime',
+                                                                                         'mono_dense_keras/runtime.py'),
+                                          'mono_dense_keras.runtime.MonoModelRuntime.__init__': ( 'runtime.html#monomodelruntime.__init__',
+                                                                                                  'mono_dense_keras/runtime.py'),
+                                          'mono_dense_keras.runtime.MonoModelRuntime._allocate_buffers': ( 'runtime.html#monomodelruntime._allocate_buffers',
+                                                                                                           'mono_dense_keras/runtime.py'),
+                                          'mono_dense_keras.runtime.MonoModelRuntime._prepare_inputs': ( 'runtime.html#monomodelruntime._prepare_inputs',
+                                                                                                         'mono_dense_keras/runtime.py'),
+                                          'mono_dense_keras.runtime.MonoModelRuntime.load': ( 'runtime.html#monomodelruntime.load',
+                                                                                              'mono_dense_keras/runtime.py'),
+                                          'mono_dense_keras.runtime.MonoModelRuntime.predict': ( 'runtime.html#monomodelruntime.predict',
+                                                                                                 'mono_dense_keras/runtime.py'),
+                                          'mono_dense_keras.runtime._apply_mono_activations_': ( 'runtime.html#_apply_mono_activations_',
+                                                                                                 'mono_dense_keras/runtime.py'),
+                                          'mono_dense_keras.runtime._elu_': ('runtime.html#_elu_', 'mono_dense_keras/runtime.py'),
+                                          'mono_dense_keras.runtime._get_activation': ( 'runtime.html#_get_activation',
+                                                                                        'mono_dense_keras/runtime.py'),
+                                          'mono_dense_keras.runtime._sigmoid_': ('runtime.html#_sigmoid_', 'mono_dense_keras/runtime.py'),
+                                          'mono_dense_keras.runtime._softmax_': ('runtime.html#_softmax_', 'mono_dense_keras/runtime.py'),
+                                          'mono_dense_keras.runtime._softplus_': ('runtime.html#_softplus_', 'mono_dense_keras/runtime.py'),
+                                          'mono_dense_keras.runtime._tanh_': ('runtime.html#_tanh_', 'mono_dense_keras/runtime.py'),
+                                          'mono_dense_keras.runtime.load_bundle': ( 'runtime.html#load_bundle',
+                                                                                    'mono_dense_keras/runtime.py'),
+                                          'mono_dense_keras.runtime.save_bundle': ( 'runtime.html#save_bundle',
+                                                                                    'mono_dense_keras/runtime.py')}}}
@@ -0,0 +1,479 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/Benchmarks.ipynb.
+
+# %% auto 0
+__all__ = ['benchmark_layer', 'create_benchmark_configs', 'run_benchmarks', 'load_benchmark_results', 'compare_benchmark_results',
+           'profile_model']
+
+# %% ../nbs/Benchmarks.ipynb 3
+import json
+import platform
+import re
+import subprocess  # nosec
+from datetime import datetime
+from itertools import product
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from statistics import median
+from time import perf_counter
+from typing import *
+
+import numpy as np
+import pandas as pd
+import tensorflow as tf
+from tensorflow.keras.layers import Dense
+
+from . import MonoDense
+
+try:
+    from tensorflow.tsl.profiler.protobuf import xplane_pb2
+except ImportError:  # pragma: no cover
+    from tensorflow.core.profiler.protobuf import xplane_pb2
+
+# %% ../nbs/Benchmarks.ipynb 7
+def _time_f(f: Callable[[], Any], *, n_iter: int, n_warmup: int) -> float:
+    for _ in range(n_warmup):
+        f()
+
+    ts = []
+    for _ in range(n_iter):
+        t0 = perf_counter()
+        # results are converted to numpy to wait for asynchronous execution to finish
+        tf.nest.map_structure(lambda x: x.numpy(), f())
+        ts.append(perf_counter() - t0)
+
+    return median(ts) * 1e6
+
+
+def _get_graph_memory_mb(f: tf.types.experimental.GenericFunction, *args: Any) -> float:
+    graph = f.get_concrete_function(*args).graph
+    n_bytes = 0
+    for op in graph.get_operations():
+        for t in op.outputs:
+            if t.shape.is_fully_defined() and t.dtype != tf.resource:
+                n_bytes += t.shape.num_elements() * t.dtype.size
+    return n_bytes / 2**20
+
+
+def _get_peak_memory_mb(f: Callable[[], Any]) -> Optional[float]:
+    gpus = tf.config.list_logical_devices("GPU")
+    if len(gpus) == 0:
+        return None
+
+    tf.config.experimental.reset_memory_stats(gpus[0].name)
+    f()
+    return float(tf.config.experimental.get_memory_info(gpus[0].name)["peak"] / 2**20)
+
+# %% ../nbs/Benchmarks.ipynb 8
+def benchmark_layer(
+    layer: tf.keras.layers.Layer,
+    *,
+    batch_size: int,
+    input_width: int,
+    n_iter: int = 100,
+    n_warmup: int = 3,
+) -> Dict[str, Any]:
+    """Measures forward, backward and training step time and memory of a layer
+
+    Args:
+        layer: a new layer, it is built on inputs of shape `(batch_size, input_width)`
+        batch_size: batch size
+        input_width: number of input features
+        n_iter: number of timed calls, the median time is reported
+        n_warmup: number of calls before timing
+
+    Returns:
+        A dictionary with measurements. Peak memory is measured only on GPUs, `peak_memory_mb` is `None`
+        if no GPU is available and `graph_memory_mb` can be used as a proxy for it.
+    """
+    x = tf.random.normal(shape=(batch_size, input_width), seed=42)
+    layer.build(input_shape=x.shape)
+    optimizer = tf.keras.optimizers.SGD(learning_rate=1e-3)
+    # optimizer variables are created by a warm-up update with zero gradients before tracing, otherwise
+    # the training step is traced twice; Optimizer.build is not available in legacy optimizers of TF 2.10
+    optimizer.apply_gradients((tf.zeros_like(w), w) for w in layer.trainable_weights)
+
+    @tf.function
+    def forward(x: tf.Tensor) -> tf.Tensor:
+        return layer(x)
+
+    @tf.function
+    def backward(x: tf.Tensor) -> List[tf.Tensor]:
+        with tf.GradientTape() as tape:
+            tape.watch(x)
+            loss = tf.reduce_mean(tf.square(layer(x)))
+        return cast(List[tf.Tensor], tape.gradient(loss, [x] + layer.trainable_weights))
+
+    @tf.function
+    def train_step(x: tf.Tensor) -> tf.Tensor:
+        with tf.GradientTape() as tape:
+            loss = tf.reduce_mean(tf.square(layer(x)))
+        grads = tape.gradient(loss, layer.trainable_weights)
+        optimizer.apply_gradients(zip(grads, layer.trainable_weights))
+        return loss
+
+    result = dict(
+        forward_us=_time_f(lambda: forward(x), n_iter=n_iter, n_warmup=n_warmup),
+        backward_us=_time_f(lambda: backward(x), n_iter=n_iter, n_warmup=n_warmup),
+        train_step_us=_time_f(lambda: train_step(x), n_iter=n_iter, n_warmup=n_warmup),
+        peak_memory_mb=_get_peak_memory_mb(lambda: train_step(x)),
+        graph_memory_mb=_get_graph_memory_mb(train_step, x),
+        n_traces=sum(
+            f.experimental_get_tracing_count() for f in [forward, backward, train_step]
+        ),
+    )
+    return result
+
+# %% ../nbs/Benchmarks.ipynb 11
+def _get_monotonicity_indicator(pattern: str, input_width: int) -> List[int]:
+    if pattern == "increasing":
+        return [1] * input_width
+    elif pattern == "mixed":
+        return [[1, 0, -1][i % 3] for i in range(input_width)]
+    else:
+        raise ValueError(f"Unknown indicator pattern: '{pattern}'")
+
+
+def _create_benchmark_layer(config: Dict[str, Any]) -> tf.keras.layers.Layer:
+    if config["layer"] == "Dense":
+        return Dense(units=config["units"], activation=config["activation"])
+
+    return MonoDense(
+        units=config["units"],
+        activation=config["activation"],
+        monotonicity_indicator=_get_monotonicity_indicator(
+            config["indicator"], config["input_width"]
+        ),
+        is_convex=config["convexity"] == "convex",
+        is_concave=config["convexity"] == "concave",
+        activation_weights=config["activation_weights"],
+    )
+
+# %% ../nbs/Benchmarks.ipynb 12
+def create_benchmark_configs(
+    *,
+    batch_sizes: Sequence[int] = (32, 1024),
+    input_widths: Sequence[int] = (8, 64),
+    units: Sequence[int] = (16, 128),
+    activations: Sequence[str] = ("elu",),
+    activation_weights: Sequence[Tuple[float, float, float]] = (
+        (7.0, 7.0, 2.0),
+        (1.0, 1.0, 1.0),
+    ),
+    convexities: Sequence[str] = ("none", "convex", "concave"),
+    indicators: Sequence[str] = ("increasing", "mixed"),
+) -> List[Dict[str, Any]]:
+    """Creates configurations of the benchmark suite
+
+    Args:
+        batch_sizes: batch sizes
+        input_widths: numbers of input features
+        units: numbers of units of the layer
+        activations: activation functions
+        activation_weights: activation weights of `MonoDense` layers
+        convexities: convexities of `MonoDense` layers, each one of "none", "convex" or "concave"
+        indicators: patterns of the monotonicity indicator, each one of "increasing" or "mixed"
+
+    Returns:
+        A list of configurations, one for each benchmark
+    """
+    configs = []
+    for batch_size, input_width, n_units, activation in product(
+        batch_sizes, input_widths, units, activations
+    ):
+        shape_config = dict(
+            batch_size=batch_size,
+            input_width=input_width,
+            units=n_units,
+            activation=activation,
+        )
+        configs.append(
+            dict(
+                layer="Dense",
+                **shape_config,
+                activation_weights=None,
+                convexity=None,
+                indicator=None,
+            )
+        )
+        for weights, convexity, indicator in product(
+            activation_weights, convexities, indicators
+        ):
+            # activation weights are ignored for convex and concave layers
+            if convexity != "none" and weights != activation_weights[0]:
+                continue
+            configs.append(
+                dict(
+                    layer="MonoDense",
+                    **shape_config,
+                    activation_weights=list(weights),
+                    convexity=convexity,
+                    indicator=indicator,
+                )
+            )
+
+    return configs
+
+# %% ../nbs/Benchmarks.ipynb 14
+_CONFIG_KEYS = [
+    "layer",
+    "batch_size",
+    "input_width",
+    "units",
+    "activation",
+    "activation_weights",
+    "convexity",
+    "indicator",
+]
+
+
+def _get_git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(  # nosec
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except Exception:  # nosec
+        return None
+
+
+def _get_metadata() -> Dict[str, Any]:
+    return dict(
+        timestamp=datetime.now().isoformat(),
+        git_commit=_get_git_commit(),
+        tensorflow=tf.__version__,
+        numpy=np.__version__,
+        python=platform.python_version(),
+        platform=platform.platform(),
+        processor=platform.processor(),
+        gpus=[d.name for d in tf.config.list_logical_devices("GPU")],
+    )
+
+# %% ../nbs/Benchmarks.ipynb 15
+def run_benchmarks(
+    configs: Optional[List[Dict[str, Any]]] = None,
+    *,
+    path: Optional[Union[Path, str]] = None,
+    n_iter: int = 100,
+    n_warmup: int = 3,
+) -> pd.DataFrame:
+    """Runs the benchmark suite
+
+    Args:
+        configs: configurations created by `create_benchmark_configs`, default configurations are used if None
+        path: if not None, results are saved in JSON format to this path together with metadata such as
+            the git commit, versions of libraries and the platform
+        n_iter: number of timed calls of each function
+        n_warmup: number of calls before timing
+
+    Returns:
+        A dataframe with one row per configuration
+    """
+    if configs is None:
+        configs = create_benchmark_configs()
+
+    results = []
+    for config in configs:
+        tf.keras.backend.clear_session()
+        tf.keras.utils.set_random_seed(42)
+        layer = _create_benchmark_layer(config)
+        result = benchmark_layer(
+            layer,
+            batch_size=config["batch_size"],
+            input_width=config["input_width"],
+            n_iter=n_iter,
+            n_warmup=n_warmup,
+        )
+        results.append(dict(**config, **result))
+
+    if path is not None:
+        path = Path(path)
+        path.parent.mkdir(exist_ok=True, parents=True)
+        with open(path, "w") as f:
+            json.dump(dict(metadata=_get_metadata(), results=results), f, indent=2)
+
+    return pd.DataFrame(results)
+
+
+def load_benchmark_results(
+    path: Union[Path, str]
+) -> Tuple[Dict[str, Any], pd.DataFrame]:
+    """Loads results saved by `run_benchmarks`
+
+    Args:
+        path: path to the JSON file
+
+    Returns:
+        A tuple of metadata and a dataframe with results
+    """
+    with open(path) as f:
+        data = json.load(f)
+    return data["metadata"], pd.DataFrame(data["results"])
+
+# %% ../nbs/Benchmarks.ipynb 18
+def compare_benchmark_results(
+    baseline: pd.DataFrame,
+    current: pd.DataFrame,
+    *,
+    metrics: Sequence[str] = ("forward_us", "backward_us", "train_step_us"),
+    threshold: float = 1.1,
+) -> pd.DataFrame:
+    """Compares two sets of results returned by `run_benchmarks` or `load_benchmark_results`
+
+    Args:
+        baseline: baseline results
+        current: current results
+        metrics: metrics to compare
+        threshold: a configuration is marked as a regression if the ratio of the current and the
+            baseline value of any of the metrics is greater than the threshold or if the number of
+            traces increased
+
+    Returns:
+        A dataframe with baseline and current values and their ratios for all configurations
+        present in both results
+    """
+
+    def _with_key(df: pd.DataFrame) -> pd.DataFrame:
+        # lists are not hashable and cannot be used for joining
+        df = df.copy()
+        df["activation_weights"] = df["activation_weights"].apply(
+            lambda x: None if x is None else tuple(x)
+        )
+        return df.set_index(_CONFIG_KEYS)
+
+    df = _with_key(baseline).join(
+        _with_key(current), how="inner", lsuffix="_baseline", rsuffix="_current"
+    )
+
+    regression = df["n_traces_current"] > df["n_traces_baseline"]
+    for metric in metrics:
+        df[f"{metric}_ratio"] = df[f"{metric}_current"] / df[f"{metric}_baseline"]
+        regression |= df[f"{metric}_ratio"] > threshold
+    df["regression"] = regression
+
+    columns = [
+        f"{metric}_{suffix}"
+        for metric in metrics
+        for suffix in ["baseline", "current", "ratio"]
+    ]
+    return df[columns + ["regression"]].reset_index()
+
+# %% ../nbs/Benchmarks.ipynb 25
+_PROFILING_PHASES = {
+    "constrained_kernel",
+    "matmul",
+    "split_activations",
+    "convex_activation",
+    "concave_activation",
+    "saturated_activation",
+    "concat_activations",
+    "fused_activations",
+}
+
+_OP_EVENT_PATTERN = re.compile(r"^[^\s:]+:\w+$")
+
+
+def _load_op_times_ps(logdir: Union[Path, str]) -> Dict[str, int]:
+    paths = sorted(Path(logdir).glob("plugins/profile/*/*.xplane.pb"))
+    if len(paths) == 0:
+        raise ValueError(f"No profiler trace found in: {logdir}")
+
+    xspace = xplane_pb2.XSpace()
+    xspace.ParseFromString(paths[-1].read_bytes())
+
+    op_times: Dict[str, int] = {}
+    for plane in xspace.planes:
+        for line in plane.lines:
+            for event in line.events:
+                # events of TensorFlow ops are named as "op_name:op_type", other events are
+                # executor and Python overheads
+                name = plane.event_metadata[event.metadata_id].name
+                if _OP_EVENT_PATTERN.match(name) is None:
+                    continue
+                op_name = name.rsplit(":", 1)[0]
+                op_times[op_name] = op_times.get(op_name, 0) + event.duration_ps
+
+    return op_times
+
+
+def _attribute_op(op_name: str, layer_names: Set[str]) -> Tuple[str, str, str]:
+    parts = op_name.split("/")
+    direction = "backward" if parts[0] == "gradient_tape" else "forward"
+    for i, part in enumerate(parts[:-1]):
+        if part in layer_names:
+            phase = re.sub(r"_\d+$", "", parts[i + 1]) if i + 2 < len(parts) else ""
+            return part, phase if phase in _PROFILING_PHASES else "other", direction
+    return "(other)", "other", direction
+
+# %% ../nbs/Benchmarks.ipynb 27
+def profile_model(
+    model: tf.keras.Model,
+    dataset: tf.data.Dataset,
+    steps: int,
+    *,
+    training: bool = False,
+    logdir: Optional[Union[Path, str]] = None,
+) -> pd.DataFrame:
+    """Profiles a model and returns the time breakdown per layer and phase of computation
+
+    Args:
+        model: a model, it must be compiled if `training` is True
+        dataset: a batched dataset with inputs or tuples of inputs, targets and optionally sample weights
+        steps: number of profiled steps, an additional batch is used for warm-up before profiling
+        training: if True, training steps are profiled, otherwise prediction steps
+        logdir: directory for saving the trace, a temporary directory is used if None
+
+    Returns:
+        A dataframe with the layer, the phase, the direction of computation (forward or backward),
+        the time per step in microseconds and the share of the total time
+
+    Raise:
+        ValueError: if the dataset has less than `steps + 1` batches
+    """
+    batches = list(dataset.take(steps + 1))
+    if len(batches) < steps + 1:
+        raise ValueError(
+            f"Dataset must have at least {steps + 1} batches, but it has {len(batches)}."
+        )
+
+    def run(batch: Any) -> None:
+        x, y, sample_weight = tf.keras.utils.unpack_x_y_sample_weight(batch)
+        if training:
+            model.train_on_batch(x, y, sample_weight=sample_weight)
+        else:
+            model.predict_on_batch(x)
+
+    # functions are traced outside of the profiled steps
+    run(batches[0])
+
+    with TemporaryDirectory() as d:
+        logdir = logdir if logdir is not None else d
+        tf.profiler.experimental.start(str(logdir))
+        try:
+            for batch in batches[1:]:
+                run(batch)
+        finally:
+            tf.profiler.experimental.stop()
+        op_times = _load_op_times_ps(logdir)
+
+    layer_names = [layer.name for layer in model.layers]
+    rows: Dict[Tuple[str, str, str], float] = {}
+    for op_name, t in op_times.items():
+        key = _attribute_op(op_name, set(layer_names))
+        rows[key] = rows.get(key, 0.0) + t / 1e6 / steps
+
+    df = pd.DataFrame(
+        [(*key, t) for key, t in rows.items()],
+        columns=["layer", "phase", "direction", "time_us"],
+    )
+    df["share"] = df["time_us"] / df["time_us"].sum()
+
+    # layers are sorted in the order of the model
+    order = {name: i for i, name in enumerate(layer_names + ["(other)"])}
+    df = df.sort_values(
+        by=["layer", "direction", "time_us"],
+        key=lambda c: c.map(order) if c.name == "layer" else c,
+        ascending=[True, False, False],
+    )
+    return df.reset_index(drop=True)
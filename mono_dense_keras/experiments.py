@@ -1,29 +1,32 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/Experiments.ipynb.
 
 # %% auto 0
-__all__ = ['get_train_n_test_data', 'df2ds', 'peek', 'find_hyperparameters', 'create_tuner_stats']
+__all__ = ['get_train_n_test_data', 'df2ds', 'peek', 'stream2ds', 'get_train_n_test_ds', 'find_hyperparameters',
+           'create_tuner_stats', 'measure_throughput']
 
 # %% ../nbs/Experiments.ipynb 3
+import hashlib
+import json
+import multiprocessing
 import shutil
+import socket
 import urllib.request
 from contextlib import contextmanager
 from datetime import datetime
-from os import environ
+from os import cpu_count, environ, replace
 from pathlib import Path
-from tempfile import TemporaryDirectory
+from tempfile import NamedTemporaryFile, TemporaryDirectory
+from time import perf_counter
 from typing import *
 
-import matplotlib
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-import pytest
-import seaborn as sns
 import tensorflow as tf
 from keras_tuner import (
     BayesianOptimization,
     HyperModel,
     HyperParameters,
+    Hyperband,
     Objective,
     Tuner,
 )
@@ -35,7 +38,12 @@ from tensorflow.keras.optimizers.experimental import AdamW
 from tensorflow.types.experimental import TensorLike
 from tqdm import tqdm
 
-from . import MonoDense, create_type_1, create_type_2
+from mono_dense_keras import (
+    MonoDense,
+    create_type_1,
+    create_type_2,
+    split_ensemble_outputs,
+)
 
 # %% ../nbs/Experiments.ipynb 7
 class _DownloadProgressBar(tqdm):
@@ -89,40 +97,107 @@ def _sanitize_col_names(df: pd.DataFrame) -> pd.DataFrame:
     df = df.rename(columns=columns)
     return df
 
-# %% ../nbs/Experiments.ipynb 12
+# %% ../nbs/Experiments.ipynb 13
+def _get_checksum(path: Path, *, chunk_size: int = 2**20) -> str:
+    sha256 = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def _save_columns(df: pd.DataFrame, path: Path) -> None:
+    path.parent.mkdir(exist_ok=True, parents=True)
+    # columns are written into a temporary directory first, so that other processes never see partially written cache
+    with TemporaryDirectory(dir=path.parent) as d:
+        for i, c in enumerate(df.columns):
+            np.save(Path(d) / f"{i}.npy", df[c].to_numpy(), allow_pickle=False)
+        (Path(d) / "columns.json").write_text(json.dumps(list(df.columns)))
+        try:
+            replace(d, path)
+        except OSError:
+            # the same file was cached by another process in the meantime
+            if not (path / "columns.json").exists():
+                raise
+
+
+def _load_columns(path: Path) -> pd.DataFrame:
+    columns = json.loads((path / "columns.json").read_text())
+    return pd.DataFrame(
+        {
+            # views of memory-mapped files as plain arrays
+            c: np.asarray(np.load(path / f"{i}.npy", mmap_mode="r", allow_pickle=False))
+            for i, c in enumerate(columns)
+        },
+        copy=False,
+    )
+
+
+def _read_csv_cached(path: Path, *, cache_path: Path) -> pd.DataFrame:
+    cached_path = cache_path / f"{path.stem}_{_get_checksum(path)[:16]}"
+    if not (cached_path / "columns.json").exists():
+        df = _sanitize_col_names(pd.read_csv(path))
+        # columns are saved without pickling, so files with non-numeric columns are not cached
+        if not all(pd.api.types.is_numeric_dtype(dtype) for dtype in df.dtypes):
+            return df
+        _save_columns(df, cached_path)
+    return _load_columns(cached_path)
+
+# %% ../nbs/Experiments.ipynb 18
 def get_train_n_test_data(
     dataset_name: str,
     *,
     data_path: Optional[Union[Path, str]] = "./data",
+    use_cache: bool = True,
 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """Download data
 
     Args:
         dataset_name: name of the dataset, one of "auto", "heart", compas", "blog", "loan"
         data_path: root directory where to download data to
+        use_cache: if set to True, CSV files are converted into a binary format in the `cache` subdirectory of
+            **data_path** on the first call and loaded using memory mapping on all subsequent calls. DataFrames
+            returned are then backed by read-only memory-mapped files. Files with non-numeric columns are not
+            cached and are parsed on every call.
     """
     data_path = _get_data_path(data_path)
     _download_data(dataset_name=dataset_name, data_path=data_path)
 
-    dfx = [
-        pd.read_csv(data_path / f"{prefix}_{dataset_name}.csv")
-        for prefix in ["train", "test"]
-    ]
-    dfx = [_sanitize_col_names(df) for df in dfx]
+    paths = [data_path / f"{prefix}_{dataset_name}.csv" for prefix in ["train", "test"]]
+    if use_cache:
+        dfx = [_read_csv_cached(path, cache_path=data_path / "cache") for path in paths]
+    else:
+        dfx = [_sanitize_col_names(pd.read_csv(path)) for path in paths]
     return dfx[0], dfx[1]
 
-# %% ../nbs/Experiments.ipynb 14
-def df2ds(df: pd.DataFrame) -> tf.data.Dataset:
+# %% ../nbs/Experiments.ipynb 20
+def df2ds(
+    df: pd.DataFrame,
+    *,
+    label: str = "ground_truth",
+    dtype: Union[str, np.dtype] = "float32",
+) -> tf.data.Dataset:
     """Converts DataFrame to Dataset
 
+    Each of the columns is converted into a NumPy array without creating intermediate Python objects. Columns
+    already stored in the given dtype are passed to the dataset without copying them.
+
     Args:
         df: input DataFrame
+        label: name of the column with labels
+        dtype: dtype of features and labels in the dataset
 
     Returns:
-        dataset
+        dataset of tuples of dictionaries of features and labels
+
+    Raise:
+        KeyError: if there is no label column in the DataFrame
     """
-    x = df.to_dict("list")
-    y = x.pop("ground_truth")
+    if label not in df:
+        raise KeyError(f"Label column '{label}' not found in: {list(df.columns)}")
+
+    x = {c: df[c].to_numpy(dtype=dtype) for c in df.columns if c != label}
+    y = df[label].to_numpy(dtype=dtype)
 
     ds = tf.data.Dataset.from_tensor_slices((x, y))
 
@@ -141,11 +216,177 @@ def peek(ds: tf.data.Dataset) -> tf.Tensor:
     for x in ds:
         return x
 
-# %% ../nbs/Experiments.ipynb 16
+# %% ../nbs/Experiments.ipynb 27
+def _get_shard_paths(data_path: Path, prefix: str, dataset_name: str) -> List[Path]:
+    path = data_path / f"{prefix}_{dataset_name}"
+    if not path.is_dir():
+        return [data_path / f"{prefix}_{dataset_name}.csv"]
+    return sorted(
+        p for p in path.iterdir() if p.suffix == ".csv" or (p / "columns.json").exists()
+    )
+
+
+def _get_data_files(
+    data_path: Path, prefix: str, dataset_name: str, *, streaming: bool
+) -> List[Path]:
+    if not streaming:
+        return [data_path / f"{prefix}_{dataset_name}.csv"]
+    shard_paths = _get_shard_paths(data_path, prefix, dataset_name)
+    return [
+        f for p in shard_paths for f in (sorted(p.iterdir()) if p.is_dir() else [p])
+    ]
+
+
+def _get_columns(path: Path) -> List[str]:
+    if path.is_dir():
+        return json.loads((path / "columns.json").read_text())  # type: ignore
+    return list(_sanitize_col_names(pd.read_csv(path, nrows=0)).columns)
+
+
+def _count_rows(path: Path, *, chunk_size: int = 2**20) -> int:
+    if path.is_dir():
+        return len(np.load(path / "0.npy", mmap_mode="r", allow_pickle=False))
+
+    n_lines, last = 0, b"\n"
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            n_lines += chunk.count(b"\n")
+            last = chunk[-1:]
+    # the header is not a row and the last row does not have to end with a newline
+    return n_lines - 1 + (last != b"\n")
+
+
+def _read_chunks(path: Path, *, chunk_size: int) -> Iterator[pd.DataFrame]:
+    if path.is_dir():
+        # columns are memory-mapped, so only the rows of the current chunk are read from disk
+        df = _load_columns(path)
+        for i in range(0, len(df), chunk_size):
+            yield df.iloc[i : i + chunk_size]
+    else:
+        with pd.read_csv(path, chunksize=chunk_size) as reader:
+            for chunk in reader:
+                yield _sanitize_col_names(chunk)
+
+# %% ../nbs/Experiments.ipynb 29
+def stream2ds(
+    paths: Union[Path, str, Sequence[Union[Path, str]]],
+    *,
+    label: str = "ground_truth",
+    dtype: Union[str, np.dtype] = "float32",
+    chunk_size: int = 2**16,
+    shuffle_shards: bool = False,
+) -> tf.data.Dataset:
+    """Creates a dataset streaming rows from shards stored on disk
+
+    Each of the shards is read in chunks of **chunk_size** rows by a generator, so only a few chunks are kept in
+    memory at any time. The number of rows is counted when the dataset is created, so that the cardinality of
+    the dataset is known. Rows of CSV files are counted by counting lines, so values must not contain newlines.
+
+    Args:
+        paths: a path or a sequence of paths to shards, each of them is either a CSV file or a directory of columns
+            as stored in the cache of `get_train_n_test_data`
+        label: name of the column with labels
+        dtype: dtype of features and labels in the dataset
+        chunk_size: number of rows read at once
+        shuffle_shards: if set to True, the order of shards is shuffled in each iteration
+
+    Returns:
+        dataset of tuples of dictionaries of features and labels
+
+    Raise:
+        KeyError: if there is no label column in the first shard
+    """
+    shard_paths = [
+        Path(p) for p in ([paths] if isinstance(paths, (Path, str)) else paths)
+    ]
+
+    columns = _get_columns(shard_paths[0])
+    if label not in columns:
+        raise KeyError(f"Label column '{label}' not found in: {columns}")
+    features = [c for c in columns if c != label]
+
+    def read_shard(
+        path: bytes,
+    ) -> Generator[Tuple[Dict[str, NDArray], NDArray], None, None]:
+        for chunk in _read_chunks(Path(path.decode()), chunk_size=chunk_size):
+            x = {c: chunk[c].to_numpy(dtype=dtype) for c in features}
+            yield x, chunk[label].to_numpy(dtype=dtype)
+
+    output_signature = (
+        {c: tf.TensorSpec(shape=(None,), dtype=dtype) for c in features},
+        tf.TensorSpec(shape=(None,), dtype=dtype),
+    )
+
+    ds = tf.data.Dataset.from_tensor_slices([str(p) for p in shard_paths])
+    if shuffle_shards:
+        ds = ds.shuffle(len(shard_paths))
+    ds = ds.flat_map(
+        lambda path: tf.data.Dataset.from_generator(
+            read_shard, args=(path,), output_signature=output_signature
+        )
+    )
+    # chunks are split into rows after they are read
+    ds = ds.unbatch()
+
+    n_rows = sum(_count_rows(p) for p in shard_paths)
+    return ds.apply(tf.data.experimental.assert_cardinality(n_rows))
+
+# %% ../nbs/Experiments.ipynb 31
+def get_train_n_test_ds(
+    dataset_name: str,
+    *,
+    data_path: Optional[Union[Path, str]] = "./data",
+    streaming: bool = False,
+    shuffle_buffer_size: int = 2**16,
+    chunk_size: int = 2**16,
+) -> Tuple[tf.data.Dataset, tf.data.Dataset]:
+    """Creates datasets for training and evaluation
+
+    The training dataset is shuffled in each iteration. If the dataset is loaded into memory, all of its rows
+    are shuffled. If it is streamed, the order of its shards is shuffled and rows are shuffled using a buffer of
+    **shuffle_buffer_size** rows.
+
+    Args:
+        dataset_name: name of the dataset, one of "auto", "heart", "compas", "blog", "loan", or a dataset stored
+            in **data_path**
+        data_path: root directory where to download data to
+        streaming: if set to True, datasets are streamed from shards using `stream2ds` instead of being loaded
+            into memory using `get_train_n_test_data`. A dataset is stored either in the file
+            `{prefix}_{dataset_name}.csv` or in the directory of shards `{prefix}_{dataset_name}`, where
+            prefix is either "train" or "test".
+        shuffle_buffer_size: number of rows in the buffer used for shuffling rows of the streamed training dataset
+        chunk_size: number of rows read at once when streaming
+
+    Returns:
+        A tuple of the training and test datasets
+    """
+    if not streaming:
+        train_df, test_df = get_train_n_test_data(dataset_name, data_path=data_path)
+        train_ds, test_ds = df2ds(train_df), df2ds(test_df)
+        return train_ds.shuffle(len(train_ds)), test_ds
+
+    data_path = _get_data_path(data_path)
+    if not all(
+        (data_path / f"{prefix}_{dataset_name}").is_dir()
+        for prefix in ["train", "test"]
+    ):
+        _download_data(dataset_name=dataset_name, data_path=data_path)
+
+    train_ds, test_ds = [
+        stream2ds(
+            _get_shard_paths(data_path, prefix, dataset_name),
+            chunk_size=chunk_size,
+            shuffle_shards=prefix == "train",
+        )
+        for prefix in ["train", "test"]
+    ]
+    return train_ds.shuffle(shuffle_buffer_size), test_ds
+
+# %% ../nbs/Experiments.ipynb 32
 def _build_mono_model_f(
     *,
     monotonicity_indicator: Dict[str, int],
-    final_activation: Union[str, Callable[[TensorLike], TensorLike]],
+    final_activation: Optional[Union[str, Callable[[TensorLike], TensorLike]]],
     loss: Union[str, Callable[[TensorLike, TensorLike], TensorLike]],
     metrics: Union[str, Callable[[TensorLike, TensorLike], TensorLike]],
     train_ds: tf.data.Dataset,
@@ -157,6 +398,8 @@ def _build_mono_model_f(
     weight_decay: float,
     dropout: float,
     decay_rate: float,
+    n_members: Optional[int] = None,
+    learning_rate_scale: float = 1.0,
 ) -> Model:
     inputs = {k: Input(name=k, shape=(1,)) for k in monotonicity_indicator.keys()}
     outputs = create_type_2(
@@ -170,11 +413,15 @@ def _build_mono_model_f(
         is_concave=False,
         dropout=dropout,
         final_activation=final_activation,
+        n_members=n_members,
     )
+    if n_members is not None:
+        # loss and metrics are computed for each member of the ensemble separately
+        outputs = split_ensemble_outputs(outputs)
     model = Model(inputs=inputs, outputs=outputs)
 
     lr_schedule = tf.keras.optimizers.schedules.ExponentialDecay(
-        learning_rate,
+        learning_rate * learning_rate_scale,
         decay_steps=len(train_ds.batch(batch_size)),
         decay_rate=decay_rate,
         staircase=True,
@@ -182,10 +429,13 @@ def _build_mono_model_f(
 
     optimizer = AdamW(learning_rate=lr_schedule, weight_decay=weight_decay)
     model.compile(optimizer=optimizer, loss=loss, metrics=metrics)
+    # optimizer variables are created before the first step, otherwise creating them during the first
+    # step makes the train function to be traced twice
+    optimizer.build(model.trainable_variables)
 
     return model
 
-# %% ../nbs/Experiments.ipynb 18
+# %% ../nbs/Experiments.ipynb 34
 def _get_build_model_with_hp_f(
     build_model_f: Callable[[], Model],
     hp_params_f: Optional[Callable[[HyperParameters], Dict[str, Any]]] = None,
@@ -230,12 +480,161 @@ class TestHyperModel(HyperModel):
         self.kwargs = kwargs
 
     def build(self, hp: HyperParameters) -> Model:
+        kwargs = self.kwargs
+        batch_sizes = kwargs.get("batch_size")
+        if isinstance(batch_sizes, list):
+            batch_size = hp.Choice("batch_size", values=batch_sizes)
+            # learning rate is sampled for the smallest batch size and scaled by the square root of the
+            # ratio of batch sizes, the usual scaling rule for Adam-type optimizers
+            kwargs = {
+                **kwargs,
+                "batch_size": batch_size,
+                "learning_rate_scale": (batch_size / min(batch_sizes)) ** 0.5,
+            }
         build_model_with_hp_f = _get_build_model_with_hp_f(
-            _build_mono_model_f, **self.kwargs  # type: ignore
+            _build_mono_model_f, **kwargs  # type: ignore
         )
         return build_model_with_hp_f(hp)
 
-# %% ../nbs/Experiments.ipynb 20
+    def fit(
+        self,
+        hp: HyperParameters,
+        model: Model,
+        x: tf.data.Dataset,
+        *args: Any,
+        **kwargs: Any,
+    ) -> tf.keras.callbacks.History:
+        if isinstance(self.kwargs.get("batch_size"), list):
+            # data is batched here when the batch size is a hyperparameter of the trial
+            x = x.batch(hp.get("batch_size")).prefetch(2)
+        return model.fit(x, *args, **kwargs)
+
+# %% ../nbs/Experiments.ipynb 36
+@contextmanager
+def _set_environ(env: Dict[str, str]) -> Generator[None, None, None]:
+    old_env = {k: environ.get(k) for k in env}
+    environ.update(env)
+    try:
+        yield
+    finally:
+        for k, v in old_env.items():
+            if v is None:
+                del environ[k]
+            else:
+                environ[k] = v
+
+
+def _get_free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]  # type: ignore
+
+
+def _run_search_process(kwargs: Dict[str, Any]) -> None:
+    find_hyperparameters(**kwargs)
+
+
+def _run_parallel_search(
+    kwargs: Dict[str, Any], *, n_workers: int, threads_per_worker: Optional[int]
+) -> None:
+    if threads_per_worker is None:
+        threads_per_worker = max(1, (cpu_count() or 1) // n_workers)
+
+    port = str(_get_free_port())
+    # the chief process runs the oracle and serves trials to workers, it does no training
+    envs = [dict(KERASTUNER_TUNER_ID="chief", threads="1")] + [
+        dict(KERASTUNER_TUNER_ID=f"tuner{i}", threads=str(threads_per_worker))
+        for i in range(n_workers)
+    ]
+
+    # processes are spawned and not forked because TensorFlow runtime cannot be used after forking
+    ctx = multiprocessing.get_context("spawn")
+    processes = []
+    for env in envs:
+        threads = env.pop("threads")
+        env.update(
+            KERASTUNER_ORACLE_IP="127.0.0.1",
+            KERASTUNER_ORACLE_PORT=port,
+            # thread pools are created when TensorFlow is initialized, so limits must be set in the environment
+            TF_NUM_INTRAOP_THREADS=threads,
+            TF_NUM_INTEROP_THREADS=threads,
+            OMP_NUM_THREADS=threads,
+        )
+        with _set_environ(env):
+            process = ctx.Process(target=_run_search_process, args=(kwargs,))
+            process.start()
+        processes.append(process)
+
+    for process in processes:
+        process.join()
+
+    exit_codes = [process.exitcode for process in processes]
+    if any(exit_code != 0 for exit_code in exit_codes):
+        raise RuntimeError(f"Search processes failed with exit codes: {exit_codes}")
+
+# %% ../nbs/Experiments.ipynb 37
+def _create_tuner(
+    dataset_name: str,
+    *,
+    monotonicity_indicator: Dict[str, int],
+    final_activation: Union[str, Callable[[TensorLike, TensorLike], TensorLike]],
+    loss: Union[str, Callable[[TensorLike, TensorLike], TensorLike]],
+    metrics: Union[str, Callable[[TensorLike, TensorLike], TensorLike]],
+    hp_params_f: Optional[Callable[[HyperParameters], Dict[str, Any]]],
+    max_trials: int,
+    max_epochs: int,
+    batch_size: Union[int, List[int]],
+    objective: Union[str, Objective],
+    direction: str,
+    dir_root: Union[Path, str],
+    seed: int,
+    executions_per_trial: int,
+    max_consecutive_failed_trials: int,
+    data_path: Optional[Union[Path, str]],
+    algorithm: str,
+    hyperband_factor: int,
+    streaming: bool,
+    shuffle_buffer_size: int,
+) -> Tuple[Tuner, tf.data.Dataset, tf.data.Dataset]:
+    tf.keras.utils.set_random_seed(seed)
+
+    train_ds, test_ds = get_train_n_test_ds(
+        dataset_name,
+        data_path=data_path,
+        streaming=streaming,
+        shuffle_buffer_size=shuffle_buffer_size,
+    )
+
+    oracle = TestHyperModel(
+        monotonicity_indicator=monotonicity_indicator,
+        hp_params_f=hp_params_f,
+        final_activation=final_activation,
+        loss=loss,
+        metrics=metrics,
+        train_ds=train_ds,
+        batch_size=batch_size,
+    )
+
+    # tuners are not overwritten, so the state of a previous search in the same directory is reloaded
+    tuner_kwargs = dict(
+        objective=Objective(objective, direction),
+        seed=seed,
+        directory=Path(dir_root),
+        project_name=dataset_name,
+        executions_per_trial=executions_per_trial,
+        max_consecutive_failed_trials=max_consecutive_failed_trials,
+        overwrite=False,
+    )
+    if algorithm == "bayesian":
+        tuner = BayesianOptimization(oracle, max_trials=max_trials, **tuner_kwargs)
+    else:
+        tuner = Hyperband(
+            oracle, max_epochs=max_epochs, factor=hyperband_factor, **tuner_kwargs
+        )
+
+    return tuner, train_ds, test_ds
+
+
 def find_hyperparameters(
     dataset_name: str,
     *,
@@ -246,7 +645,7 @@ def find_hyperparameters(
     hp_params_f: Optional[Callable[[HyperParameters], Dict[str, Any]]] = None,
     max_trials: int = 100,
     max_epochs: int = 50,
-    batch_size: int = 8,
+    batch_size: Union[int, List[int]] = 8,
     objective: Union[str, Objective],
     direction: str,
     dir_root: Union[Path, str] = "tuner",
@@ -254,6 +653,13 @@ def find_hyperparameters(
     executions_per_trial: int = 3,
     max_consecutive_failed_trials: int = 5,
     patience: int = 10,
+    data_path: Optional[Union[Path, str]] = "./data",
+    n_workers: int = 1,
+    threads_per_worker: Optional[int] = None,
+    algorithm: str = "bayesian",
+    hyperband_factor: int = 3,
+    streaming: bool = False,
+    shuffle_buffer_size: int = 2**16,
 ) -> Tuner:
     """Search for optimal hyperparameters
 
@@ -265,7 +671,9 @@ def find_hyperparameters(
         hp_params_f: a function constructing sampling hyperparameters using Keras Tuner
         max_trials: maximum number of trials
         max_epochs: maximum number of epochs in each trial
-        batch_size: batch size
+        batch_size: batch size, or a list of batch sizes to be tuned as a hyperparameter. The learning rate is then
+            sampled for the smallest of the batch sizes and scaled by the square root of the ratio of the sampled
+            batch size and the smallest one. Use `measure_throughput` to choose candidates.
         objective: objective, typically f"val_{metrics}"
         direction: direction of the objective, either "min" or "max"
         dir_root: root directory for storing Keras Tuner data
@@ -273,41 +681,77 @@ def find_hyperparameters(
         executions_per_trial: number of executions per trial. Set it to number higher than zero for small datasets
         max_consecutive_failed_trials: maximum number of failed trials as used in Keras Tuner
         patience: number of epoch with worse objective before stopping trial early
+        data_path: root directory where to download data to
+        n_workers: number of worker processes evaluating trials concurrently. If larger than one, Keras Tuner
+            is run in the distributed mode on localhost with a chief process running the oracle. All arguments
+            must be picklable, e.g. **hp_params_f** must be defined at the module level.
+        threads_per_worker: number of threads used by TensorFlow in each of the worker processes, the default
+            is the number of CPUs divided by **n_workers**
+        algorithm: search algorithm, either "bayesian" for Bayesian optimization with each trial trained for up
+            to **max_epochs** epochs, or "hyperband" for Hyperband, which trains a large number of trials for a few
+            epochs and continues training only the most promising of them based on their objectives. Hyperband
+            does not use **max_trials**, the number of trials is determined by **max_epochs** and **hyperband_factor**.
+        hyperband_factor: reduction factor of the number of trials and increase factor of the number of epochs
+            in each round of Hyperband
+        streaming: if set to True, data is streamed from disk as described in `get_train_n_test_ds` instead of
+            being loaded into memory
+        shuffle_buffer_size: number of rows in the buffer used for shuffling streamed training data
 
     Returns:
         An instance of Keras Tuner
 
+    Raise:
+        ValueError: if **algorithm** is not one of "bayesian" or "hyperband"
+        RuntimeError: if any of the worker processes fails
     """
-    tf.keras.utils.set_random_seed(seed)
-
-    train_df, test_df = get_train_n_test_data(dataset_name)
-    train_ds, test_ds = df2ds(train_df), df2ds(test_df)
+    if algorithm not in ["bayesian", "hyperband"]:
+        raise ValueError(
+            f"Algorithm must be one of 'bayesian' or 'hyperband', but it is: '{algorithm}'"
+        )
 
-    oracle = TestHyperModel(
+    kwargs: Dict[str, Any] = dict(
+        dataset_name=dataset_name,
         monotonicity_indicator=monotonicity_indicator,
-        hp_params_f=hp_params_f,
         final_activation=final_activation,
         loss=loss,
         metrics=metrics,
-        train_ds=train_ds,
-        batch_size=batch_size,
-    )
-
-    tuner = BayesianOptimization(
-        oracle,
-        objective=Objective(objective, direction),
+        hp_params_f=hp_params_f,
         max_trials=max_trials,
+        max_epochs=max_epochs,
+        batch_size=batch_size,
+        objective=objective,
+        direction=direction,
+        dir_root=dir_root,
         seed=seed,
-        directory=Path(dir_root),
-        project_name=dataset_name,
         executions_per_trial=executions_per_trial,
         max_consecutive_failed_trials=max_consecutive_failed_trials,
+        data_path=data_path,
+        algorithm=algorithm,
+        hyperband_factor=hyperband_factor,
+        streaming=streaming,
+        shuffle_buffer_size=shuffle_buffer_size,
     )
 
+    if n_workers > 1:
+        _run_parallel_search(
+            dict(**kwargs, patience=patience),
+            n_workers=n_workers,
+            threads_per_worker=threads_per_worker,
+        )
+        # trials are run by the workers only, the tuner is created with the state of the search reloaded
+        # from disk and no search is run in this process
+        tuner, _, _ = _create_tuner(**kwargs)
+        return tuner
+
+    tuner, train_ds, test_ds = _create_tuner(**kwargs)
+
     stop_early = tf.keras.callbacks.EarlyStopping(monitor="val_loss", patience=patience)
 
+    # if batch size is tuned, data is batched in TestHyperModel.fit
     tuner.search(
-        train_ds.shuffle(len(train_ds)).batch(batch_size).prefetch(2),
+        train_ds
+        if isinstance(batch_size, list)
+        else train_ds.batch(batch_size).prefetch(2),
         validation_data=test_ds.batch(256),
         callbacks=[stop_early],
         epochs=max_epochs,
@@ -315,14 +759,20 @@ def find_hyperparameters(
 
     return tuner
 
-# %% ../nbs/Experiments.ipynb 22
+# %% ../nbs/Experiments.ipynb 55
 def _count_model_params(model: Model) -> int:
     return sum([sum([count_params(v) for v in l.variables]) for l in model.layers])
 
 
+def _get_member_metric_name(name: str, i: int) -> str:
+    # metrics of outputs created by split_ensemble_outputs are prefixed by the names of outputs
+    prefix = "val_" if name.startswith("val_") else ""
+    return f"{prefix}member_{i}_{name[len(prefix):]}"
+
+
 def _create_model_stats(
     tuner: Tuner,
-    hp: Dict[str, Any],
+    hp: HyperParameters,
     *,
     stats: Optional[pd.DataFrame] = None,
     max_epochs: int,
@@ -333,41 +783,66 @@ def _create_model_stats(
     verbose: int,
     train_ds: tf.data.Dataset,
     test_ds: tf.data.Dataset,
+    ensemble: bool = False,
+    seed: int = 42,
 ) -> pd.DataFrame:
-    tf.keras.utils.set_random_seed(42)
+    tf.keras.utils.set_random_seed(seed)
+
+    def best_objective(history: tf.keras.callbacks.History, name: str) -> float:
+        objective = history.history[name]
+        if tuner.oracle.objective.direction == "max":
+            return max(objective)  # type: ignore
+        else:
+            return min(objective)  # type: ignore
 
     def model_stats(
         tuner: Tuner = tuner,
-        hp: Dict[str, Any] = hp,
+        hp: HyperParameters = hp,
         max_epochs: int = max_epochs,
         batch_size: int = batch_size,
         patience: int = patience,
         verbose: int = verbose,
         train_ds: tf.data.Dataset = train_ds,
         test_ds: tf.data.Dataset = test_ds,
-    ) -> float:
-        model = tuner.hypermodel.build(hp)
+        n_members: Optional[int] = None,
+    ) -> List[float]:
+        # batch size is a hyperparameter if it was tuned
+        batch_size = hp.values.get("batch_size", batch_size)
+        if n_members is None:
+            model = tuner.hypermodel.build(hp)
+        else:
+            model = TestHyperModel(
+                **tuner.hypermodel.kwargs, n_members=n_members
+            ).build(hp)
+            train_ds, test_ds = [
+                ds.map(lambda x, y: (x, (y,) * n_members)) for ds in [train_ds, test_ds]
+            ]
+        # members of an ensemble are stopped together when the sum of their losses stops improving
         stop_early = tf.keras.callbacks.EarlyStopping(
             monitor="val_loss", patience=patience
         )
+        # train_ds is already shuffled in each epoch
         history = model.fit(
-            train_ds.shuffle(len(train_ds)).batch(batch_size).prefetch(2),
+            train_ds.batch(batch_size).prefetch(2),
             epochs=max_epochs,
             validation_data=test_ds.batch(256),
             verbose=verbose,
             callbacks=[stop_early],
         )
-        objective = history.history[tuner.oracle.objective.name]
-        if tuner.oracle.objective.direction == "max":
-            best_epoch = objective.index(max(objective))
-        else:
-            best_epoch = objective.index(min(objective))
-        return objective[best_epoch]  # type: ignore
+        name = tuner.oracle.objective.name
+        if n_members is None:
+            return [best_objective(history, name)]
+        return [
+            best_objective(history, _get_member_metric_name(name, i))
+            for i in range(n_members)
+        ]
 
-    xs = sorted(
-        [model_stats() for _ in range(num_runs)],
-        reverse=tuner.oracle.objective.direction == "max",
-    )
+    if ensemble:
+        # all runs are trained in lockstep as members of a single ensemble
+        xs = model_stats(n_members=num_runs)
+    else:
+        xs = sum([model_stats() for _ in range(num_runs)], [])
+    xs = sorted(xs, reverse=tuner.oracle.objective.direction == "max")
     stats = pd.Series(xs[:top_runs])
     stats = stats.describe()
     stats = {
@@ -376,12 +851,31 @@ def _create_model_stats(
     }
     model = tuner.hypermodel.build(hp)
     stats_df = pd.DataFrame(
-        dict(**hp.values, **stats, params=_count_model_params(model)),  # type: ignore
+        dict(**hp.values, **stats, params=_count_model_params(model)),
         index=[0],
     )
     return stats_df
 
-# %% ../nbs/Experiments.ipynb 23
+# %% ../nbs/Experiments.ipynb 57
+def _get_stats_key(**kwargs: Any) -> str:
+    # values which cannot be serialized into JSON, such as functions, are represented by their repr, which
+    # includes their address in memory, so results using them are never reused by other processes
+    s = json.dumps(kwargs, sort_keys=True, default=repr)
+    return hashlib.sha256(s.encode()).hexdigest()
+
+
+def _save_stats(stats: pd.DataFrame, path: Path) -> None:
+    path.parent.mkdir(exist_ok=True, parents=True)
+    # statistics are written into a temporary file first, so that interrupted runs never leave partially written files
+    with NamedTemporaryFile("w", dir=path.parent, suffix=".tmp", delete=False) as f:
+        stats.to_json(f, orient="records")
+    replace(f.name, path)
+
+
+def _load_stats(path: Path) -> pd.DataFrame:
+    return pd.read_json(path, orient="records", dtype=False)
+
+# %% ../nbs/Experiments.ipynb 59
 def create_tuner_stats(
     tuner: Tuner,
     *,
@@ -390,6 +884,12 @@ def create_tuner_stats(
     batch_size: int = 8,
     patience: int = 10,
     verbose: int = 0,
+    ensemble: bool = False,
+    data_path: Optional[Union[Path, str]] = "./data",
+    seed: int = 42,
+    use_cache: bool = True,
+    streaming: bool = False,
+    shuffle_buffer_size: int = 2**16,
 ) -> pd.DataFrame:
     """Calculates statistics for the best models found by Keras Tuner
 
@@ -397,32 +897,90 @@ def create_tuner_stats(
         tuner: an instance of Keras Tuner
         num_models: number of best models to use for calculating statistics
         max_epochs: maximum number of epochs used in runs
-        batch_size: batch_size
+        batch_size: batch_size, used only for models found without tuning the batch size
         patience: maximum number of epochs with worse objective before stopping trial early
         verbose: verbosity level of `Model.fit` function
+        ensemble: if set to True, all runs of a model are trained in a single fit as members of an ensemble
+            built from `EnsembleMonoDense` layers instead of training them one after the other. Members are
+            initialized independently, but they are trained on the same sequence of batches and stopped early
+            together.
+        data_path: root directory where to download data to
+        seed: random seed used to guarantee reproducibility of results
+        use_cache: if set to True, statistics of each of the models are stored in the `stats` subdirectory of
+            the project directory of the tuner as soon as they are computed and reused by later calls with the
+            same parameters and data, so that only statistics of models not computed before are computed
+        streaming: if set to True, data is streamed from disk as described in `get_train_n_test_ds` instead of
+            being loaded into memory
+        shuffle_buffer_size: number of rows in the buffer used for shuffling streamed training data
 
     Returns:
         A dataframe with statistics
     """
     stats = None
 
-    train_df, test_df = get_train_n_test_data(tuner.project_name)
-    train_ds, test_ds = df2ds(train_df), df2ds(test_df)
+    train_ds, test_ds = get_train_n_test_ds(
+        tuner.project_name,
+        data_path=data_path,
+        streaming=streaming,
+        shuffle_buffer_size=shuffle_buffer_size,
+    )
+
+    run_kwargs = dict(
+        max_epochs=max_epochs,
+        num_runs=10,
+        top_runs=5,
+        batch_size=batch_size,
+        patience=patience,
+        ensemble=ensemble,
+        seed=seed,
+    )
+    if use_cache:
+        checksums = [
+            _get_checksum(path)
+            for prefix in ["train", "test"]
+            for path in _get_data_files(
+                _get_data_path(data_path),
+                prefix,
+                tuner.project_name,
+                streaming=streaming,
+            )
+        ]
+        # the hyperparameters sampled by hp_params_f are already part of the key
+        hypermodel_kwargs = {
+            k: v
+            for k, v in getattr(tuner.hypermodel, "kwargs", {}).items()
+            if k not in ["train_ds", "hp_params_f"]
+        }
 
     for hp in tuner.get_best_hyperparameters(num_trials=num_models):
-        new_entry = _create_model_stats(
-            tuner,
-            hp,
-            stats=stats,
-            max_epochs=max_epochs,
-            num_runs=10,
-            top_runs=5,
-            batch_size=batch_size,
-            patience=patience,
-            verbose=verbose,
-            train_ds=train_ds,
-            test_ds=test_ds,
-        )
+        if use_cache:
+            key = _get_stats_key(
+                hp=hp.values,
+                hypermodel=hypermodel_kwargs,
+                checksums=checksums,
+                objective=tuner.oracle.objective.name,
+                direction=tuner.oracle.objective.direction,
+                # rows are shuffled differently when streamed
+                shuffle_buffer_size=shuffle_buffer_size if streaming else None,
+                **run_kwargs,
+            )
+            path = Path(tuner.project_dir) / "stats" / f"{key}.json"
+
+        if use_cache and path.exists():
+            new_entry = _load_stats(path)
+        else:
+            new_entry = _create_model_stats(
+                tuner,
+                hp,
+                stats=stats,
+                verbose=verbose,
+                train_ds=train_ds,
+                test_ds=test_ds,
+                **run_kwargs,  # type: ignore
+            )
+            if use_cache:
+                _save_stats(new_entry, path)
+
         if stats is None:
             stats = new_entry
         else:
@@ -435,3 +993,81 @@ def create_tuner_stats(
             pass
 
     return stats.sort_values(f"{tuner.oracle.objective.name}_mean")  # type: ignore
+
+# %% ../nbs/Experiments.ipynb 68
+def measure_throughput(
+    monotonicity_indicator: Dict[str, int],
+    *,
+    batch_sizes: Sequence[int] = (8, 16, 32, 64, 128, 256, 512, 1024),
+    units: int = 16,
+    n_layers: int = 2,
+    activation: Union[str, Callable[[TensorLike], TensorLike]] = "elu",
+    n_examples: int = 2**16,
+    n_repeats: int = 3,
+    seed: int = 42,
+) -> pd.DataFrame:
+    """Measures training throughput of models used in experiments for different batch sizes
+
+    Models are built in the same way as in `find_hyperparameters` and trained on random data of **n_examples**
+    rows, so the throughput depends only on the architecture of the model and on the machine. The training
+    function is traced before the time is measured and the fastest of **n_repeats** epochs is used.
+
+    Args:
+        monotonicity_indicator: monotonicity indicator as used in `MonoDense.__init__`
+        batch_sizes: batch sizes to be measured
+        units: number of units in hidden layers
+        n_layers: number of layers
+        activation: activation function of hidden layers
+        n_examples: number of examples in an epoch
+        n_repeats: number of measured epochs for each of the batch sizes
+        seed: random seed used to generate data and initialize models
+
+    Returns:
+        A dataframe with the number of examples processed per second for each of the batch sizes and the
+        speedup relative to the first of them
+    """
+    tf.keras.utils.set_random_seed(seed)
+    rng = np.random.default_rng(seed)
+    x = {
+        k: rng.normal(size=n_examples).astype("float32")
+        for k in monotonicity_indicator.keys()
+    }
+    y = rng.normal(size=n_examples).astype("float32")
+    train_ds = tf.data.Dataset.from_tensor_slices((x, y))
+
+    rows = []
+    for batch_size in batch_sizes:
+        model = _build_mono_model_f(
+            monotonicity_indicator=monotonicity_indicator,
+            final_activation=None,
+            loss="mse",
+            metrics="mse",
+            train_ds=train_ds,
+            batch_size=batch_size,
+            units=units,
+            n_layers=n_layers,
+            activation=activation,
+            learning_rate=1e-3,
+            weight_decay=0.1,
+            dropout=0.0,
+            decay_rate=1.0,
+        )
+        # batches are cached, so that the time of the input pipeline is not measured
+        batched_ds = train_ds.batch(batch_size).cache()
+        # the first call traces the training function
+        model.fit(batched_ds, epochs=1, verbose=0)
+        epoch_times = []
+        for _ in range(n_repeats):
+            t0 = perf_counter()
+            model.fit(batched_ds, epochs=1, verbose=0)
+            epoch_times.append(perf_counter() - t0)
+        rows.append(
+            dict(
+                batch_size=batch_size,
+                examples_per_second=n_examples / min(epoch_times),
+            )
+        )
+
+    df = pd.DataFrame(rows)
+    df["speedup"] = df["examples_per_second"] / df["examples_per_second"].iloc[0]
+    return df
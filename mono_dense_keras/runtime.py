@@ -0,0 +1,327 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/Runtime.ipynb.
+
+# %% auto 0
+__all__ = ['BUNDLE_FORMAT_VERSION', 'save_bundle', 'load_bundle', 'MonoModelRuntime']
+
+# %% ../nbs/Runtime.ipynb 4
+import json
+from pathlib import Path
+from typing import *
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+# %% ../nbs/Runtime.ipynb 7
+BUNDLE_FORMAT_VERSION = 1
+
+
+def save_bundle(
+    path: Union[Path, str], spec: Dict[str, Any], arrays: Dict[str, NDArray]
+) -> Path:
+    """Saves the model specification and weights into a bundle file
+
+    Args:
+        path: path to the bundle file, `.npz` suffix is appended if missing
+        spec: model specification
+        arrays: weights of the model referenced from the specification
+
+    Returns:
+        Path to the saved bundle
+    """
+    path = Path(path)
+    if path.suffix != ".npz":
+        path = path.with_suffix(path.suffix + ".npz")
+    path.parent.mkdir(exist_ok=True, parents=True)
+
+    spec = dict(format_version=BUNDLE_FORMAT_VERSION, **spec)
+    np.savez(path, spec=np.array(json.dumps(spec)), **arrays)
+
+    return path
+
+
+def load_bundle(path: Union[Path, str]) -> Tuple[Dict[str, Any], Dict[str, NDArray]]:
+    """Loads the model specification and weights from a bundle file
+
+    Args:
+        path: path to the bundle file
+
+    Returns:
+        A tuple of model specification and weights
+
+    Raise:
+        ValueError: if the bundle was saved in an unsupported format
+    """
+    with np.load(path, allow_pickle=False) as data:
+        spec = json.loads(str(data["spec"]))
+        arrays = {k: data[k] for k in data.files if k != "spec"}
+
+    if spec["format_version"] != BUNDLE_FORMAT_VERSION:
+        raise ValueError(f"Unsupported bundle format version: {spec['format_version']}")
+
+    return spec, arrays
+
+# %% ../nbs/Runtime.ipynb 10
+_SELU_ALPHA = 1.6732632423543772848170429916717
+_SELU_SCALE = 1.0507009873554804934193349852946
+
+
+def _elu_(x: NDArray, alpha: float = 1.0, scale: float = 1.0) -> NDArray:
+    neg = np.minimum(x, 0)
+    np.expm1(neg, out=neg)
+    neg *= alpha
+    np.maximum(x, 0, out=x)
+    x += neg
+    if scale != 1.0:
+        x *= scale
+    return x
+
+
+def _sigmoid_(x: NDArray) -> NDArray:
+    np.negative(x, out=x)
+    with np.errstate(over="ignore"):
+        np.exp(x, out=x)
+    x += 1
+    np.reciprocal(x, out=x)
+    return x
+
+
+def _tanh_(x: NDArray) -> NDArray:
+    np.tanh(x, out=x)
+    return x
+
+
+def _softplus_(x: NDArray) -> NDArray:
+    np.logaddexp(0, x, out=x)
+    return x
+
+
+def _softmax_(x: NDArray) -> NDArray:
+    x -= x.max(axis=-1, keepdims=True)
+    np.exp(x, out=x)
+    x /= x.sum(axis=-1, keepdims=True)
+    return x
+
+
+_ACTIVATIONS: Dict[str, Callable[[NDArray], NDArray]] = {
+    "linear": lambda x: x,
+    "relu": lambda x: np.maximum(x, 0, out=x),
+    "elu": _elu_,
+    "selu": lambda x: _elu_(x, alpha=_SELU_ALPHA, scale=_SELU_SCALE),
+    "sigmoid": _sigmoid_,
+    "tanh": _tanh_,
+    "softplus": _softplus_,
+    "softmax": _softmax_,
+}
+
+
+def _get_activation(name: str) -> Callable[[NDArray], NDArray]:
+    if name not in _ACTIVATIONS:
+        raise ValueError(
+            f"Unsupported activation '{name}', supported activations are: {sorted(_ACTIVATIONS.keys())}"
+        )
+    return _ACTIVATIONS[name]
+
+# %% ../nbs/Runtime.ipynb 12
+def _apply_mono_activations_(
+    h: NDArray,
+    *,
+    activation: Callable[[NDArray], NDArray],
+    activation_selector: Tuple[int, int, int],
+    saturation_constant: float,
+) -> NDArray:
+    s_convex, s_concave, s_saturated = activation_selector
+
+    # slices are views, all activations are applied in-place without splitting and concatenating;
+    # empty slices are skipped because activations such as softmax cannot be applied to them
+    if s_convex > 0:
+        activation(h[..., :s_convex])
+
+    if s_concave > 0:
+        h_concave = h[..., s_convex : s_convex + s_concave]
+        np.negative(h_concave, out=h_concave)
+        activation(h_concave)
+        np.negative(h_concave, out=h_concave)
+
+    # saturated activation is computed as -sign(h) * (rho(1 - |h|) - rho(1))
+    if s_saturated > 0:
+        h_saturated = h[..., s_convex + s_concave :]
+        sign = np.sign(h_saturated)
+        np.abs(h_saturated, out=h_saturated)
+        np.subtract(1.0, h_saturated, out=h_saturated)
+        activation(h_saturated)
+        h_saturated -= saturation_constant
+        np.negative(sign, out=sign)
+        h_saturated *= sign
+
+    return h
+
+# %% ../nbs/Runtime.ipynb 15
+class MonoModelRuntime:
+    """Evaluates models exported by `export_numpy_bundle` using NumPy only
+
+    Intermediate results are stored in buffers preallocated for the shape of the last batch, so
+    instances of this class are not thread-safe.
+    """
+
+    def __init__(self, spec: Dict[str, Any], arrays: Dict[str, NDArray]):
+        """Constructs a new MonoModelRuntime instance.
+
+        Args:
+            spec: model specification as returned by `load_bundle`
+            arrays: weights of the model as returned by `load_bundle`
+
+        Raise:
+            ValueError: if the specification contains unsupported nodes or activations
+        """
+        self.input_names: List[str] = spec["inputs"]
+        self.output_names: List[str] = spec["outputs"]
+        self.nodes: List[Dict[str, Any]] = spec["nodes"]
+
+        self._arrays = {k: v.astype(np.float32) for k, v in arrays.items()}
+        for node in self.nodes:
+            if node["type"] not in [
+                "input",
+                "dense",
+                "grouped_dense",
+                "concatenate",
+                "activation",
+                "identity",
+            ]:
+                raise ValueError(f"Unsupported node type '{node['type']}' in: {node}")
+            if "activation" in node:
+                _get_activation(node["activation"])
+
+        self._buffers: Dict[str, NDArray] = {}
+        self._batch_shape: Optional[Tuple[int, ...]] = None
+
+    @classmethod
+    def load(cls, path: Union[Path, str]) -> "MonoModelRuntime":
+        """Loads the runtime from a bundle file saved by `export_numpy_bundle`
+
+        Args:
+            path: path to the bundle file
+
+        Returns:
+            A new MonoModelRuntime instance
+        """
+        spec, arrays = load_bundle(path)
+        return cls(spec, arrays)
+
+    def _prepare_inputs(
+        self, batch: Union[ArrayLike, List[ArrayLike], Dict[str, ArrayLike]]
+    ) -> Dict[str, NDArray]:
+        if isinstance(batch, dict):
+            if set(batch.keys()) != set(self.input_names):
+                raise ValueError(f"{set(batch.keys())} != {set(self.input_names)}")
+            inputs = [batch[k] for k in self.input_names]
+        elif isinstance(batch, (list, tuple)) and len(self.input_names) > 1:
+            if len(batch) != len(self.input_names):
+                raise ValueError(f"{len(batch)} != {len(self.input_names)}")
+            inputs = list(batch)
+        else:
+            if len(self.input_names) != 1:
+                raise ValueError(
+                    f"Model has {len(self.input_names)} inputs: {self.input_names}"
+                )
+            inputs = [cast(ArrayLike, batch)]
+
+        xs = [np.asarray(x, dtype=np.float32) for x in inputs]
+        # scalar features can be passed as vectors
+        xs = [x.reshape((-1, 1)) if x.ndim == 1 else x for x in xs]
+
+        return dict(zip(self.input_names, xs))
+
+    def _allocate_buffers(self, values: Dict[str, NDArray]) -> None:
+        batch_shape = values[self.input_names[0]].shape[:-1]
+        if batch_shape == self._batch_shape:
+            return
+
+        shapes = {k: v.shape for k, v in values.items()}
+        self._buffers = {}
+        for node in self.nodes:
+            name = node["name"]
+            input_shapes = [shapes[k] for k in node.get("inputs", [])]
+            if node["type"] == "dense":
+                shapes[name] = batch_shape + (self._arrays[node["kernel"]].shape[-1],)
+            elif node["type"] == "grouped_dense":
+                n_groups, _, units = self._arrays[node["kernel"]].shape
+                shapes[name] = batch_shape + (n_groups * units,)
+            elif node["type"] == "concatenate":
+                shapes[name] = batch_shape + (sum(s[-1] for s in input_shapes),)
+            elif node["type"] in ["activation", "identity"]:
+                shapes[name] = input_shapes[0]
+            else:
+                continue
+            if node["type"] != "identity":
+                self._buffers[name] = np.empty(shapes[name], dtype=np.float32)
+        self._batch_shape = batch_shape
+
+    def predict(
+        self, batch: Union[ArrayLike, List[ArrayLike], Dict[str, ArrayLike]]
+    ) -> Union[NDArray, List[NDArray]]:
+        """Evaluates the model on a batch of inputs
+
+        Args:
+            batch: an array for models with a single input, or a list or a dictionary of arrays
+                for models with multiple inputs
+
+        Returns:
+            An array with outputs of the model or a list of arrays for models with multiple outputs
+        """
+        values = self._prepare_inputs(batch)
+        self._allocate_buffers(values)
+
+        for node in self.nodes:
+            name = node["name"]
+            node_type = node["type"]
+            if node_type == "input":
+                continue
+
+            xs = [values[k] for k in node["inputs"]]
+            if node_type == "identity":
+                values[name] = xs[0]
+                continue
+
+            out = self._buffers[name]
+            if node_type == "dense":
+                np.matmul(xs[0], self._arrays[node["kernel"]], out=out)
+                if "bias" in node:
+                    out += self._arrays[node["bias"]]
+                _apply_mono_activations_(
+                    out,
+                    activation=_get_activation(node["activation"]),
+                    activation_selector=node["activation_selector"],
+                    saturation_constant=node["saturation_constant"],
+                )
+            elif node_type == "grouped_dense":
+                kernel = self._arrays[node["kernel"]]
+                n_groups, _, units = kernel.shape
+                np.einsum(
+                    "...gi,giu->...gu",
+                    np.stack(xs, axis=-2),
+                    kernel,
+                    out=out.reshape(out.shape[:-1] + (n_groups, units)),
+                )
+                if "bias" in node:
+                    out += self._arrays[node["bias"]].reshape(-1)
+                activation = _get_activation(node["activation"])
+                for i, activation_selector in enumerate(node["activation_selectors"]):
+                    _apply_mono_activations_(
+                        out[..., i * units : (i + 1) * units],
+                        activation=activation,
+                        activation_selector=activation_selector,
+                        saturation_constant=node["saturation_constant"],
+                    )
+            elif node_type == "concatenate":
+                i = 0
+                for x in xs:
+                    out[..., i : i + x.shape[-1]] = x
+                    i += x.shape[-1]
+            elif node_type == "activation":
+                out[...] = xs[0]
+                _get_activation(node["activation"])(out)
+            values[name] = out
+
+        # outputs are copied because buffers are reused in the next call
+        ys = [values[k].copy() for k in self.output_names]
+        return ys[0] if len(ys) == 1 else ys